@@ -0,0 +1,57 @@
+"""Add trigram search indexes
+
+Revision ID: 3d8f0c2e71a4
+Revises: ecbf1ef88c2f
+Create Date: 2026-10-18 10:02:17.540917
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3d8f0c2e71a4'
+down_revision = 'ecbf1ef88c2f'
+branch_labels = None
+depends_on = None
+
+# The text columns searched by a substring (see `trigram_index`).
+COLUMNS = (
+    ('project', 'title'),
+    ('user', 'name'),
+    ('user', 'email'),
+)
+
+
+def upgrade():
+    # The `pg_trgm` is PostgreSQL-specific.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Build the indexes without locking the (possibly large) tables for writes.
+    # The `CONCURRENTLY` cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for table, column in COLUMNS:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column in COLUMNS:
+            op.drop_index(
+                f'ix_{table}_{column}_trgm',
+                table_name=table,
+                postgresql_concurrently=True,
+            )
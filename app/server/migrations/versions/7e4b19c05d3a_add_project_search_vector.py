@@ -0,0 +1,74 @@
+"""Add project search vector
+
+Revision ID: 7e4b19c05d3a
+Revises: 3d8f0c2e71a4
+Create Date: 2026-10-18 11:24:53.806140
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision = '7e4b19c05d3a'
+down_revision = '3d8f0c2e71a4'
+branch_labels = None
+depends_on = None
+
+# The weighted document of the `english` text search configuration, the
+# title matches rank higher than the description ones.
+POSTGRESQL_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+# The plain text searched by a substring elsewhere (e.g. SQLite).
+DOCUMENT = "coalesce(title, '') || ' ' || coalesce(description, '')"
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    # The generated column is computed for the existing rows too (rewrites the table).
+    # The other engines (e.g. SQLite) can't add a stored generated column to the
+    # existing table, so the document is computed on read there.
+    op.add_column(
+        'project',
+        sa.Column(
+            'search_vector',
+            TSVECTOR() if is_postgresql else sa.Text(),
+            sa.Computed(
+                POSTGRESQL_DOCUMENT if is_postgresql else DOCUMENT,
+                persisted=is_postgresql,
+            ),
+            nullable=False,
+        ),
+    )
+
+    # The GIN index is PostgreSQL-specific.
+    if not is_postgresql:
+        return
+
+    # Build the index without locking the (possibly large) table for writes.
+    # The `CONCURRENTLY` cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_project_search_vector',
+            'project',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                'ix_project_search_vector',
+                table_name='project',
+                postgresql_concurrently=True,
+            )
+
+    op.drop_column('project', 'search_vector')
@@ -0,0 +1,45 @@
+"""Add entity timestamps indexes
+
+Revision ID: ecbf1ef88c2f
+Revises: b36c9b299df1
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'ecbf1ef88c2f'
+down_revision = 'b36c9b299df1'
+branch_labels = None
+depends_on = None
+
+# The tables of the models that extend the `HasTimestamps`.
+TABLES = ('project', 'user')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade():
+    # Build the indexes without locking the (possibly large) tables for writes.
+    # The `CONCURRENTLY` cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            for column in COLUMNS:
+                op.create_index(
+                    f'ix_{table}_{column}',
+                    table,
+                    [column],
+                    unique=False,
+                    postgresql_concurrently=True,
+                )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            for column in COLUMNS:
+                op.drop_index(
+                    f'ix_{table}_{column}',
+                    table_name=table,
+                    postgresql_concurrently=True,
+                )
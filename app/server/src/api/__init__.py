@@ -8,8 +8,10 @@ from api.blueprints.db_commands import db_commands_bp
 from api.auth import login_manager
 from api.cache import cache
 from api.cognito import cognito
+from api.compression import compression
 from api.cors import cors
 from api.database import db, migrate
+from api.instrumentation import instrumentation
 from api.restful import restful
 from api.principal import principal
 
@@ -55,6 +57,8 @@ def create_app(test_config: dict | None = None) -> Flask:
     cognito.init_app(app)
     restful.init_app(app)
     principal.init_app(app)
+    compression.init_app(app)
+    instrumentation.init_app(app)
 
     # Ensure the app will trust the proxy headers.
     app.wsgi_app = ProxyFix(  # type: ignore[method-assign]
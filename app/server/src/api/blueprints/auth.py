@@ -1,4 +1,3 @@
-import json
 import time
 from typing import Callable
 from urllib.parse import quote
@@ -24,6 +23,7 @@ from api.cognito.user import (
 )
 from api.models.user import User
 from api.principal import principal_identity_changed, get_actions, Role
+from api.utils.json_encoder import dumps
 
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
@@ -45,7 +45,7 @@ def process_user_info(response: Response, fresh: bool = True) -> None:
 
     response.set_cookie(
         key=current_app.config["SESSION_COOKIE_NAME_AUTH"],
-        value=quote(json.dumps(cookie_auth, separators=(",", ":"))),
+        value=quote(dumps(cookie_auth)),
         max_age=current_app.config["AWS_COGNITO_COOKIE_AGE_SECONDS"],
         samesite=current_app.config["SESSION_COOKIE_SAMESITE"],
         secure=current_app.config["SESSION_COOKIE_SECURE"],
@@ -1,12 +1,35 @@
+from time import perf_counter
+
+import click
 from flask import Blueprint
 
+from api.database import db
+from api.database.seeder import Seeder
+
 
 db_commands_bp = Blueprint("db-seeder", __name__)
 
 
 @db_commands_bp.cli.command("seed")
-def seed_database() -> None:
-    pass
+@click.option("--users", type=click.IntRange(min=0), default=0, help="The users to generate.")
+@click.option("--projects", type=click.IntRange(min=0), default=0, help="The projects to generate.")
+@click.option("--batch", type=click.IntRange(min=1), default=10_000, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True, help="The seed of the data.")
+def seed_database(users: int, projects: int, batch: int, seed: int) -> None:
+    """
+    Generates the realistic volumes of the users and projects, e.g.
+    `flask db-seeder seed --users 50000 --projects 2000000 --batch 10000`.
+    """
+    started = perf_counter()
+
+    try:
+        Seeder(seed=seed, batch=batch).populate(users=users, projects=projects)
+    except ValueError as error:
+        db.session.rollback()
+        raise click.ClickException(str(error)) from error
+
+    db.session.commit()
+    click.echo(f"Seeded {users} users and {projects} projects in {perf_counter() - started:.1f}s")
 
 
 __all__ = [
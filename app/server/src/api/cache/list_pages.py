@@ -0,0 +1,93 @@
+from collections import Counter
+from hashlib import blake2b
+from time import time_ns
+from typing import Any, Collection
+
+from flask import request
+from flask_login import current_user
+
+from . import cache
+
+
+stats: Counter[str] = Counter()
+"""The `hits` and `misses` of the list page lookups made by this process."""
+
+
+def page_key(model: type[Any], models: Collection[type[Any]]) -> str:
+    """
+    Builds the cache key of the requested list page.
+
+    The key covers the role of the current user, the query arguments (in
+    any order) and the generations of the `models`, so a write to any of
+    them (see `bump_generation`) makes the pages cached before unreachable.
+
+    :param model: The model of the list.
+    :param models: The models the page is serialized from (see `schema_models`).
+    :return: The cache key.
+    """
+    state = (
+        getattr(current_user, "role", None),
+        sorted(request.args.items(multi=True)),
+        _get_generations(sorted(models, key=lambda item: item.__name__)),
+    )
+
+    return f"list:{model.__name__}:{blake2b(repr(state).encode(), digest_size=16).hexdigest()}"
+
+
+def get_page(key: str) -> Any | None:
+    """
+    :param key: The key built by the `page_key`.
+    :return: The cached page or `None`.
+    """
+    page = cache.get(key)
+    stats["misses" if page is None else "hits"] += 1
+
+    return page
+
+
+def set_page(key: str, page: Any, timeout: int) -> None:
+    """
+    :param key: The key built by the `page_key`.
+    :param page: The page to cache.
+    :param timeout: The number of seconds to keep the page for (`0` is forever).
+    """
+    cache.set(key, page, timeout=timeout)
+
+
+def bump_generation(model: type[Any]) -> None:
+    """
+    Invalidates the cached list pages that contain the entities of the model.
+
+    Must be called after the write is committed, so a page read before the
+    commit is never cached under the new generation.
+
+    :param model: The model the write has changed.
+    """
+    cache.set(_generation_key(model), time_ns(), timeout=0)
+
+
+def _get_generations(models: list[type[Any]]) -> list[int | None]:
+    keys = [_generation_key(model) for model in models]
+    generations: list[int | None] = cache.get_many(*keys)  # type: ignore[no-untyped-call]
+
+    for index, generation in enumerate(generations):
+        if generation is None:
+            # The generation that is missing (never set or evicted) starts from the new
+            # unique value, so the pages of the previous generations can't be served.
+            cache.add(keys[index], time_ns(), timeout=0)
+            generations[index] = cache.get(keys[index])
+
+    return generations
+
+
+def _generation_key(model: type[Any]) -> str:
+    return f"generation:{model.__name__}"
+
+
+__all__ = [
+    "bump_generation",
+    "get_page",
+    "page_key",
+    "set_page",
+    "stats",
+]
@@ -0,0 +1,46 @@
+from flask import Flask
+
+from .encoders import get_encoders, negotiate
+from .middleware import COMPRESSIBLE_TYPES, CompressionMiddleware
+
+
+class Compression:  # pylint: disable=locally-disabled, too-few-public-methods
+    """
+    Compresses the responses of the app by the `CompressionMiddleware`.
+
+    Configuration:
+        - `COMPRESSION_ENABLED`: the state of whether to compress (`True` by default);
+        - `COMPRESSION_MIN_SIZE`: the size in bytes of the smallest response
+          to compress (`500` by default, the streamed responses are always
+          compressed);
+        - `COMPRESSION_LEVEL`: the compression level (`6` by default).
+
+    The `gzip` is always available, the `br` and `zstd` are negotiated when
+    the `brotli` and `zstandard` packages are installed.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        app.config.setdefault("COMPRESSION_ENABLED", True)
+        app.config.setdefault("COMPRESSION_MIN_SIZE", 500)
+        app.config.setdefault("COMPRESSION_LEVEL", 6)
+
+        if app.config["COMPRESSION_ENABLED"]:
+            app.wsgi_app = CompressionMiddleware(  # type: ignore[method-assign]
+                app.wsgi_app,
+                encoders=get_encoders(),
+                minimum_size=app.config["COMPRESSION_MIN_SIZE"],
+                level=app.config["COMPRESSION_LEVEL"],
+            )
+
+
+compression = Compression()
+
+
+__all__ = [
+    "COMPRESSIBLE_TYPES",
+    "Compression",
+    "CompressionMiddleware",
+    "compression",
+    "get_encoders",
+    "negotiate",
+]
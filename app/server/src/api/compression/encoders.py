@@ -0,0 +1,168 @@
+import zlib
+from importlib import import_module
+from types import ModuleType
+from typing import Callable, Mapping, Protocol
+
+
+def _import_optional(name: str) -> ModuleType | None:
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+brotli = _import_optional("brotli")
+"""The `br` encoder or `None` when it's not installed."""
+
+zstandard = _import_optional("zstandard")
+"""The `zstd` encoder or `None` when it's not installed."""
+
+
+class Encoder(Protocol):
+    """
+    The incremental encoder of a response body.
+    """
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        :param data: The next chunk of the body.
+        :return: The compressed data that is ready (might be empty).
+        """
+
+    def flush(self) -> bytes:
+        """
+        :return: The compressed data of all chunks passed so far, so the
+         client can decode them before the stream ends.
+        """
+
+    def finish(self) -> bytes:
+        """
+        :return: The rest of the compressed data.
+        """
+
+
+class GzipEncoder:
+    """
+    The `gzip` encoder.
+    """
+
+    def __init__(self, level: int) -> None:
+        # The `16 + MAX_WBITS` produces the gzip header and trailer.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """
+    The `br` encoder (requires the `brotli` package).
+    """
+
+    def __init__(self, level: int) -> None:
+        assert brotli is not None
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+class ZstdEncoder:
+    """
+    The `zstd` encoder (requires the `zstandard` package).
+    """
+
+    def __init__(self, level: int) -> None:
+        assert zstandard is not None
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        assert zstandard is not None
+        return bytes(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+
+def get_encoders() -> Mapping[str, Callable[[int], Encoder]]:
+    """
+    :return: The encoders that are available by the `Content-Encoding`,
+     in the order of preference.
+    """
+    encoders: dict[str, Callable[[int], Encoder]] = {}
+
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+
+    encoders["gzip"] = GzipEncoder
+
+    return encoders
+
+
+def negotiate(accept_encoding: str, encodings: Mapping[str, object]) -> str | None:
+    """
+    Chooses the encoding by the `Accept-Encoding` request header.
+
+    The highest `q` wins, the ties are resolved by the order of `encodings`,
+    the `*` stands for the encodings that aren't listed and `q=0` excludes
+    the encoding.
+
+    Example:
+        >>> # Returns `"gzip"`.
+        >>> negotiate("gzip;q=1, br;q=0.5", {"br": ..., "gzip": ...})
+
+    :param accept_encoding: The value of the `Accept-Encoding` header.
+    :param encodings: The supported encodings in the order of preference.
+    :return: The chosen encoding or `None` for the identity.
+    """
+    weights: dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        weight = 1.0
+
+        for param in params:
+            key, _, value = param.partition("=")
+
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+
+        if name:
+            weights[name.lower()] = weight
+
+    default = weights.get("*", 0.0)
+    candidates = [
+        (weights.get(encoding, default), -index, encoding)
+        for index, encoding in enumerate(encodings)
+    ]
+    weight, _, encoding = max(candidates, default=(0.0, 0, ""))
+
+    return encoding if weight > 0 else None
+
+
+__all__ = [
+    "Encoder",
+    "get_encoders",
+    "negotiate",
+]
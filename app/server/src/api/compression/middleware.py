@@ -0,0 +1,188 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping
+
+from .encoders import Encoder, negotiate
+
+if TYPE_CHECKING:
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "+json",
+    "+xml",
+)
+"""
+The prefixes and suffixes of the media types to compress. Anything else
+(e.g. the uploaded PDFs and images) is either compressed already or not
+worth the CPU.
+"""
+
+
+class CompressionMiddleware:  # pylint: disable=locally-disabled, too-few-public-methods
+    """
+    The WSGI middleware that compresses the responses by the encoding the
+    client accepts (see `negotiate`).
+
+    The response is compressed when it's successful, its media type is one
+    of the `COMPRESSIBLE_TYPES`, it isn't encoded already and either its
+    `Content-Length` is at least the `minimum_size` or it's streamed (has no
+    `Content-Length`). The streamed responses are compressed chunk by chunk
+    and every chunk is flushed, so the client receives the data as it's
+    produced rather than at the end.
+    """
+
+    def __init__(
+        self,
+        app: "WSGIApplication",
+        encoders: Mapping[str, Callable[[int], Encoder]],
+        minimum_size: int,
+        level: int,
+    ) -> None:
+        """
+        :param app: The WSGI application to wrap.
+        :param encoders: The encoders by the `Content-Encoding`, in the order of preference.
+        :param minimum_size: The size in bytes of the smallest response to compress.
+        :param level: The compression level.
+        """
+        self.app = app
+        self.encoders = encoders
+        self.minimum_size = minimum_size
+        self.level = level
+
+    def __call__(
+        self,
+        environ: "WSGIEnvironment",
+        start_response: "StartResponse",
+    ) -> Iterable[bytes]:
+        encoding = negotiate(environ.get("HTTP_ACCEPT_ENCODING", ""), self.encoders)
+
+        if encoding is None or environ["REQUEST_METHOD"] == "HEAD":
+            return self.app(environ, start_response)
+
+        # The encoder of the response and whether it's streamed, once started.
+        compressing: list[tuple[Encoder, bool]] = []
+
+        def start_compressed_response(
+            status: str,
+            headers: list[tuple[str, str]],
+            exc_info: Any = None,
+        ) -> Callable[[bytes], object]:
+            content_length = self._get_compressible_length(status, headers)
+
+            if content_length is None:
+                return start_response(status, headers, exc_info)
+
+            encoder = self.encoders[encoding](self.level)
+            compressing.append((encoder, content_length < 0))
+            write = start_response(
+                status,
+                self._get_compressed_headers(headers, encoding),
+                exc_info,
+            )
+
+            # The legacy `write` of the apps that don't return the body.
+            return lambda data: write(encoder.compress(data) + encoder.flush())
+
+        body = self.app(environ, start_compressed_response)
+
+        # The `start_response` is called before the body is returned by the
+        # apps that return the iterable (e.g. the Flask apps).
+        if not compressing:
+            return body
+
+        return _CompressedBody(body, *compressing[0])
+
+    def _get_compressible_length(self, status: str, headers: list[tuple[str, str]]) -> int | None:
+        """
+        :return: The `Content-Length` of the response to compress (`-1` for the
+         streamed one) or `None` when the response must be passed as is.
+        """
+        code = int(status.split(" ", 1)[0])
+        values = {name.lower(): value for name, value in headers}
+        content_type = values.get("content-type", "").split(";", 1)[0].strip().lower()
+
+        if (
+            not 200 <= code < 300
+            or code in (204, 206)
+            or "content-encoding" in values
+            or "no-transform" in values.get("cache-control", "").lower()
+            or not any(
+                content_type.startswith(item) or content_type.endswith(item)
+                for item in COMPRESSIBLE_TYPES
+            )
+        ):
+            return None
+
+        if "content-length" not in values:
+            return -1
+
+        content_length = int(values["content-length"])
+
+        return content_length if content_length >= self.minimum_size else None
+
+    @staticmethod
+    def _get_compressed_headers(
+        headers: list[tuple[str, str]],
+        encoding: str,
+    ) -> list[tuple[str, str]]:
+        compressed = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in ("content-length", "vary", "etag")
+        ]
+        vary = [value for name, value in headers if name.lower() == "vary"]
+        compressed.append(("Content-Encoding", encoding))
+        compressed.append(("Vary", ", ".join([*vary, "Accept-Encoding"])))
+
+        for name, value in headers:
+            # The compressed representation isn't byte-for-byte identical,
+            # so its entity tag is weak (see RFC 9110, section 8.8.1).
+            if name.lower() == "etag":
+                compressed.append((name, value if value.startswith("W/") else f"W/{value}"))
+
+        return compressed
+
+
+class _CompressedBody:
+    """
+    The compressed iterable of the response body.
+    """
+
+    def __init__(self, body: Iterable[bytes], encoder: Encoder, streamed: bool) -> None:
+        self.body = body
+        self.encoder = encoder
+        self.streamed = streamed
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.body:
+            data = self.encoder.compress(chunk)
+
+            if self.streamed:
+                data += self.encoder.flush()
+
+            if data:
+                yield data
+
+        yield self.encoder.finish()
+
+    def close(self) -> None:
+        """
+        Releases the resources of the body (e.g. the request context of the
+        streamed response), the WSGI server calls it even if the iteration
+        hasn't started.
+        """
+        close = getattr(self.body, "close", None)
+
+        if close is not None:
+            close()
+
+
+__all__ = [
+    "COMPRESSIBLE_TYPES",
+    "CompressionMiddleware",
+]
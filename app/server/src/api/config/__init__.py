@@ -51,6 +51,14 @@ class Config:
     CACHE_TYPE = "flask_caching.backends.FileSystemCache"
     CACHE_DIR = f"{PERMANENT_STORAGE}/cache"
 
+    # Response compression configuration (see `api.compression.Compression`).
+    COMPRESSION_ENABLED = True
+    COMPRESSION_MIN_SIZE = 500
+    COMPRESSION_LEVEL = 6
+
+    # Request phases instrumentation (see `api.instrumentation.Instrumentation`).
+    SERVER_TIMING_ENABLED = bool(environ.get("SERVER_TIMING_ENABLED"))
+
     # Database connection.
     # Fix deprecated engine name @see https://github.com/sqlalchemy/sqlalchemy/issues/6083
     DATABASE_ENGINE = environ.get("DATABASE_ENGINE", "").replace("postgres", "postgresql")
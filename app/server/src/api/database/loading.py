@@ -0,0 +1,140 @@
+from typing import Any
+
+from marshmallow import Schema, fields
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+
+_MAX_DEPTH = 3
+"""The number of nested schemas to follow (guards from the recursive schemas)."""
+
+_loader_options: dict[tuple[type[Any], Schema], tuple[_AbstractLoad, ...]] = {}
+_models: dict[tuple[type[Any], Schema], frozenset[type[Any]]] = {}
+
+
+def schema_loader_options(model: type[Any], schema: Schema) -> tuple[_AbstractLoad, ...]:
+    """
+    Builds the loading options that fetch exactly what the schema
+    serializes:
+      - only the columns the schema dumps are loaded (e.g. the `Text`
+        columns missing in a list item schema are skipped);
+      - the relationships are eager loaded, so dumping a list of entities
+        doesn't issue a query per entity and relationship (the N+1 problem).
+
+    The many-to-one relationships (e.g. `HasAuthor.author`) are loaded
+    by the `LEFT OUTER JOIN` and the collections by the separate
+    `SELECT ... WHERE id IN (...)`. The nested schemas are followed
+    the same way.
+
+    The fields that are neither columns nor relationships (e.g. computed
+    properties) have to list the columns they read in the `columns`
+    metadata, otherwise all columns of the model are loaded:
+
+        >>> is_active = fields.Boolean(dump_only=True, metadata={"columns": ("status",)})
+
+    Example:
+        >>> Project.query.options(*schema_loader_options(Project, ProjectListSchema()))
+
+    :param model: The model class.
+    :param schema: The schema that serializes the model instances.
+    :return: The loader options for the `Query.options()`.
+    """
+    key = (model, schema)
+
+    if key not in _loader_options:
+        _loader_options[key] = tuple(_get_loaders(model, schema, _MAX_DEPTH))
+
+    return _loader_options[key]
+
+
+def schema_models(model: type[Any], schema: Schema) -> frozenset[type[Any]]:
+    """
+    Example:
+        >>> # The `Project` and the `User` (the `author`).
+        >>> schema_models(Project, ProjectListSchema())
+
+    :param model: The model class.
+    :param schema: The schema that serializes the model instances.
+    :return: The model and the models of the relationships the schema
+     serializes (e.g. to invalidate the serialized data when any of them changes).
+    """
+    key = (model, schema)
+
+    if key not in _models:
+        _models[key] = frozenset(_get_models(model, schema, _MAX_DEPTH))
+
+    return _models[key]
+
+
+def _get_loaders(model: type[Any], schema: Schema, depth: int) -> list[_AbstractLoad]:
+    relationships = inspect(model).relationships
+    columns = _get_columns(model, schema)
+    loaders: list[_AbstractLoad] = [load_only(*columns)] if columns else []
+
+    for name, field in schema.dump_fields.items():
+        nested = _get_nested_schema(field)
+        relationship = relationships.get(field.attribute or name)
+
+        if nested is None or relationship is None:
+            continue
+
+        attribute = getattr(model, relationship.key)
+        loader = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        children = _get_loaders(relationship.mapper.class_, nested, depth - 1) if depth > 1 else []
+        loaders.append(loader.options(*children) if children else loader)
+
+    return loaders
+
+
+def _get_models(model: type[Any], schema: Schema, depth: int) -> set[type[Any]]:
+    relationships = inspect(model).relationships
+    models = {model}
+
+    for name, field in schema.dump_fields.items():
+        nested = _get_nested_schema(field)
+        relationship = relationships.get(field.attribute or name)
+
+        if nested is None or relationship is None:
+            continue
+
+        if depth > 1:
+            models |= _get_models(relationship.mapper.class_, nested, depth - 1)
+        else:
+            models.add(relationship.mapper.class_)
+
+    return models
+
+
+def _get_columns(model: type[Any], schema: Schema) -> list[Any] | None:
+    mapper = inspect(model)
+    keys: set[str] = set()
+
+    for name, field in schema.dump_fields.items():
+        key = field.attribute or name
+
+        keys.update(field.metadata.get("columns", ()))
+
+        if key in mapper.column_attrs:
+            keys.add(key)
+        elif key not in mapper.relationships and "columns" not in field.metadata:
+            # The field reads something unknown, prefer the extra columns over the query per row.
+            return None
+
+    return [getattr(model, key) for key in sorted(keys)]
+
+
+def _get_nested_schema(field: fields.Field) -> Schema | None:
+    if isinstance(field, fields.List):
+        field = field.inner
+
+    if isinstance(field, fields.Nested) and isinstance(field.schema, Schema):
+        return field.schema
+
+    return None
+
+
+__all__ = [
+    "schema_loader_options",
+    "schema_models",
+]
@@ -0,0 +1,172 @@
+from typing import Any
+
+from sqlalchemy import Boolean, Float, Index, Text, bindparam, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+
+SEARCH_CONFIG = "english"
+"""The PostgreSQL text search configuration (the language of the documents)."""
+
+_WEIGHTS = "ABCD"
+
+SearchVector = TSVECTOR().with_variant(Text(), "sqlite")
+"""
+The type of the search document column. The `tsvector` on PostgreSQL and
+the plain text on SQLite (e.g. in tests).
+"""
+
+
+# The SQL constructs are named like the SQL functions (e.g. `func.coalesce`).
+# pylint: disable=invalid-name, too-few-public-methods
+class search_document(FunctionElement[Any]):
+    """
+    The expression of the generated search document column.
+
+    The columns are weighted by their position (`A` is the first one,
+    `D` is the fourth and the rest), so the matches in the leading ones
+    rank higher.
+
+    Example:
+        >>> class Lab(EntityMixin):
+        >>>     search_vector: Mapped[str] = db.mapped_column(
+        >>>         SearchVector,
+        >>>         Computed(search_document("title", "description"), persisted=True),
+        >>>         deferred=True,
+        >>>     )
+
+    Compiles to:
+        - PostgreSQL: `setweight(to_tsvector('english', coalesce(title, '')), 'A') || ...`;
+        - others: `coalesce(title, '') || ' ' || coalesce(description, '')`.
+    """
+
+    type = Text()
+    inherit_cache = True
+
+    def __init__(self, *columns: str) -> None:
+        super().__init__(*map(literal_column, columns))
+
+
+class search_match(FunctionElement[Any]):
+    """
+    The condition matching the search document against the web search
+    style query (e.g. `"exact phrase" word -excluded or other`).
+
+    Compiles to:
+        - PostgreSQL: `search_vector @@ websearch_to_tsquery('english', :query)`;
+        - others: the case-insensitive substring search.
+    """
+
+    type = Boolean()
+    inherit_cache = True
+
+    def __init__(self, column: Any, query: str) -> None:
+        super().__init__(column, bindparam(None, query, Text()))
+
+
+class search_rank(FunctionElement[Any]):
+    """
+    The relevance of the search document to the query, the greater is
+    the more relevant.
+
+    Compiles to:
+        - PostgreSQL: the `ts_rank` (as `double precision` to round trip through
+          the cursor exactly);
+        - others: `0` (the matches are equally relevant).
+    """
+
+    type = Float()
+    inherit_cache = True
+
+    def __init__(self, column: Any, query: str) -> None:
+        super().__init__(column, bindparam(None, query, Text()))
+
+
+# pylint: enable=invalid-name, too-few-public-methods
+
+
+def search_index(table: str, column: str = "search_vector") -> Index:
+    """
+    Defines the GIN index of the search document column.
+
+    The index is created only on PostgreSQL (see `trigram_index`).
+
+    :param table: The name of the table.
+    :param column: The name of the search document column.
+    :return: The index definition.
+    """
+    return Index(
+        f"ix_{table}_{column}",
+        column,
+        postgresql_using="gin",
+    ).ddl_if(dialect="postgresql")
+
+
+def _clauses(element: FunctionElement[Any], compiler: SQLCompiler, **kwargs: Any) -> list[str]:
+    return [compiler.process(clause, **kwargs) for clause in element.clauses]
+
+
+@compiles(search_document)
+def _compile_search_document(element: search_document, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return " || ' ' || ".join(
+        f"coalesce({column}, '')" for column in _clauses(element, compiler, **kwargs)
+    )
+
+
+@compiles(search_document, "postgresql")
+def _compile_search_document_postgresql(
+    element: search_document,
+    compiler: SQLCompiler,
+    **kwargs: Any,
+) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), "
+        f"'{_WEIGHTS[min(index, len(_WEIGHTS) - 1)]}')"
+        for index, column in enumerate(_clauses(element, compiler, **kwargs))
+    )
+
+
+@compiles(search_match)
+def _compile_search_match(element: search_match, compiler: SQLCompiler, **kwargs: Any) -> str:
+    column, query = _clauses(element, compiler, **kwargs)
+    return f"instr(lower({column}), lower({query})) > 0"
+
+
+@compiles(search_match, "postgresql")
+def _compile_search_match_postgresql(
+    element: search_match,
+    compiler: SQLCompiler,
+    **kwargs: Any,
+) -> str:
+    column, query = _clauses(element, compiler, **kwargs)
+    return f"{column} @@ websearch_to_tsquery('{SEARCH_CONFIG}', {query})"
+
+
+@compiles(search_rank)
+def _compile_search_rank(_element: search_rank, _compiler: SQLCompiler, **_kwargs: Any) -> str:
+    return "CAST(0 AS REAL)"
+
+
+@compiles(search_rank, "postgresql")
+def _compile_search_rank_postgresql(
+    element: search_rank,
+    compiler: SQLCompiler,
+    **kwargs: Any,
+) -> str:
+    column, query = _clauses(element, compiler, **kwargs)
+    return (
+        f"CAST(ts_rank({column}, websearch_to_tsquery('{SEARCH_CONFIG}', {query})) "
+        "AS DOUBLE PRECISION)"
+    )
+
+
+__all__ = [
+    "SEARCH_CONFIG",
+    "SearchVector",
+    "search_document",
+    "search_index",
+    "search_match",
+    "search_rank",
+]
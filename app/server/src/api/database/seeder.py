@@ -0,0 +1,235 @@
+import csv
+from bisect import bisect
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from io import StringIO
+from itertools import accumulate, islice
+from math import sqrt
+from random import Random
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy import Table, insert, select, text
+
+from api.database import db
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+
+ROLE_WEIGHTS = {
+    Role.AUTHENTICATED: 80,
+    Role.SCIENTIST: 18,
+    Role.ADMIN: 2,
+}
+"""The share of the users by the role."""
+
+USER_STATUS_WEIGHTS = {
+    UserStatus.ACTIVE: 95,
+    UserStatus.BLOCKED: 5,
+}
+"""The share of the users by the status."""
+
+PROJECT_STATUS_WEIGHTS = {
+    ProjectStatus.DRAFT: 30,
+    ProjectStatus.COMPLETED: 55,
+    ProjectStatus.ARCHIVED: 15,
+}
+"""The share of the projects by the status."""
+
+UNTIL = datetime(2025, 1, 1)
+"""
+The timestamps are spread over the `PERIOD` before the date, which is fixed
+so the same seed produces the same data on any day.
+"""
+
+PERIOD = timedelta(days=3 * 365)
+
+_FIRST_NAMES = (
+    "Alex", "Anna", "Ben", "Chen", "Clara", "David", "Elena", "Farid", "Grace", "Hana",
+    "Ivan", "Jon", "Julia", "Kenji", "Laura", "Maria", "Mohamed", "Nina", "Omar", "Priya",
+    "Rob", "Sara", "Tom", "Wei", "Yusuf",
+)  # fmt: skip
+_LAST_NAMES = (
+    "Anderson", "Brown", "Chen", "Doe", "Garcia", "Ivanova", "Jensen", "Kim", "Kowalski",
+    "Lee", "Martin", "Müller", "Nguyen", "Okafor", "Patel", "Rossi", "Sato", "Silva",
+    "Smith", "Wang",
+)  # fmt: skip
+_SYLLABLES = ("ka", "lo", "mi", "ne", "po", "ru", "sa", "ti", "vu", "xe", "yo", "zi")
+
+WORDS = tuple(f"{a}{b}{c}" for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES)
+"""
+The vocabulary of the titles and descriptions, its word frequencies follow
+the Zipf's law (`WORDS[0]` is the most frequent), like in a natural language.
+"""
+
+_WORD_WEIGHTS = tuple(accumulate(1 / rank for rank in range(1, len(WORDS) + 1)))
+
+
+@dataclass
+class Seeder:
+    """
+    Generates the users and projects deterministically from the `seed` and
+    loads them by the Postgres `COPY` (the batched `INSERT` elsewhere, e.g.
+    on SQLite).
+
+    The users have every `Role` and `UserStatus` (see the weights), the
+    projects have every `ProjectStatus` and the authors of the projects
+    are skewed: a few users author the most of them.
+
+    Example:
+        >>> Seeder(seed=1, batch=10_000).populate(users=50_000, projects=2_000_000)
+    """
+
+    seed: int = 0
+    """The seed of the generated data."""
+
+    batch: int = 10_000
+    """The number of the rows loaded at once."""
+
+    random: Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.batch < 1:
+            raise ValueError("The batch must be positive")
+
+        self.random = Random(self.seed)
+
+    def populate(self, users: int, projects: int) -> None:
+        """
+        Generates and loads the data (within the current transaction).
+
+        :param users: The number of the users to generate.
+        :param projects: The number of the projects to generate. They are
+         authored by the generated users or, if there are none, by the
+         existing ones.
+        :raise ValueError: When the users of the seed already exist.
+        """
+        email_prefix = f"seed{self.seed}."
+
+        if users and db.session.scalar(
+            select(User.id).where(User.email.startswith(email_prefix)).limit(1)
+        ):
+            raise ValueError(f"The users of the seed {self.seed} already exist")
+
+        self._load(User.__table__, self._generate_users(users, email_prefix))
+
+        authors_query = select(User.id).order_by(User.id)
+
+        if users:
+            authors_query = authors_query.where(User.email.startswith(email_prefix))
+
+        authors = db.session.scalars(authors_query).all()
+
+        self._load(
+            Project.__table__,  # type: ignore[attr-defined]
+            self._generate_projects(projects, authors),
+        )
+
+        if db.engine.dialect.name == "postgresql":
+            db.session.execute(text("ANALYZE"))
+
+    def _generate_users(self, count: int, email_prefix: str) -> Iterator[dict[str, Any]]:
+        rnd = self.random
+        roles = rnd.choices(list(ROLE_WEIGHTS), list(ROLE_WEIGHTS.values()), k=count)
+        statuses = rnd.choices(
+            list(USER_STATUS_WEIGHTS),
+            list(USER_STATUS_WEIGHTS.values()),
+            k=count,
+        )
+
+        for index, (role, status) in enumerate(zip(roles, statuses)):
+            first, last = rnd.choice(_FIRST_NAMES), rnd.choice(_LAST_NAMES)
+            created_at = self._get_created_at()
+
+            yield {
+                "name": f"{first} {last}",
+                "ntid": f"s{self.seed}u{index}",
+                "email": f"{email_prefix}{first}.{last}.{index}@example.com".lower(),
+                "role": role.value,
+                "status": status.value,
+                "created_at": created_at,
+                "updated_at": self._get_updated_at(created_at),
+            }
+
+    def _generate_projects(
+        self,
+        count: int,
+        authors: Sequence[int],
+    ) -> Iterator[dict[str, Any]]:
+        rnd = self.random
+        # The authors are shuffled, so the prolific ones aren't the first users.
+        authors = rnd.sample(authors, len(authors))
+        author_weights = list(accumulate(1 / rank for rank in range(1, len(authors) + 1)))
+
+        for _ in range(count):
+            created_at = self._get_created_at()
+            (status,) = rnd.choices(
+                list(PROJECT_STATUS_WEIGHTS),
+                list(PROJECT_STATUS_WEIGHTS.values()),
+            )
+
+            yield {
+                "title": self._get_text(rnd.randint(2, 6)).capitalize(),
+                "description": self._get_text(rnd.randint(10, 60)).capitalize() + ".",
+                "status": status.value,
+                "author_id": (
+                    authors[bisect(author_weights, rnd.random() * author_weights[-1])]
+                    if authors
+                    else None
+                ),
+                "created_at": created_at,
+                "updated_at": self._get_updated_at(created_at),
+            }
+
+    def _get_text(self, words: int) -> str:
+        return " ".join(self.random.choices(WORDS, cum_weights=_WORD_WEIGHTS, k=words))
+
+    def _get_created_at(self) -> datetime:
+        # The more recent the period, the more entities (the app grows).
+        return UNTIL - PERIOD * (1 - sqrt(self.random.random()))
+
+    def _get_updated_at(self, created_at: datetime) -> datetime:
+        # Most of the entities are updated shortly after they are created.
+        return min(created_at + timedelta(days=self.random.expovariate(1 / 7)), UNTIL)
+
+    def _load(self, table: Table, rows: Iterable[dict[str, Any]]) -> None:
+        rows = iter(rows)
+
+        while chunk := list(islice(rows, self.batch)):
+            if db.engine.dialect.name == "postgresql":
+                _copy(table, chunk)
+            else:
+                db.session.execute(insert(table), chunk)
+
+
+def _copy(table: Table, rows: list[dict[str, Any]]) -> None:
+    columns = list(rows[0])
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    # The `None` is written as the empty unquoted value, which is `NULL`.
+    for row in rows:
+        writer.writerow(row[column] for column in columns)
+
+    buffer.seek(0)
+    names = ", ".join(f'"{column}"' for column in columns)
+    cursor = db.session.connection().connection.cursor()
+
+    try:
+        cursor.copy_expert(  # type: ignore[attr-defined]
+            f'COPY "{table.name}" ({names}) FROM STDIN WITH (FORMAT csv)',
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+__all__ = [
+    "PERIOD",
+    "PROJECT_STATUS_WEIGHTS",
+    "ROLE_WEIGHTS",
+    "UNTIL",
+    "USER_STATUS_WEIGHTS",
+    "WORDS",
+    "Seeder",
+]
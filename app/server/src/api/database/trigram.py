@@ -0,0 +1,34 @@
+from sqlalchemy import Index
+
+
+def trigram_index(table: str, column: str) -> Index:
+    """
+    Defines the `pg_trgm` GIN index that lets PostgreSQL use an index
+    for the `ILIKE '%value%'` (leading wildcard) substring search.
+
+    The index is created only on PostgreSQL so the other database
+    engines (e.g. SQLite in tests) keep working without it.
+
+    Example:
+        >>> class Lab(EntityMixin):
+        >>>     __table_args__ = (
+        >>>         trigram_index("lab", "title"),
+        >>>     )
+
+    :param table: The name of the table.
+    :param column: The name of the text column.
+    :return: The index definition.
+    """
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={
+            column: "gin_trgm_ops",
+        },
+    ).ddl_if(dialect="postgresql")
+
+
+__all__ = [
+    "trigram_index",
+]
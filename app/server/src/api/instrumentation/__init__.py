@@ -0,0 +1,151 @@
+from contextlib import contextmanager
+from typing import Any, Generator
+
+from flask import Flask, Response, current_app, has_request_context, request
+from sqlalchemy import event
+
+from api.database import db
+from .server_timing import PHASES, ServerTiming
+
+
+_ENVIRON_KEY = "api.server_timing"
+
+
+def get_server_timing() -> ServerTiming | None:
+    """
+    :return: The timing of the current request or `None` when it's not
+     measured (the instrumentation is disabled or there is no request).
+    """
+    if not has_request_context():  # type: ignore[no-untyped-call]
+        return None
+
+    # Stored in the WSGI environment rather than the `g`, as the Cognito
+    # `auth_required` runs the view in the app context of its own.
+    timing: ServerTiming | None = request.environ.get(_ENVIRON_KEY)
+
+    return timing
+
+
+def start_phase(phase: str) -> bool:
+    """
+    Starts measuring the phase of the current request (see `ServerTiming.start`).
+    """
+    timing = get_server_timing()
+
+    return timing is not None and timing.start(phase)
+
+
+def stop_phase(phase: str) -> None:
+    """
+    Stops measuring the phase of the current request (see `ServerTiming.stop`).
+    """
+    timing = get_server_timing()
+
+    if timing is not None:
+        timing.stop(phase)
+
+
+@contextmanager
+def measure(phase: str) -> Generator[None, None, None]:
+    """
+    Measures the duration of the phase of the current request.
+
+    Example:
+        >>> with measure("ser"):
+        >>>     data = [dump(entity) for entity in entities]
+    """
+    started = start_phase(phase)
+
+    try:
+        yield
+    finally:
+        if started:
+            stop_phase(phase)
+
+
+def _before_cursor_execute(*_: Any) -> None:
+    timing = get_server_timing()
+
+    if timing is not None:
+        timing.start("db")
+
+
+def _after_cursor_execute(*_: Any) -> None:
+    timing = get_server_timing()
+
+    if timing is not None:
+        timing.stop("db")
+        timing.queries += 1
+
+
+def _handle_error(*_: Any) -> None:
+    stop_phase("db")
+
+
+class Instrumentation:  # pylint: disable=locally-disabled, too-few-public-methods
+    """
+    Measures the phases of the requests (see `PHASES`) and reports them by
+    the `Server-Timing` response header as well as by the log record with
+    the `server_timing` data.
+
+    Configuration:
+        - `SERVER_TIMING_ENABLED`: the state of whether to measure the
+          requests (`False` by default).
+    """
+
+    def init_app(self, app: Flask) -> None:
+        app.config.setdefault("SERVER_TIMING_ENABLED", False)
+
+        if not app.config["SERVER_TIMING_ENABLED"]:
+            return
+
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+                event.listen(engine, "handle_error", _handle_error)
+
+        app.before_request(self._start)
+        app.after_request(self._report)
+
+    @staticmethod
+    def _start() -> None:
+        request.environ[_ENVIRON_KEY] = ServerTiming()
+
+    @staticmethod
+    def _report(response: Response) -> Response:
+        timing = get_server_timing()
+
+        if timing is None:
+            return response
+
+        header = timing.to_header()
+        response.headers["Server-Timing"] = header
+        current_app.logger.info(
+            f"Server timing of {request.method} {request.path} {response.status_code}: {header}",
+            extra={
+                "server_timing": {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    **timing.to_dict(),
+                },
+            },
+        )
+
+        return response
+
+
+instrumentation = Instrumentation()
+
+
+__all__ = [
+    "PHASES",
+    "Instrumentation",
+    "ServerTiming",
+    "get_server_timing",
+    "instrumentation",
+    "measure",
+    "start_phase",
+    "stop_phase",
+]
@@ -0,0 +1,107 @@
+from time import perf_counter
+
+
+PHASES = ("db", "ser", "auth")
+"""
+The phases of the request that are always reported (with the `0` duration
+when the request hasn't been through the phase):
+    - `db`: the SQL statements execution;
+    - `ser`: the entities serialization;
+    - `auth`: the authentication and authorization checks.
+"""
+
+
+class ServerTiming:
+    """
+    The durations of the request phases.
+
+    The phases might overlap (e.g. the user is loaded by the SQL statement
+    during the authentication), so their sum isn't the total duration.
+    """
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        self.durations: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        """The durations of the phases in seconds."""
+        self.queries = 0
+        """The number of the SQL statements executed."""
+        self._running: dict[str, float] = {}
+
+    def start(self, phase: str) -> bool:
+        """
+        Starts measuring the phase unless it's running already (e.g. the
+        entity is serialized during the serialization of another one).
+
+        :param phase: The name of the phase.
+        :return: The state of whether the phase has been started by the call.
+        """
+        if phase in self._running:
+            return False
+
+        self._running[phase] = perf_counter()
+
+        return True
+
+    def stop(self, phase: str) -> None:
+        """
+        Adds the duration of the running phase (noop if it's not running).
+
+        :param phase: The name of the phase.
+        """
+        started = self._running.pop(phase, None)
+
+        if started is not None:
+            self.add(phase, perf_counter() - started)
+
+    def add(self, phase: str, duration: float) -> None:
+        """
+        :param phase: The name of the phase.
+        :param duration: The duration to add in seconds.
+        """
+        self.durations[phase] = self.durations.get(phase, 0.0) + duration
+
+    def to_dict(self) -> dict[str, float | int]:
+        """
+        :return: The durations in milliseconds by the phase, the `total`
+         duration and the number of the `queries`.
+        """
+        data: dict[str, float | int] = {
+            phase: _milliseconds(duration) for phase, duration in self.durations.items()
+        }
+        data["total"] = _milliseconds(perf_counter() - self.started)
+        data["queries"] = self.queries
+
+        return data
+
+    def to_header(self) -> str:
+        """
+        :return: The value of the `Server-Timing` response header.
+
+        Example:
+            >>> 'db;dur=1.52;desc="3 queries", ser;dur=0.31, auth;dur=0.08, total;dur=4.2'
+        """
+        data = self.to_dict()
+        metrics = []
+
+        for name, value in data.items():
+            if name == "queries":
+                continue
+
+            metric = f"{name};dur={value}"
+
+            if name == "db":
+                metric += f';desc="{self.queries} queries"'
+
+            metrics.append(metric)
+
+        return ", ".join(metrics)
+
+
+def _milliseconds(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+__all__ = [
+    "PHASES",
+    "ServerTiming",
+]
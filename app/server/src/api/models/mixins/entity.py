@@ -1,15 +1,18 @@
-from dataclasses import dataclass
-from typing import Any, Callable, ClassVar, Final, Self
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Collection, Final, Iterable, Self
 
 from flask import current_app
 from flask_login import current_user
 from marshmallow import fields
 from sqlalchemy.orm import Mapped
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 
+from api.cache.list_pages import bump_generation
 from api.database import db
+from api.instrumentation import measure
 from api.principal.operation import Operation, Operations, HasOperations
-from api.schema import Schema
+from api.schema import Dump, Schema, compile_dump
 from .has_timestamps import HasTimestamps, HasTimestampsSchema
 
 
@@ -36,25 +39,99 @@ class EntitySchema:
     The `item` is used if not set.
     """
 
-    def serialize(self, model: "EntityMixin", list_item: bool = False) -> dict:
+    _subsets: dict[tuple[Schema, frozenset[str]], Schema] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    _dumps: dict[Schema, Dump] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def serialize(
+        self,
+        model: "EntityMixin",
+        list_item: bool = False,
+        only: Collection[str] | None = None,
+    ) -> dict:
         """
         :param model: The model to serialize.
         :param list_item: The state of whether the `list_item` schema should be
          used for serialization.
+        :param only: The names of the fields to serialize (all if `None`).
         :return: The serialized `model`.
         """
-        data = self.get(list_item=list_item).dump(model)
-        assert isinstance(data, dict)
+        dump = self.get_dump(list_item=list_item, only=only)
+
+        with measure("ser"):
+            return dump(model)
+
+    def serialize_many(
+        self,
+        models: Iterable["EntityMixin"],
+        list_item: bool = False,
+        only: Collection[str] | None = None,
+    ) -> list[dict]:
+        """
+        Serializes the whole page (or chunk) of the models at once, resolving
+        the schema and its compiled dump a single time.
+
+        :param models: The models to serialize.
+        :param list_item: The state of whether the `list_item` schema should be
+         used for serialization.
+        :param only: The names of the fields to serialize (all if `None`).
+        :return: The serialized `models`.
+        """
+        dump = self.get_dump(list_item=list_item, only=only)
 
-        return data
+        with measure("ser"):
+            return [dump(model) for model in models]
 
-    def get(self, list_item: bool = False) -> Schema:
+    def get_dump(self, list_item: bool = False, only: Collection[str] | None = None) -> Dump:
         """
         :param list_item: The state of whether the `list_item` schema should be
          used for serialization.
+        :param only: The names of the fields to serialize (all if `None`).
+        :return: The dump of the schema (see `get`) compiled once per schema.
+        :raise ValueError: When the `only` contains a field the schema doesn't dump.
+        """
+        schema = self.get(list_item=list_item, only=only)
+
+        if schema not in self._dumps:
+            self._dumps[schema] = compile_dump(schema)
+
+        return self._dumps[schema]
+
+    def get(self, list_item: bool = False, only: Collection[str] | None = None) -> Schema:
+        """
+        :param list_item: The state of whether the `list_item` schema should be
+         used for serialization.
+        :param only: The names of the fields to limit the schema to (e.g. the
+         sparse fieldset requested by an API client).
         :return: The existing schema instance.
+        :raise ValueError: When the `only` contains a field the schema doesn't dump.
         """
-        return (self.list_item if list_item else None) or self.item
+        schema = (self.list_item if list_item else None) or self.item
+
+        if only is None:
+            return schema
+
+        key = (schema, frozenset(only))
+
+        if key not in self._subsets:
+            for name in sorted(key[1]):
+                if name not in schema.dump_fields:
+                    reason = "write-only" if name in schema.load_fields else "not supported"
+                    raise ValueError(f"{name} field is {reason}")
+
+            self._subsets[key] = schema.__class__(only=tuple(sorted(key[1])))
+
+        return self._subsets[key]
 
 
 class EntityOperations(Operations):  # pylint: disable=locally-disabled, too-few-public-methods
@@ -103,10 +180,11 @@ class EntityMixin(HasTimestamps, HasOperations[EntityOperations]):
         """
         raise NotImplementedError
 
-    def to_json(self, list_item: bool = False) -> dict:
+    def to_json(self, list_item: bool = False, only: Collection[str] | None = None) -> dict:
         return self.schema.serialize(
             model=self,
             list_item=list_item,
+            only=only,
         )
 
     @classmethod
@@ -116,8 +194,13 @@ class EntityMixin(HasTimestamps, HasOperations[EntityOperations]):
         )
 
     @classmethod
-    def get_or_404(cls, pk: int | str, description: str | None = None) -> Self:
-        return cls.query.get_or_404(  # type: ignore[no-any-return]
+    def get_or_404(
+        cls,
+        pk: int | str,
+        description: str | None = None,
+        options: Collection[_AbstractLoad] = (),
+    ) -> Self:
+        return cls.query.options(*options).get_or_404(  # type: ignore[no-any-return]
             cls._normalize_pk(pk),
             description,
         )
@@ -141,6 +224,7 @@ class EntityMixin(HasTimestamps, HasOperations[EntityOperations]):
         is_new = self.id is None
 
         self.safe_session_execute_or_rollback(db.session.add)
+        bump_generation(self.__class__)
 
         if not skip_log:
             current_app.logger.info(self.get_log_message("created" if is_new else "updated"))
@@ -151,6 +235,7 @@ class EntityMixin(HasTimestamps, HasOperations[EntityOperations]):
         """Delete entity model from the database"""
 
         self.safe_session_execute_or_rollback(db.session.delete)
+        bump_generation(self.__class__)
 
         current_app.logger.info(self.get_log_message("deleted"))
 
@@ -25,6 +25,7 @@ class HasTimestamps(Model):
             db.DateTime,
             default=func.now(),
             nullable=False,
+            index=True,
         )
     )
 
@@ -33,6 +34,7 @@ class HasTimestamps(Model):
         default=func.now(),
         onupdate=func.now(),
         nullable=False,
+        index=True,
     )
 
 
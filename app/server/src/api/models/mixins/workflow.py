@@ -1,11 +1,13 @@
 from abc import abstractmethod
-from typing import Any, Callable, NotRequired, TypedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Collection, NotRequired, Self, TypedDict
 
+from sqlalchemy import inspect, update
 from sqlalchemy.orm import Mapped
 from sqlalchemy.ext.hybrid import hybrid_property
-from transitions import Machine
 
 from api.database import db, Model
+from .workflow_graph import Transition, WorkflowGraph
 
 
 class TransitionConfig(TypedDict):
@@ -39,8 +41,8 @@ class WorkflowMixin(Model):  # pylint: disable=locally-disabled, too-few-public-
     """
     Mixin class for integrating a status machine workflow with a SQLAlchemy model.
 
-    This mixin adds a "status" column to the model and provides methods for initializing
-    the status machine and converting the entity to a dictionary.
+    This mixin adds a "status" column to the model and provides methods for applying
+    the transitions, which are compiled once per model (see `WorkflowGraph`).
 
     Example:
         >>> class Project(WorkflowMixin):
@@ -83,27 +85,147 @@ class WorkflowMixin(Model):  # pylint: disable=locally-disabled, too-few-public-
 
     __abstract__ = True
 
-    _status_machine: Machine | None = None
+    _workflow_graph: ClassVar[WorkflowGraph | None] = None
 
     status: Mapped[str] = db.Column(db.String(50))
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.__init_status_machine()
+
+        if not self.status:
+            self.status = self._get_workflow_graph().initial
 
     @hybrid_property
     def allowed_transitions(self) -> list[str]:
         """
         Get the list of available trigger names for the current entity status.
         """
-        status_machine = self.__init_status_machine()
-        transitions = []
+        return [
+            trigger
+            for trigger in self._get_workflow_graph().get_triggers(self.status)
+            if self.may_trigger(trigger)
+        ]
 
-        for trigger in status_machine.get_triggers(self.status):
-            if getattr(self, f"may_{trigger}")():
-                transitions.append(trigger)
+    def trigger(self, trigger_name: str, *args: Any, **kwargs: Any) -> bool:
+        """
+        Applies the transition to the entity (the changes are not saved).
 
-        return transitions
+        The first transition of the trigger from the current status whose
+        `conditions` are met and `unless` are not is executed: the `before`
+        callbacks are called, the status is changed and the `after` callbacks
+        are called. The `args` and `kwargs` are passed to every callback.
+
+        The `<trigger_name>(*args, **kwargs)` method is the shortcut.
+
+        :param trigger_name: The name of the transition.
+        :return: The state of whether the transition has been executed.
+        :raise AttributeError: When the transition doesn't exist.
+        :raise MachineError: When the transition can't be applied from the current status.
+        """
+        transitions = self._get_workflow_graph().get_transitions(trigger_name, self.status)
+
+        return any(transition.execute(self, *args, **kwargs) for transition in transitions)
+
+    def may_trigger(self, trigger_name: str, *args: Any, **kwargs: Any) -> bool:
+        """
+        The `may_<trigger_name>(*args, **kwargs)` method is the shortcut.
+
+        :param trigger_name: The name of the transition.
+        :return: The state of whether the transition can be applied to the entity.
+        """
+        transitions = self._get_workflow_graph().table.get(self.status, {}).get(trigger_name, ())
+
+        return any(transition.is_allowed(self, *args, **kwargs) for transition in transitions)
+
+    if not TYPE_CHECKING:
+        # Hidden from the type checker, so it still reports the unknown attributes.
+        def __getattr__(self, name: str) -> Callable[..., bool]:
+            # The `<trigger>()` and `may_<trigger>()` shortcuts are resolved on
+            # demand instead of being bound to every entity.
+            if not name.startswith("_"):
+                transitions = self._get_workflow_graph().transitions
+
+                if name in transitions:
+                    return partial(self.trigger, name)
+
+                if name.startswith("may_") and name[4:] in transitions:
+                    return partial(self.may_trigger, name[4:])
+
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @classmethod
+    def bulk_trigger(cls, trigger: str, ids: Collection[int]) -> list[Self]:
+        """
+        Applies the transition to many entities by an `UPDATE` per transition
+        of the trigger instead of running the status machine of every entity.
+
+        Like the `trigger`, an entity takes the first transition of the trigger
+        whose `source` is its status, the entities with no such transition are
+        skipped. The `after` callbacks are called for every transitioned
+        entity with the `original_status` argument (like the `trigger` of
+        the `transition` endpoint does), while the transitions that have
+        the `conditions`, `unless` or `before` callbacks are not supported.
+
+        The changes are not committed.
+
+        :param trigger: The name of the transition.
+        :param ids: The primary keys of the entities.
+        :return: The transitioned entities.
+        :raise ValueError: When the transition doesn't exist or can't be applied in bulk.
+        """
+        transitions = cls._get_bulk_transitions(trigger)
+        primary_key = inspect(cls, raiseerr=True).primary_key[0]
+        # The entities by their primary keys with the statuses they are transitioned from.
+        candidates = {
+            inspect(entity).identity[0]: (entity, entity.status)
+            for entity in cls.query.filter(
+                primary_key.in_(ids),
+                cls.status.in_(set().union(*(transition.sources for transition in transitions))),
+            )
+        }
+        # The transitions are assigned by the original statuses, so an entity that a
+        # transition moves to the `source` of a later one isn't transitioned twice.
+        assigned = {
+            pk: next(transition for transition in transitions if status in transition.sources)
+            for pk, (_, status) in candidates.items()
+        }
+        transitioned = set()
+
+        for transition in transitions:
+            pks = [pk for pk, item in assigned.items() if item is transition]
+
+            if pks:
+                transitioned.update(cls._bulk_update(transition, primary_key, pks))
+
+        entities = []
+
+        for pk, (entity, original_status) in candidates.items():
+            if pk not in transitioned:
+                continue
+
+            for hook in assigned[pk].after:
+                hook.bind(entity)(original_status=original_status)
+
+            entities.append(entity)
+
+        return entities
+
+    @classmethod
+    def _bulk_update(cls, transition: Transition, primary_key: Any, pks: list[Any]) -> set[Any]:
+        """
+        :return: The primary keys of the entities the `UPDATE` has transitioned.
+        """
+        return set(
+            db.session.scalars(
+                update(cls)
+                # The status is checked again in case it has changed since it was selected.
+                .where(primary_key.in_(pks), cls.status.in_(transition.sources))
+                # The `updated_at` (if any) is set by its `onupdate`.
+                .values(status=transition.dest).returning(primary_key)
+                # Updates the loaded entities that have been transitioned only.
+                .execution_options(synchronize_session="fetch"),
+            ),
+        )
 
     @staticmethod
     @abstractmethod
@@ -132,6 +254,9 @@ class WorkflowMixin(Model):  # pylint: disable=locally-disabled, too-few-public-
         """
         Get the list of workflow transitions.
 
+        It's called once per model by an entity that isn't initialized, so the
+        transitions must not depend on the entity state (use the `conditions`).
+
         Example:
             >>> return (
             >>>     TransitionConfig(
@@ -149,15 +274,45 @@ class WorkflowMixin(Model):  # pylint: disable=locally-disabled, too-few-public-
         """
         raise NotImplementedError
 
-    def __init_status_machine(self) -> Machine:
-        if not self._status_machine:
-            self._status_machine = Machine(
-                model=self,
-                states=self._get_workflow_statuses(),
-                initial=self._get_workflow_initial_status() if not self.status else self.status,
-                transitions=self._get_workflow_transitions(),
-                model_attribute="status",
-                auto_transitions=False,
+    @classmethod
+    def _get_bulk_transitions(cls, trigger: str) -> tuple[Transition, ...]:
+        """
+        :param trigger: The name of the transition.
+        :return: The transitions of the trigger (one per `TransitionConfig`)
+         that can be applied in bulk.
+        :raise ValueError: When the transition doesn't exist or has the callbacks
+         that must run per entity.
+        """
+        transitions = cls._get_workflow_graph().transitions.get(trigger)
+
+        if not transitions:
+            raise ValueError(f"The {trigger} transition doesn't exist")
+
+        if any(item.conditions or item.unless or item.before for item in transitions):
+            raise ValueError(f"The {trigger} transition can't be applied in bulk")
+
+        return transitions
+
+    @classmethod
+    def _get_workflow_graph(cls) -> WorkflowGraph:
+        """
+        :return: The transition table of the model, compiled once per class.
+        """
+        # Looked up in the class itself, as every model has its own graph.
+        graph: WorkflowGraph | None = cls.__dict__.get("_workflow_graph")
+
+        if graph is None:
+            # The transitions are configured by the prototype entity that is
+            # neither initialized nor saved, its bound methods become hooks
+            # bound to the entity the transition is applied to.
+            prototype = cls.__new__(cls)
+            graph = WorkflowGraph.compile(
+                statuses=cls._get_workflow_statuses(),
+                initial=cls._get_workflow_initial_status(),
+                # pylint: disable-next=locally-disabled, protected-access
+                configs=prototype._get_workflow_transitions(),
+                prototype=prototype,
             )
+            cls._workflow_graph = graph
 
-        return self._status_machine
+        return graph
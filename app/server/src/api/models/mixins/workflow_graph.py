@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from types import MappingProxyType, MethodType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+from transitions import MachineError
+
+if TYPE_CHECKING:
+    from .workflow import TransitionConfig
+
+
+@dataclass(frozen=True)
+class Hook:
+    """
+    The callback of a transition that is bound to the entity when called.
+    """
+
+    func: str | Callable[..., Any]
+    """
+    The name of the entity's attribute (a method or a property), the entity
+    class function or an arbitrary callable.
+    """
+
+    is_method: bool = False
+    """The state of whether the `func` is the entity class function."""
+
+    @classmethod
+    def create(cls, callback: str | Callable[..., Any], prototype: object) -> "Hook":
+        """
+        :param callback: The callback of the `TransitionConfig`.
+        :param prototype: The entity the transitions were configured by, its
+         bound methods are unbound to be bound to every entity instead.
+        :return: The hook of the callback.
+        """
+        if isinstance(callback, MethodType) and callback.__self__ is prototype:
+            return cls(callback.__func__, True)
+
+        return cls(callback)
+
+    def bind(self, entity: object) -> Callable[..., Any]:
+        """
+        :param entity: The entity the transition is applied to.
+        :return: The callable (the non-callable attributes are returned by
+         the function, like the `transitions` library does).
+        """
+        if isinstance(self.func, str):
+            value = getattr(entity, self.func)
+
+            return value if callable(value) else lambda *args, **kwargs: value
+
+        if self.is_method:
+            return MethodType(self.func, entity)
+
+        return self.func
+
+
+@dataclass(frozen=True)
+class Transition:
+    """
+    The compiled `TransitionConfig`.
+    """
+
+    trigger: str
+    sources: frozenset[str]
+    dest: str
+    conditions: tuple[Hook, ...] = ()
+    unless: tuple[Hook, ...] = ()
+    before: tuple[Hook, ...] = ()
+    after: tuple[Hook, ...] = ()
+
+    def is_allowed(self, entity: object, *args: Any, **kwargs: Any) -> bool:
+        """
+        :return: The state of whether all `conditions` are met and none of
+         the `unless` is.
+        """
+        return all(hook.bind(entity)(*args, **kwargs) for hook in self.conditions) and not any(
+            hook.bind(entity)(*args, **kwargs) for hook in self.unless
+        )
+
+    def execute(self, entity: object, *args: Any, **kwargs: Any) -> bool:
+        """
+        Changes the `status` of the entity to the `dest` when the transition
+        is allowed, calling the `before` and `after` callbacks around.
+
+        :return: The state of whether the transition has been executed.
+        """
+        if not self.is_allowed(entity, *args, **kwargs):
+            return False
+
+        for hook in self.before:
+            hook.bind(entity)(*args, **kwargs)
+
+        setattr(entity, "status", self.dest)
+
+        for hook in self.after:
+            hook.bind(entity)(*args, **kwargs)
+
+        return True
+
+
+@dataclass(frozen=True)
+class WorkflowGraph:
+    """
+    The immutable transition table of the workflow, compiled once per model
+    class and shared by its entities.
+    """
+
+    statuses: tuple[str, ...]
+    initial: str
+    transitions: Mapping[str, tuple[Transition, ...]]
+    """The transitions by the trigger, in the order of the configuration."""
+    table: Mapping[str, Mapping[str, tuple[Transition, ...]]]
+    """
+    The transitions by the source status and the trigger, the triggers are
+    ordered like the `transitions.Machine.get_triggers` orders them.
+    """
+
+    @classmethod
+    def compile(
+        cls,
+        statuses: Iterable[str],
+        initial: str,
+        configs: Iterable["TransitionConfig"],
+        prototype: object,
+    ) -> "WorkflowGraph":
+        """
+        :param statuses: The statuses of the workflow.
+        :param initial: The status of the new entities.
+        :param configs: The transitions.
+        :param prototype: The entity the transitions were configured by (see `Hook.create`).
+        :return: The graph of the workflow.
+        """
+        transitions: dict[str, list[Transition]] = {}
+
+        for config in configs:
+            sources = config["source"]
+            transition = Transition(
+                trigger=config["trigger"],
+                sources=frozenset([sources] if isinstance(sources, str) else sources),
+                dest=config["dest"],
+                conditions=_create_hooks(config.get("conditions", []), prototype),
+                unless=_create_hooks(config.get("unless", []), prototype),
+                before=_create_hooks(config.get("before", []), prototype),
+                after=_create_hooks(config.get("after", []), prototype),
+            )
+            transitions.setdefault(transition.trigger, []).append(transition)
+
+        table: dict[str, dict[str, tuple[Transition, ...]]] = {}
+
+        for trigger, items in transitions.items():
+            for source in {source for transition in items for source in transition.sources}:
+                table.setdefault(source, {})[trigger] = tuple(
+                    transition for transition in items if source in transition.sources
+                )
+
+        return cls(
+            statuses=tuple(statuses),
+            initial=initial,
+            transitions=MappingProxyType({key: tuple(value) for key, value in transitions.items()}),
+            table=MappingProxyType(
+                {key: MappingProxyType(value) for key, value in table.items()},
+            ),
+        )
+
+    def get_triggers(self, status: str) -> tuple[str, ...]:
+        """
+        :param status: The current status of the entity.
+        :return: The triggers of the transitions from the status.
+        """
+        return tuple(self.table.get(status, ()))
+
+    def get_transitions(self, trigger: str, status: str) -> tuple[Transition, ...]:
+        """
+        :param trigger: The name of the transition.
+        :param status: The current status of the entity.
+        :return: The transitions of the trigger from the status.
+        :raise AttributeError: When the trigger doesn't exist.
+        :raise MachineError: When the trigger can't be applied from the status.
+        """
+        if trigger not in self.transitions:
+            raise AttributeError(f"Do not know event named '{trigger}'.")
+
+        transitions = self.table.get(status, {}).get(trigger)
+
+        if transitions is None:
+            raise MachineError(f"Can't trigger event {trigger} from state {status}!")
+
+        return transitions
+
+
+def _create_hooks(
+    callbacks: Iterable[str | Callable[..., Any]], prototype: object
+) -> tuple[Hook, ...]:
+    return tuple(Hook.create(callback, prototype) for callback in callbacks)
+
+
+__all__ = [
+    "Hook",
+    "Transition",
+    "WorkflowGraph",
+]
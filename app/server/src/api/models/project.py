@@ -3,9 +3,12 @@ from typing import Any
 
 from flask import current_app
 from marshmallow import fields, validate
+from sqlalchemy import Computed
 from sqlalchemy.orm import Mapped
 
 from api.database import db
+from api.database.search import SearchVector, search_document, search_index
+from api.database.trigram import trigram_index
 from api.models.mixins.entity import EntityMixin, EntityOperations, EntityMixinSchema, EntitySchema
 from api.models.mixins.has_author import HasAuthor, HasAuthorSchema
 from api.models.mixins.workflow import WorkflowMixin, TransitionConfig
@@ -69,12 +72,21 @@ class ProjectSchema(ProjectListSchema):  # pylint: disable=locally-disabled, too
         fields.Str(),
         # The property is computed thus cannot be updated.
         dump_only=True,
+        metadata={
+            # The columns the property reads.
+            "columns": ("status",),
+        },
     )
 
 
 class Project(EntityMixin, HasAuthor, WorkflowMixin):
     """Project ORM model"""
 
+    __table_args__ = (
+        trigram_index("project", "title"),
+        search_index("project"),
+    )
+
     can_be = ModelOperations()
 
     schema = EntitySchema(
@@ -90,6 +102,14 @@ class Project(EntityMixin, HasAuthor, WorkflowMixin):
         db.Text,
     )
 
+    search_vector: Mapped[str] = db.mapped_column(
+        SearchVector,
+        # Maintained by the database on every insert and update.
+        Computed(search_document("title", "description"), persisted=True),
+        # The document is for querying only, never load it.
+        deferred=True,
+    )
+
     def get_label(self) -> str:
         return str(self.title)
 
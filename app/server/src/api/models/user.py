@@ -5,6 +5,7 @@ from marshmallow import fields, validate
 from sqlalchemy.orm import Mapped
 
 from api.database import db
+from api.database.trigram import trigram_index
 from api.models.mixins.entity import EntityMixin, EntityOperations, EntityMixinSchema, EntitySchema
 from api.principal.role import Role
 
@@ -64,6 +65,10 @@ class UserListSchema(EntityMixinSchema):
     is_active = fields.Boolean(
         # The property is computed.
         dump_only=True,
+        metadata={
+            # The columns the property reads.
+            "columns": ("status",),
+        },
     )
 
 
@@ -78,6 +83,11 @@ class UserSchema(UserListSchema):
 class User(EntityMixin, UserMixin):
     """User ORM model"""
 
+    __table_args__ = (
+        trigram_index("user", "name"),
+        trigram_index("user", "email"),
+    )
+
     can_be = ModelOperations()
 
     schema = EntitySchema(
@@ -13,6 +13,7 @@ from flask_principal import (
 )
 from flask_cognito_lib.decorators import auth_required
 
+from api.instrumentation import start_phase, stop_phase
 from .actions import get_actions
 from .operation import Operation
 from .role import Role
@@ -61,10 +62,9 @@ def authentication_required(can: Operation | None = None) -> Callable:
     """
 
     def decorator(f: Callable) -> Callable:
-        @wraps(f)
         @login_required
         @auth_required()
-        def decorated_function(*args: Any, **kwargs: Any) -> Callable:
+        def authorized_function(*args: Any, **kwargs: Any) -> Callable:
             # Cognito: auth_required: triggers requests execution which leads to global context
             # lost, where Flask principal has stored information about current Identity,
             # re-initialize it:
@@ -75,8 +75,21 @@ def authentication_required(can: Operation | None = None) -> Callable:
             if can is not None and not can:
                 abort(403)
 
+            stop_phase("auth")
+
             return f(*args, **kwargs)  # type: ignore[no-any-return]
 
-        return decorated_function  # type: ignore[no-any-return]
+        @wraps(f)
+        def decorated_function(*args: Any, **kwargs: Any) -> Callable:
+            # The `auth` phase ends once the user is authorized (or denied).
+            started = start_phase("auth")
+
+            try:
+                return authorized_function(*args, **kwargs)  # type: ignore[no-any-return]
+            finally:
+                if started:
+                    stop_phase("auth")
+
+        return decorated_function
 
     return decorator
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from hashlib import blake2b
+from http import HTTPStatus
+from typing import Any, Self
+
+from flask import Response, request
+from flask_login import current_user
+from werkzeug.http import http_date
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    The validators of a `GET` response for the conditional requests
+    (`If-None-Match` and `If-Modified-Since`).
+
+    The ETag covers the role of the current user and the query arguments
+    of the request, so the payloads that depend on the permissions or on
+    the requested page don't share the tags.
+
+    Example:
+        >>> validators = Validators.build(entity.id, entity.updated_at)
+        >>>
+        >>> if validators.is_fresh():
+        >>>     return validators.not_modified()
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def build(cls, *state: Any, last_modified: datetime | None = None) -> Self:
+        """
+        :param state: The values that change along with the payload
+         (e.g. the `updated_at` of the entity).
+        :param last_modified: The optional time of the last change of the payload.
+        :return: The validators of the current request.
+        """
+        digest = blake2b(
+            repr((getattr(current_user, "role", None), request.full_path, state)).encode(),
+            digest_size=16,
+        )
+
+        return cls(etag=digest.hexdigest(), last_modified=last_modified)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        The response headers that make the client revalidate the payload.
+        """
+        headers = {
+            "ETag": f'"{self.etag}"',
+            "Cache-Control": "private, no-cache",
+        }
+
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self._last_modified)
+
+        return headers
+
+    def is_fresh(self) -> bool:
+        """
+        :return: The state of whether the client has the current payload. The
+         `If-Modified-Since` is only checked without the `If-None-Match`.
+        """
+        if request.if_none_match:
+            # The weak comparison, as the compressed responses have the weak tags.
+            return bool(request.if_none_match.contains_weak(self.etag))
+
+        if self.last_modified is not None and request.if_modified_since is not None:
+            return bool(self._last_modified <= request.if_modified_since)
+
+        return False
+
+    def not_modified(self) -> Response:
+        """
+        :return: The `304 Not Modified` response.
+        """
+        return Response(status=HTTPStatus.NOT_MODIFIED, headers=self.headers)
+
+    @property
+    def _last_modified(self) -> datetime:
+        assert self.last_modified is not None
+        # The timestamps are stored in UTC, the HTTP dates have no fractions of a second.
+        return self.last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+__all__ = [
+    "Validators",
+]
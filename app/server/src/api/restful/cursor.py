@@ -0,0 +1,102 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from dataclasses import dataclass
+from datetime import datetime
+from json import dumps, loads
+from typing import Any, Literal, Self, TypeAlias
+
+
+SortOrder: TypeAlias = Literal["asc", "desc"]
+
+_DATETIME_TAG = "$dt"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+
+    raise ValueError(f"{type(value).__name__} values cannot be used as a cursor")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+
+    return value
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    The opaque position of a row in a keyset-paginated list.
+
+    The cursor holds the sort key of a boundary row along with its
+    primary key so the next page can be fetched using the
+    `WHERE (sort_key, id) > (:value, :id)` seek condition rather
+    than `OFFSET`.
+
+    Example:
+        >>> cursor = Cursor(sort="title", direction="asc", value="Abc", id=12)
+        >>> assert Cursor.decode(cursor.encode()) == cursor
+    """
+
+    sort: str
+    """The name of the sort the cursor was issued for."""
+
+    direction: SortOrder
+    """The sort direction the cursor was issued for."""
+
+    value: Any
+    """The sort key value of the boundary row."""
+
+    id: int
+    """The primary key of the boundary row."""
+
+    backward: bool = False
+    """Whether the rows preceding the boundary row are requested."""
+
+    def encode(self) -> str:
+        """
+        :return: The URL-safe representation of the cursor.
+        """
+        payload = dumps(
+            [self.sort, self.direction, _encode_value(self.value), self.id, int(self.backward)],
+            separators=(",", ":"),
+        )
+
+        return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """
+        :param token: The value produced by the `encode`.
+        :return: The cursor instance.
+        :raise ValueError: When the `token` is malformed.
+        """
+        try:
+            sort, direction, value, pk, backward = loads(
+                urlsafe_b64decode(token + "=" * (-len(token) % 4)),
+            )
+            cursor = cls(
+                sort=str(sort),
+                direction=direction,
+                value=_decode_value(value),
+                id=int(pk),
+                backward=bool(backward),
+            )
+        except (BinasciiError, KeyError, TypeError, ValueError) as error:
+            raise ValueError("The cursor is malformed") from error
+
+        if cursor.direction not in ("asc", "desc"):
+            raise ValueError("The cursor is malformed")
+
+        return cursor
+
+
+__all__ = [
+    "Cursor",
+    "SortOrder",
+]
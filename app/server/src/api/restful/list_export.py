@@ -0,0 +1,140 @@
+from csv import writer as csv_writer
+from io import StringIO
+from typing import Any, Iterator, Literal, Mapping, TypeAlias
+
+from flask import Response, stream_with_context
+from flask_sqlalchemy.query import Query
+
+from api.schema import Dump
+from api.utils.json_encoder import dumps
+
+
+ExportFormat: TypeAlias = Literal["ndjson", "csv"]
+
+EXPORT_CHUNK_SIZE = 500
+"""
+The number of rows fetched from the server-side cursor and serialized at
+once. The memory usage of an export is bound by the chunk, not the list size.
+"""
+
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+"""
+The leading characters a spreadsheet takes the cell as a formula by (e.g.
+`=HYPERLINK(...)` or `@SUM(...)`), see the OWASP "CSV Injection".
+"""
+
+_MEDIA_TYPES: Mapping[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def get_export_format(value: str) -> ExportFormat:
+    """
+    :param value: The requested format.
+    :return: The export format.
+    :raise ValueError: When the format is unknown.
+    """
+    if value not in _MEDIA_TYPES:
+        raise ValueError(f"{value} format is not supported")
+
+    return value  # type: ignore[return-value]
+
+
+def export_response(
+    query: Query,
+    names: tuple[str, ...],
+    dump: Dump,
+    export_format: ExportFormat,
+    filename: str,
+) -> Response:
+    """
+    Streams the entities of the query serialized by the dump.
+
+    The rows are fetched by chunks (`yield_per`, the server-side cursor on
+    PostgreSQL), so neither the ORM objects nor the output are accumulated:
+      - `ndjson`: a JSON object per line (encoded like the JSON responses);
+      - `csv`: the header with the field names and a row per entity,
+        the nested values (e.g. the `author`) are JSON encoded and the
+        text that a spreadsheet would evaluate as a formula is prefixed
+        by `'`.
+
+    :param query: The filtered and sorted list query.
+    :param names: The names of the serialized fields (the `dump_fields` of the schema).
+    :param dump: The compiled dump of the schema (see `EntitySchema.get_dump`).
+    :param export_format: The output format.
+    :param filename: The name of the downloaded file without the extension.
+    :return: The streaming response.
+    """
+    lines: Iterator[str] | Iterator[bytes] = (
+        _csv(query, names, dump) if export_format == "csv" else _ndjson(query, dump)
+    )
+
+    return Response(
+        stream_with_context(lines),
+        mimetype=_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"',
+        },
+    )
+
+
+def _chunks(query: Query) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+
+    for entity in query.yield_per(EXPORT_CHUNK_SIZE):
+        chunk.append(entity)
+
+        if len(chunk) == EXPORT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _ndjson(query: Query, dump: Dump) -> Iterator[bytes]:
+    # Encoded like the `application/json` responses (see `output_json`).
+    for chunk in _chunks(query):
+        yield b"".join(dumps(dump(entity)) + b"\n" for entity in chunk)
+
+
+def _csv(query: Query, names: tuple[str, ...], dump: Dump) -> Iterator[str]:
+    buffer = StringIO()
+    writer = csv_writer(buffer)
+    writer.writerow(names)
+
+    for chunk in _chunks(query):
+        for entity in chunk:
+            item = dump(entity)
+            writer.writerow(_cell(item.get(name)) for name in names)
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # The header of an empty list.
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+
+    if isinstance(value, (dict, list)):
+        value = dumps(value).decode()
+
+    # The user-provided text (e.g. the `title`) is displayed as is, never evaluated.
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+
+    return value
+
+
+__all__ = [
+    "EXPORT_CHUNK_SIZE",
+    "ExportFormat",
+    "export_response",
+    "get_export_format",
+]
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping, TypeAlias
+
+from flask_sqlalchemy.query import Query
+
+
+QueryArgs = int | str | list[str] | list[int]
+FilterOperator: TypeAlias = Literal["eq", "in", "ilike", "gte", "lt"]
+
+_OPERATORS: Mapping[FilterOperator, Callable[[Any, Any], Any]] = MappingProxyType(
+    {
+        "eq": lambda column, value: column == value,
+        "in": lambda column, value: column.in_(str(value).split(",")),
+        "ilike": lambda column, value: column.ilike(f"%{value}%"),
+        "gte": lambda column, value: column >= value,
+        "lt": lambda column, value: column < value,
+    }
+)
+
+
+class QueryJoins:
+    """
+    The entities joined to a list query.
+
+    Every entity is joined once even if several filters and the sort need it.
+    The joins needed for the ordering only are `LEFT OUTER`, so they neither
+    drop the rows without the related entity nor change the number of rows
+    (thus can be left out of the count).
+    """
+
+    def __init__(self) -> None:
+        self._joined: dict[Any, bool] = {}
+
+    def join(self, query: Query, target: Any, sorting: bool = False) -> Query:
+        """
+        :param query: The list query.
+        :param target: The entity (or alias) to join.
+        :param sorting: Whether the join is needed for the ordering only.
+        :return: The query with the `target` joined.
+        """
+        if target in self._joined:
+            return query
+
+        self._joined[target] = sorting
+        return query.join(target, isouter=sorting)
+
+    @property
+    def sorting_only(self) -> bool:
+        """
+        The state of whether some entities are joined for the ordering only.
+        """
+        return any(self._joined.values())
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    The list filter by the `{name}_filter` query argument.
+
+    Example:
+        >>> # ?status_filter=draft,completed
+        >>> Filter(Project.status, "in")
+        >>> # ?author_email_filter=gmail
+        >>> Filter(author.email, "ilike", join=author)
+    """
+
+    column: Any
+    """The column (or SQL expression) to filter by."""
+
+    operator: FilterOperator = "eq"
+    """
+    The comparison of the `column` with the value:
+      - `eq`: equals the value;
+      - `in`: equals one of the comma-separated values;
+      - `ilike`: matches the `%value%` pattern (served by the `trigram_index`
+        of the column, if any);
+      - `gte`/`lt`: the lower (inclusive) and upper (exclusive) bounds.
+    """
+
+    join: Any | None = None
+    """The optional entity (or alias) to join to make the `column` available."""
+
+    parse: Callable[[QueryArgs], Any] | None = None
+    """
+    The optional conversion of the query argument.
+
+    :raise ValueError: When the value is invalid.
+    """
+
+    def __post_init__(self) -> None:
+        assert self.operator in _OPERATORS, self.operator
+
+    def apply(self, query: Query, value: QueryArgs, joins: QueryJoins | None = None) -> Query:
+        if self.join is not None:
+            query = (joins or QueryJoins()).join(query, self.join)
+
+        return query.filter(
+            _OPERATORS[self.operator](
+                self.column,
+                self.parse(value) if self.parse else value,
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    The sortable expression along with the query preparation it requires.
+
+    Unlike the `get_special_sorting` callbacks, the sort keys are usable
+    for both the `page` and `cursor` pagination modes.
+
+    Example:
+        >>> user_alias = aliased(User)
+        >>> SortKey(user_alias.name, join=user_alias)
+    """
+
+    expression: Any
+    """The column (or SQL expression) to order by."""
+
+    prepare: Callable[[Query], Query] | None = None
+    """The optional callback that makes the `expression` available."""
+
+    join: Any | None = None
+    """The optional entity (or alias) to join to make the `expression` available."""
+
+    def apply(self, query: Query, joins: QueryJoins | None = None) -> Query:
+        if self.join is not None:
+            query = (joins or QueryJoins()).join(query, self.join, sorting=True)
+
+        return self.prepare(query) if self.prepare else query
+
+
+@dataclass(frozen=True)
+class ListRegistry:
+    """
+    The filters, sort keys and facets of a list resource. Built once per class.
+    """
+
+    filters: Mapping[str, Filter]
+    sort_keys: Mapping[str, SortKey]
+    facets: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "filters", MappingProxyType(dict(self.filters)))
+        object.__setattr__(self, "sort_keys", MappingProxyType(dict(self.sort_keys)))
+
+
+__all__ = [
+    "Filter",
+    "FilterOperator",
+    "ListRegistry",
+    "QueryArgs",
+    "QueryJoins",
+    "SortKey",
+]
@@ -1,11 +1,20 @@
 from http import HTTPStatus
+from typing import Collection
 
+from flask import request
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.cache.list_pages import bump_generation
+from api.database import db
+from api.database.search import search_match, search_rank
 from api.principal import authentication_required
 from api.models.project import Project, ProjectStatus
 
+from .cursor import SortOrder
 from .restful_api import EntityResource, JsonResponse, resource
-from .restful_base import RestfulBase
-from .restful_list_base import RestfulListBase, QueryArgs, Queries
+from .restful_base import MAX_BULK_ITEMS, RestfulBase
+from .list_registry import Filter, SortKey
+from .restful_list_base import RestfulListBase, QueryArgs
 
 
 @resource("/projects")
@@ -14,6 +23,14 @@ class ProjectListResource(RestfulListBase[Project]):
     Project's list item resource.
     """
 
+    cache_timeout = 300
+
+    filters = {
+        "status": Filter(Project.status, "in"),
+    }
+
+    facet_columns = ("status", "author_id")
+
     @staticmethod
     def get_default_filters() -> dict[str, QueryArgs]:
         return {
@@ -22,11 +39,38 @@ class ProjectListResource(RestfulListBase[Project]):
             ),
         }
 
-    def get_special_filters(self) -> Queries:
+    def get_special_sort_keys(self) -> dict[str, SortKey]:
+        search = self.get_search()
+
+        if search is None:
+            return {}
+
         return {
-            "status": lambda q, s: q.filter(self.model.status.in_(str(s).split(","))),
+            "rank": SortKey(search_rank(self.model.search_vector, search)),
         }
 
+    def apply_filters(self, exclude: Collection[str] = ()) -> None:
+        super().apply_filters(exclude)
+        search = self.get_search()
+
+        if search is not None:
+            self.query = self.query.filter(search_match(self.model.search_vector, search))
+
+    def get_sort_and_direction(self) -> tuple[str | None, SortOrder | None]:
+        # The search results are ordered by relevance unless the sort is explicit.
+        if self.get_search() is not None and "sort" not in request.args:
+            return "rank", request.args.get("order", "desc")  # type: ignore[return-value]
+
+        return super().get_sort_and_direction()
+
+    @staticmethod
+    def get_search() -> str | None:
+        """
+        :return: The full-text search query (the `q` query argument).
+        """
+        search = request.args.get("q", "").strip()
+        return search or None
+
 
 @resource("/projects", "/projects/<int:entity_id>")
 class ProjectsResource(RestfulBase[Project]):
@@ -48,10 +92,54 @@ class ProjectTransitionResource(EntityResource[Project]):
         if trigger_name not in project.allowed_transitions:
             return {"message": "Transition is not allowed"}, HTTPStatus.BAD_REQUEST
 
-        # The `trigger` method is added by the status machine.
-        # The call to `project.allowed_transitions` ensures it's
-        # initialized.
-        project.trigger(trigger_name, original_status=project.status)  # type: ignore[attr-defined]
+        project.trigger(trigger_name, original_status=project.status)
         project.save(True)
 
         return project.to_json(), HTTPStatus.OK
+
+
+@resource("/projects/transition/<string:trigger_name>")
+class ProjectBulkTransitionResource(EntityResource[Project]):
+    """Change the status of many projects resource"""
+
+    @authentication_required()
+    def put(self, trigger_name: str) -> JsonResponse:
+        """
+        Applies the transition to the projects of the `ids` array of the
+        request by a single `UPDATE` (see `WorkflowMixin.bulk_trigger`).
+
+        The projects the transition isn't allowed for (or that don't exist)
+        are reported by the `skipped`.
+        """
+        if not self.model.can_be.edited:
+            return self.denied_response
+
+        data = request.get_json()
+        ids = data.get("ids") if isinstance(data, dict) else None
+
+        if not isinstance(ids, list) or not all(isinstance(pk, int) and pk > 0 for pk in ids):
+            return {
+                "message": "The ids must be an array of positive integers"
+            }, HTTPStatus.BAD_REQUEST
+
+        if not 0 < len(ids) <= MAX_BULK_ITEMS:
+            return {
+                "message": f"The number of ids must be from 1 to {MAX_BULK_ITEMS}",
+            }, HTTPStatus.BAD_REQUEST
+
+        try:
+            projects = self.model.bulk_trigger(trigger_name, ids)
+            transitioned = {project.id for project in projects}
+            db.session.commit()
+        except ValueError:
+            return {"message": "Transition is not allowed"}, HTTPStatus.BAD_REQUEST
+        except SQLAlchemyError as error:
+            db.session.rollback()
+            raise error
+
+        bump_generation(self.model)
+
+        return {
+            "transitioned": [pk for pk in dict.fromkeys(ids) if pk in transitioned],
+            "skipped": [pk for pk in dict.fromkeys(ids) if pk not in transitioned],
+        }, HTTPStatus.OK
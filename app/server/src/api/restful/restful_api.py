@@ -2,9 +2,11 @@ from abc import ABC
 from http import HTTPStatus
 from typing import Any, Callable, Final, Generic, TypeAlias, TypeVar
 
+from flask import request
 from flask_restful import Api, Resource
 
 from api.models.mixins.entity import EntityMixin
+from api.utils.json_encoder import output_json
 
 
 _Entity = TypeVar("_Entity", bound=EntityMixin)
@@ -16,6 +18,8 @@ JsonResponse: TypeAlias = tuple[dict, HTTPStatus]
 # resource decorator, before the actual resource definition import, otherwise
 # restful resources wouldn't be registered.
 restful = Api()
+# The lists are encoded faster than by the stdlib `json` of the default representation.
+restful.representation("application/json")(output_json)
 
 
 def resource(*urls: str, **kwargs: Any) -> Callable[[_Resource], _Resource]:
@@ -36,6 +40,20 @@ def resource(*urls: str, **kwargs: Any) -> Callable[[_Resource], _Resource]:
 
     def decorator(cls: _Resource) -> _Resource:
         restful.add_resource(cls, *urls, **kwargs)
+
+        if issubclass(cls, EntityResource):
+            endpoint = kwargs.get("endpoint", cls.__name__.lower())
+
+            # The variants are the sub-paths of the collection URLs only.
+            collection_urls = [url for url in urls if "<" not in url]
+
+            for path, variant in cls.get_variants().items():
+                restful.add_resource(
+                    variant,
+                    *(f"{url}/{path}" for url in collection_urls),
+                    **{**kwargs, "endpoint": f"{endpoint}_{path}"},
+                )
+
         return cls
 
     return decorator
@@ -54,6 +72,16 @@ class EntityResource(Generic[_Entity], Resource, ABC):
     )
 
     def __init__(self) -> None:
+        model = self.get_model()
+        assert model is not None
+        self.model: Final[type[_Entity]] = model
+
+    @classmethod
+    def get_model(cls) -> type[_Entity] | None:
+        """
+        :return: The model the resource is parametrized with or `None` for
+         the generic resource (e.g. the `RestfulListBase[_Entity]` itself).
+        """
         # The `__orig_bases__` is introduced since 3.7 in PEP-560.
         # See https://peps.python.org/pep-0560/
         # The `[0]` here is the `Generic` that has a `[0]` argument
@@ -61,9 +89,34 @@ class EntityResource(Generic[_Entity], Resource, ABC):
         #
         # noinspection PyUnresolvedReferences
         # pylint: disable=no-member
-        self.model: Final[type[_Entity]] = self.__class__.__orig_bases__[0].__args__[0]
+        model = cls.__orig_bases__[0].__args__[0]  # type: ignore[attr-defined]
         # pylint: enable=no-member
-        assert issubclass(self.model, EntityMixin)
+
+        if not isinstance(model, type):
+            return None
+
+        assert issubclass(model, EntityMixin)
+        return model  # type: ignore[return-value]
+
+    @classmethod
+    def get_variants(cls) -> dict[str, type[Resource]]:
+        """
+        :return: The resources the `resource` decorator registers under the
+         sub-paths of the resource URLs without parameters (e.g. the `export`
+         of a list resource is served by the `/projects/export`).
+        """
+        return {}
+
+    @staticmethod
+    def get_fields() -> tuple[str, ...] | None:
+        """
+        :return: The sparse fieldset requested by the `fields` query argument
+         (e.g. `?fields=id,title,status`) or `None` to serialize all fields.
+        """
+        value = request.args.get("fields", "")
+        fields = tuple(name.strip() for name in value.split(",") if name.strip())
+
+        return fields or None
 
 
 __all__ = [
@@ -1,14 +1,26 @@
 from abc import ABC
 from http import HTTPStatus
+from typing import Callable
 
-from flask import request
+from flask import Response, current_app, request
+from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
 
+from api.cache.list_pages import bump_generation
+from api.database import db
+from api.database.loading import schema_loader_options
 from api.principal import authentication_required
 
+from .conditional import Validators
 from .restful_api import EntityResource, JsonResponse, _Entity
 
 
+MAX_BULK_ITEMS = 500
+"""The maximum number of the items (or IDs) of a bulk request."""
+
+
 class RestfulBase(EntityResource[_Entity], ABC):
     """
     Restful Base implementation.
@@ -23,16 +35,37 @@ class RestfulBase(EntityResource[_Entity], ABC):
     """
 
     @authentication_required()
-    def get(self, entity_id: int) -> JsonResponse:
+    def get(self, entity_id: int) -> JsonResponse | tuple[dict, HTTPStatus, dict] | Response:
         """
         Retrieve an entity by ID.
+
+        The response has the validators (see `Validators`) and the conditional
+        request is answered with the `304 Not Modified` before the entity is loaded.
         """
         if not self.model.can_be.viewed:
             return self.denied_response
 
-        return self._serialize(
-            entity=self.model.get_or_404(entity_id),
-            status=HTTPStatus.OK,
+        only = self.get_fields()
+
+        try:
+            schema = self.model.schema.get(only=only)
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        validators = self._get_validators(entity_id)
+
+        if validators and validators.is_fresh():
+            return validators.not_modified()
+
+        entity = self.model.get_or_404(
+            entity_id,
+            options=schema_loader_options(self.model, schema),
+        )
+        validators = Validators.build(entity.updated_at, last_modified=entity.updated_at)
+
+        return (
+            *self._serialize(entity=entity, status=HTTPStatus.OK, only=only),
+            validators.headers,
         )
 
     @authentication_required()
@@ -72,20 +105,213 @@ class RestfulBase(EntityResource[_Entity], ABC):
         self.model.get_or_404(entity_id).delete()
         return {"message": f"Entity has been deleted (PK: {entity_id})."}, HTTPStatus.OK
 
-    def _save(self, entity: _Entity | None) -> _Entity | ValidationError:
+    @classmethod
+    def get_variants(cls) -> dict[str, type[Resource]]:
+        return {
+            **super().get_variants(),
+            "bulk": type(
+                f"{cls.__name__}Bulk",
+                (cls,),
+                {
+                    "methods": {"POST", "PATCH"},
+                    "post": cls.bulk_create,
+                    "patch": cls.bulk_update,
+                },
+            ),
+        }
+
+    def _get_validators(self, entity_id: int) -> Validators | None:
         """
-        Unpack an entity from the request and save it to the database.
+        :return: The validators of the conditional request for an existing
+         entity, `None` otherwise.
+        """
+        if not (request.if_none_match or request.if_modified_since):
+            return None
+
+        # The single column by the primary key instead of the entity with its relationships.
+        updated_at = (
+            self.model.query.with_entities(self.model.updated_at)
+            .filter(self.model.id == entity_id)
+            .scalar()
+        )
+
+        return Validators.build(updated_at, last_modified=updated_at) if updated_at else None
+
+    @authentication_required()
+    def bulk_create(self) -> JsonResponse:
+        """
+        Creates the entities from the array of the request (the `POST` of
+        the `bulk` variant, e.g. `/projects/bulk`).
+
+        Either all entities are created by the single transaction or, when
+        some items are invalid, none of them. The `errors` of the latter
+        follow the order of the items and have `null` for the valid ones.
+        """
+        if not self.model.can_be.created:
+            return self.denied_response
+
+        try:
+            items = self._get_bulk_items()
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        loaded = [self._load(data=item, entity=None) for item in items]
+        valid = [data for data in loaded if isinstance(data, dict)]
+
+        if len(valid) < len(loaded):
+            return self._bulk_errors(loaded)
+
+        # The ORM batches the inserts into multi-row `INSERT ... RETURNING id`.
+        entities = [self.model(**data) for data in valid]
+
+        def insert() -> list[int]:
+            db.session.add_all(entities)
+            db.session.flush()
+            # Collected before the commit expires the entities.
+            return [entity.id for entity in entities]
+
+        return {
+            "items": self._bulk_serialize(self._bulk_write(insert, "created"))
+        }, HTTPStatus.CREATED
+
+    @authentication_required()
+    def bulk_update(self) -> JsonResponse:
+        """
+        Updates the entities by the array of the request (the `PATCH` of
+        the `bulk` variant, e.g. `/projects/bulk`). Every item must have the
+        `id` and only the given fields are updated.
+
+        Either all entities are updated by the single transaction or, when
+        some items are invalid or don't exist, none of them (see `bulk_create`).
+        """
+        if not self.model.can_be.edited:
+            return self.denied_response
+
+        try:
+            items = self._get_bulk_items()
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        # The `true` and `1.0` equal the `1` in the lookup, so only the integers are the IDs.
+        ids = [
+            pk if isinstance(pk, int) and not isinstance(pk, bool) else None
+            for pk in (item.pop("id", None) for item in items)
+        ]
+        entities = {
+            entity.id: entity
+            for entity in self.model.query.filter(
+                self.model.id.in_([pk for pk in ids if pk is not None]),
+            ).all()
+        }
+        loaded = [
+            (
+                self._load(data=item, entity=entities[pk])
+                if pk in entities
+                else ValidationError({"id": ["Entity not found."]})
+            )
+            for pk, item in zip(ids, items)
+        ]
+
+        valid = [data for data in loaded if isinstance(data, dict)]
+
+        if len(valid) < len(loaded):
+            return self._bulk_errors(loaded)
+
+        rows = [{**data, "id": pk} for pk, data in zip(ids, valid)]
+
+        def update_rows() -> list[int]:
+            # The ORM bulk `UPDATE` by primary key (an `executemany` per set of the keys).
+            db.session.execute(update(self.model), rows)
+            return [row["id"] for row in rows]
+
+        return {
+            "items": self._bulk_serialize(self._bulk_write(update_rows, "updated"))
+        }, HTTPStatus.OK
+
+    @staticmethod
+    def _get_bulk_items() -> list[dict]:
+        """
+        :return: The items of the bulk request.
+        :raise ValueError: When the request isn't an array of objects of the supported size.
+        """
+        items = request.get_json()
+
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValueError("The request must be an array of objects")
+
+        if not 0 < len(items) <= MAX_BULK_ITEMS:
+            raise ValueError(f"The number of items must be from 1 to {MAX_BULK_ITEMS}")
+
+        return items
+
+    @staticmethod
+    def _bulk_errors(loaded: list[dict | ValidationError]) -> JsonResponse:
+        return {
+            "errors": [
+                data.messages if isinstance(data, ValidationError) else None for data in loaded
+            ],
+        }, HTTPStatus.UNPROCESSABLE_ENTITY
+
+    def _bulk_write(self, write: Callable[[], list[int]], action: str) -> list[int]:
+        try:
+            ids = write()
+            db.session.commit()
+        except SQLAlchemyError as error:
+            db.session.rollback()
+            raise error
+
+        bump_generation(self.model)
+        current_app.logger.info(
+            f"{len(ids)} {self.model.__name__} entities have been {action} "
+            f"by {self.model.format_current_user_email()}"
+        )
+
+        return ids
+
+    def _bulk_serialize(self, ids: list[int]) -> list[dict]:
+        # The entities are expired by the commit, so reload them by a single query.
+        entities = {
+            entity.id: entity
+            for entity in self.model.query.options(
+                *schema_loader_options(self.model, self.model.schema.item),
+            )
+            .filter(self.model.id.in_(ids))
+            .populate_existing()
+            .all()
+        }
+
+        dump = self.model.schema.get_dump()
+
+        return [dump(entities[pk]) for pk in ids]
+
+    def _load(self, data: dict, entity: _Entity | None) -> dict | ValidationError:
+        """
+        :param data: The entity data of the request.
+        :param entity: The entity to update (a new one is being created if `None`).
+        :return: The validated data or the validation error.
         """
         try:
-            data = request.get_json()
-            assert isinstance(data, dict)
             # Process the data (might be mutated).
             self._process_upsert_request(data=data, entity=entity)
             # Build the validated dictionary.
-            data = self.model.schema.item.load(data, container=entity)
+            loaded = self.model.schema.item.load(data, container=entity)
+            assert isinstance(loaded, dict)
         except ValidationError as error:
             return error
 
+        return loaded
+
+    def _save(self, entity: _Entity | None) -> _Entity | ValidationError:
+        """
+        Unpack an entity from the request and save it to the database.
+        """
+        data = request.get_json()
+        assert isinstance(data, dict)
+        data = self._load(data=data, entity=entity)
+
+        if isinstance(data, ValidationError):
+            return data
+
         if entity:
             for key in data:
                 setattr(entity, key, data.get(key))
@@ -109,11 +335,21 @@ class RestfulBase(EntityResource[_Entity], ABC):
         """
 
     @staticmethod
-    def _serialize(entity: _Entity | ValidationError, status: HTTPStatus) -> JsonResponse:
+    def _serialize(
+        entity: _Entity | ValidationError,
+        status: HTTPStatus,
+        only: tuple[str, ...] | None = None,
+    ) -> JsonResponse:
         if isinstance(entity, ValidationError):
             return {"errors": entity.messages}, HTTPStatus.UNPROCESSABLE_ENTITY
 
-        serialized = entity.to_json()
+        serialized = entity.to_json(only=only)
         assert isinstance(serialized, dict)
 
         return serialized, status
+
+
+__all__ = [
+    "MAX_BULK_ITEMS",
+    "RestfulBase",
+]
@@ -1,24 +1,63 @@
 from abc import ABC
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from http import HTTPStatus
-from typing import Any, Callable, Literal, TypedDict
-
-from flask import request
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Literal,
+    Mapping,
+    Sequence,
+    TypedDict,
+    TypeAlias,
+)
+
+from flask import Response, request
+from flask_restful import Resource
 from flask_sqlalchemy.query import Query
-from sqlalchemy import func
+from sqlalchemy import (
+    Select,
+    Table,
+    and_,
+    cast,
+    func,
+    inspect,
+    literal,
+    null,
+    or_,
+    text,
+    tuple_,
+)
+from sqlalchemy import orm
 from sqlalchemy.orm import aliased
 
+from api.cache import list_pages
+from api.database.loading import schema_loader_options, schema_models
 from api.models.user import User
 from api.models.mixins.has_author import HasAuthor
 from api.models.mixins.has_timestamps import HasTimestamps
 from api.principal import authentication_required
 
+from .cursor import Cursor, SortOrder
+from .conditional import Validators
+from .list_export import export_response, get_export_format
+from .list_registry import Filter, ListRegistry, QueryArgs, QueryJoins, SortKey
 from .restful_api import EntityResource, _Entity
 
 
-QueryArgs = int | str | list[str] | list[int]
 QueryFn = Callable[[Query, QueryArgs], Query]
 Queries = dict[str, QueryFn]
-SortOrder = Literal["asc", "desc"]
+TotalMode: TypeAlias = Literal["exact", "estimate", "none"]
+
+_MAX_PER_PAGE = 100
+_TOTAL_MODES: tuple[TotalMode, ...] = ("exact", "estimate", "none")
+_EXACT_TOTAL_THRESHOLD = 1000
+"""
+The planner estimates below this number are replaced by the exact `count(*)`
+as the latter is cheap for such lists while the estimate is likely inaccurate.
+"""
 
 
 class DefaultSort(TypedDict):
@@ -28,7 +67,10 @@ class DefaultSort(TypedDict):
     direction: SortOrder
 
 
-class RestfulListBase(EntityResource[_Entity], ABC):
+class RestfulListBase(  # pylint: disable=locally-disabled, too-many-public-methods
+    EntityResource[_Entity],
+    ABC,
+):
     """
     Entity's list item base resource.
     """
@@ -38,68 +80,150 @@ class RestfulListBase(EntityResource[_Entity], ABC):
         "direction": "desc",
     }
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.query: Query = self.model.query
+    total_mode: TotalMode = "exact"
+    """
+    The default way of computing the `total` of the `pager` (overridable by
+    the `total` query argument):
+      - `exact`: the `SELECT count(*)` over the filtered list;
+      - `estimate`: the PostgreSQL planner's row estimate (the exact number
+        is reported for small lists and other database engines);
+      - `none`: no total, the `has_next` is computed by fetching one extra row.
+    """
 
-        self._filters: Queries = {}
-        self._sorting: Queries = {}
+    cache_timeout: int | None = None
+    """
+    The number of seconds to cache the serialized pages for (`0` is forever)
+    or `None` to disable the cache. The pages are cached per role and query
+    arguments and invalidated by any write to the models they contain (see
+    `api.cache.list_pages`).
+    """
 
-        if issubclass(self.model, HasAuthor):
-            user_alias = aliased(User)  # type: ignore[unreachable]
-            self._filters["author_name"] = lambda q, s: q.join(user_alias).filter(
-                user_alias.name.ilike(f"%{s}%"),
-            )
-            self._sorting["author_name"] = lambda q, s: q.join(user_alias).order_by(
-                user_alias.name.desc() if s == "desc" else user_alias.name.asc(),
-            )
+    filters: ClassVar[Mapping[str, Filter]] = {}
+    """
+    The filters in addition to the built-in ones (the model columns and the
+    mixins' filters like `author_name` or `created_from`), keyed by the name
+    of the `{name}_filter` query argument.
+
+    Example:
+        >>> filters = {
+        >>>     "status": Filter(Project.status, "in"),
+        >>> }
+    """
 
-        if issubclass(self.model, HasTimestamps):
-            self._filters["created_from"] = lambda q, s: q.filter(
-                func.date(self.model.created_at) >= s,
-            )
-            self._filters["created_to"] = lambda q, s: q.filter(
-                func.date(self.model.created_at) <= s,
-            )
-            self._filters["updated_from"] = lambda q, s: q.filter(
-                func.date(self.model.updated_at) >= s,
-            )
-            self._filters["updated_to"] = lambda q, s: q.filter(
-                func.date(self.model.updated_at) <= s,
-            )
+    sort_keys: ClassVar[Mapping[str, SortKey]] = {}
+    """
+    The sort keys in addition to the built-in ones (the model columns and the
+    mixins' sort keys like `author_name`), keyed by the value of the `sort`
+    query argument.
+    """
+
+    facet_columns: ClassVar[tuple[str, ...]] = ()
+    """
+    The model columns the `facets` variant may count the entities by. Only
+    the columns with a few distinct values (like the `status`) make sense,
+    the deferred and generated ones are rejected when the class is defined.
+    """
+
+    registry: ClassVar[ListRegistry]
+    """
+    The filters and sort keys of the resource, built once when the class is
+    defined, so the requests only look them up.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model = cls.get_model()
+
+        # The generic subclasses don't have the model yet.
+        if model is not None:
+            cls.registry = _build_registry(cls, model)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.query: Query = self.model.query
+        self.joins = QueryJoins()
+        self.filtered_count: int | None = None
+        """The number of the filtered entities when it's known before the pagination."""
 
     @authentication_required()
-    def get(self) -> tuple[dict[str, Any], int]:
-        """Returns sorted and filtered entity list."""
+    def get(self) -> tuple[dict[str, Any], int] | tuple[dict[str, Any], int, dict] | Response:
+        """
+        Returns sorted and filtered entity list.
+
+        The conditional request is answered with the `304 Not Modified`
+        before the page is loaded (see `get_validators`). The serialized
+        pages are cached if the `cache_timeout` is set.
+        """
         if not self.model.can_be.viewed:
             return {"message": "Access denied"}, HTTPStatus.FORBIDDEN
 
         try:
-            self.apply_filters()
-            self.apply_sorting()
+            self.model.schema.get(list_item=True, only=self.get_fields())
         except ValueError as error:
-            return {"message": str(error)}, 500
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        cache_timeout = self.cache_timeout
+        cache_key = (
+            None
+            if cache_timeout is None
+            else list_pages.page_key(
+                self.model,
+                schema_models(self.model, self.model.schema.get(list_item=True)),
+            )
+        )
+        page = list_pages.get_page(cache_key) if cache_key else None
 
-        paginated_entities = self.query.paginate(
-            page=request.args.get("page", 1, type=int),
-            per_page=request.args.get("per_page", 10, type=int),
-            error_out=False,
+        if page is None:
+            try:
+                page = self.load_page()
+            except ValueError as error:
+                return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+            if isinstance(page, Response):
+                return page
+
+            if cache_key and cache_timeout is not None:
+                list_pages.set_page(cache_key, page, cache_timeout)
+
+        payload, validators = page
+
+        if validators and validators.is_fresh():
+            return validators.not_modified()
+
+        return payload, HTTPStatus.OK, validators.headers if validators else {}
+
+    def load_page(self) -> tuple[dict[str, Any], Validators | None] | Response:
+        """
+        Loads and serializes the requested page.
+
+        :return: The serialized page with its validators or the `304 Not Modified`.
+        :raise ValueError: When the query arguments are invalid.
+        """
+        cursor = request.args.get("cursor")
+        only = self.get_fields()
+        # Load exactly what the list item schema serializes.
+        self.query = self.query.options(
+            *schema_loader_options(
+                self.model,
+                self.model.schema.get(list_item=True, only=only),
+            ),
         )
+        self.apply_filters()
+        validators = self.get_validators()
+
+        if validators and validators.is_fresh():
+            return validators.not_modified()
+
+        if cursor is None:
+            items, pager = self.paginate_by_page()
+        else:
+            items, pager = self.paginate_by_cursor(cursor)
 
         sort, sort_direction = self.get_sort_and_direction()
 
         return {
-            "items": tuple(
-                map(
-                    lambda item: item.to_json(list_item=True),
-                    paginated_entities.items,
-                ),
-            ),
-            "pager": {
-                "total": paginated_entities.total,
-                "page": paginated_entities.page,
-                "per_page": paginated_entities.per_page,
-            },
+            "items": self.model.schema.serialize_many(items, list_item=True, only=only),
+            "pager": pager,
             "sort": [
                 {
                     "id": sort,
@@ -107,25 +231,387 @@ class RestfulListBase(EntityResource[_Entity], ABC):
                 },
             ],
             "filters": self.get_filters(),
+        }, validators
+
+    def get_validators(self) -> Validators | None:
+        """
+        The validators of the filtered list are the number of the entities
+        (changed by deletions) and the latest `updated_at` (changed by the
+        other writes). Both are selected by the single query that replaces
+        the `count(*)` of the `exact` total.
+
+        :return: The validators or `None` unless the total is `exact` (the other
+         modes avoid counting the list).
+        """
+        if self.get_total_mode() != "exact":
+            return None
+
+        # See https://github.com/sqlalchemy/sqlalchemy/issues/9189
+        # pylint: disable-next=not-callable
+        aggregates = (func.count(), func.max(self.model.updated_at))
+        self.filtered_count, last_modified = (
+            self.query.order_by(None).enable_eagerloads(False).with_entities(*aggregates).one()
+        )
+
+        return Validators.build(self.filtered_count, last_modified)
+
+    @authentication_required()
+    def export(self) -> Response | tuple[dict[str, Any], int]:
+        """
+        Streams the whole sorted and filtered entity list (the `GET` of the
+        `export` variant, e.g. `/projects/export?format=csv`).
+
+        The `format` query argument selects the `ndjson` (default) or `csv`
+        output and the `fields` limits the serialized fields.
+        """
+        if not self.model.can_be.viewed:
+            return {"message": "Access denied"}, HTTPStatus.FORBIDDEN
+
+        try:
+            export_format = get_export_format(request.args.get("format", "ndjson"))
+            schema = self.model.schema.get(list_item=True, only=self.get_fields())
+            dump = self.model.schema.get_dump(list_item=True, only=self.get_fields())
+            self.query = self.query.options(*schema_loader_options(self.model, schema))
+            self.apply_filters()
+            self.apply_sorting()
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        return export_response(
+            self.query,
+            tuple(schema.dump_fields),
+            dump,
+            export_format,
+            self.model.__name__.lower(),
+        )
+
+    @authentication_required()
+    def batch(self) -> tuple[dict[str, Any], int]:
+        """
+        Retrieves the entities by the IDs listed by the `ids` query argument
+        (the `GET` of the `batch` variant, e.g. `/projects/batch?ids=3,1,2`)
+        using a single query.
+
+        The `items` follow the order of the `ids` and have `null` for the
+        entities that don't exist (also listed by the `not_found`). Like the
+        `GET` of an entity, the items are serialized by the `item` schema
+        limited by the `fields`.
+        """
+        if not self.model.can_be.viewed:
+            return {"message": "Access denied"}, HTTPStatus.FORBIDDEN
+
+        only = self.get_fields()
+
+        try:
+            ids = self.get_ids()
+            schema = self.model.schema.get(only=only)
+            dump = self.model.schema.get_dump(only=only)
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        entities = {
+            entity.id: entity
+            for entity in self.model.query.options(*schema_loader_options(self.model, schema))
+            .filter(self.model.id.in_(ids))
+            .all()
+        }
+
+        return {
+            "items": [dump(entities[pk]) if pk in entities else None for pk in ids],
+            "not_found": [pk for pk in ids if pk not in entities],
+        }, HTTPStatus.OK
+
+    @authentication_required()
+    def facets(self) -> tuple[dict[str, Any], int]:
+        """
+        Counts the entities per value of the columns listed by the `facets`
+        query argument (the `GET` of the `facets` variant, e.g.
+        `/projects/facets?facets=status,author_id&title_filter=abc`).
+
+        The counts of a column are filtered by all the filters except the
+        filter by the column itself, so e.g. the status tabs get the numbers
+        of all statuses.
+        """
+        if not self.model.can_be.viewed:
+            return {"message": "Access denied"}, HTTPStatus.FORBIDDEN
+
+        names = tuple(
+            dict.fromkeys(
+                name.strip() for name in request.args.get("facets", "").split(",") if name.strip()
+            ),
+        )
+
+        try:
+            facets = self.count_facets(names)
+        except ValueError as error:
+            return {"message": str(error)}, HTTPStatus.BAD_REQUEST
+
+        return {
+            "facets": facets,
+            "filters": self.get_filters(),
         }, HTTPStatus.OK
 
-    def apply_filters(self) -> None:
-        """Apply filters"""
+    def count_facets(self, names: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Counts the entities per value of the columns by the single query
+        (the `UNION ALL` of a `GROUP BY` per column).
+
+        :param names: The names of the model columns.
+        :return: The values of every column with the numbers of the entities,
+         the most frequent first.
+        :raise ValueError: When a name is not one of the `facet_columns` or none is given.
+        """
+        if not names:
+            raise ValueError("The facets are not specified")
+
+        for name in names:
+            if name not in self.registry.facets:
+                raise ValueError(f"{name} facet is not supported")
+
+        queries = [self._count_facet(names, index) for index in range(len(names))]
+        facets: dict[str, list[dict[str, Any]]] = {name: [] for name in names}
+
+        for index, *values, count in queries[0].union_all(*queries[1:]).all():
+            facets[names[index]].append({"value": values[index], "count": count})
+
+        for counts in facets.values():
+            counts.sort(key=lambda item: (-item["count"], item["value"] is None, item["value"]))
+
+        return facets
+
+    def _count_facet(self, names: Sequence[str], index: int) -> orm.Query[Any]:
+        self.query = self.model.query
+        self.joins = QueryJoins()
+        self.apply_filters(exclude=(names[index],))
+        column = getattr(self.model, names[index])
+        # Every column has own position, so the values of the `UNION ALL` keep their types.
+        values = (
+            (column if position == index else cast(null(), getattr(self.model, name).type)).label(
+                f"value_{position}"
+            )
+            for position, name in enumerate(names)
+        )
+
+        return (
+            self.query.order_by(None)
+            .with_entities(
+                literal(index).label("facet"),
+                *values,
+                func.count().label("count"),  # pylint: disable=not-callable
+            )
+            .group_by(column)
+        )
+
+    @classmethod
+    def get_variants(cls) -> dict[str, type[Resource]]:
+        return {
+            **super().get_variants(),
+            "export": type(f"{cls.__name__}Export", (cls,), {"get": cls.export}),
+            "facets": type(f"{cls.__name__}Facets", (cls,), {"get": cls.facets}),
+            "batch": type(f"{cls.__name__}Batch", (cls,), {"get": cls.batch}),
+        }
+
+    def paginate_by_page(self) -> tuple[list[_Entity], dict[str, Any]]:
+        """
+        Sorts the list and selects the page using `OFFSET`.
+
+        :return: The entities of the page and the pager.
+        """
+        filtered_query = self.query
+        self.apply_sorting()
+        total_mode = self.get_total_mode()
+        # The joins the ordering only needs don't change the number of rows, so count without them.
+        count = (
+            total_mode == "exact" and not self.joins.sorting_only and self.filtered_count is None
+        )
+
+        if total_mode == "none":
+            page = max(request.args.get("page", 1, type=int), 1)
+            per_page = self.get_per_page()
+            items = self.query.limit(per_page + 1).offset((page - 1) * per_page).all()
+
+            return items[:per_page], {
+                "total": None,
+                "page": page,
+                "per_page": per_page,
+                "has_next": len(items) > per_page,
+                "total_mode": total_mode,
+            }
+
+        paginated_entities = self.query.paginate(
+            page=request.args.get("page", 1, type=int),
+            per_page=self.get_per_page(),
+            error_out=False,
+            count=count,
+        )
+
+        if count:
+            total = paginated_entities.total
+        else:
+            total, total_mode = self.get_total(filtered_query)
+
+        return paginated_entities.items, {
+            "total": total,
+            "page": paginated_entities.page,
+            "per_page": paginated_entities.per_page,
+            "total_mode": total_mode,
+        }
+
+    def paginate_by_cursor(self, token: str) -> tuple[list[_Entity], dict[str, Any]]:
+        """
+        Sorts the list and selects the page using the keyset (seek) condition.
+
+        :param token: The encoded cursor. An empty value requests the first page.
+        :return: The entities of the page and the pager.
+        :raise ValueError: When the cursor is malformed or doesn't match the sort.
+        """
+        sort, sort_direction = self.get_sort_and_direction()
+
+        if sort is None or sort_direction is None:
+            raise ValueError("The cursor pagination requires sorting")
+
+        self._assert_sort_direction(sort_direction)
+
+        if sort in self.get_special_sorting():
+            raise ValueError(f"{sort} sort does not support the cursor pagination")
+
+        cursor = Cursor.decode(token) if token else None
+
+        if cursor and (cursor.sort, cursor.direction) != (sort, sort_direction):
+            raise ValueError("The cursor does not match the sort")
+
+        sort_key = self.get_sort_key(sort)
+        per_page = self.get_per_page()
+        backward = bool(cursor and cursor.backward)
+        ascending = (sort_direction == "asc") != backward
+        total, total_mode = self.get_total(self.query)
+        query = sort_key.apply(self.query, self.joins)
+
+        if cursor:
+            query = query.filter(
+                _seek_condition(sort_key.expression, self.model.id, cursor, ascending),
+            )
+
+        rows = (
+            query.add_columns(sort_key.expression)
+            .order_by(None)
+            .order_by(*_ordering(sort_key.expression, self.model.id, ascending))
+            .limit(per_page + 1)
+            .all()
+        )
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        if backward:
+            rows.reverse()
+
+        def encode(index: int, is_backward: bool) -> str:
+            item, value = rows[index]
+            return Cursor(sort, sort_direction, value, item.id, is_backward).encode()
+
+        return [row[0] for row in rows], {
+            "total": total,
+            "total_mode": total_mode,
+            "per_page": per_page,
+            "next_cursor": encode(-1, False) if rows and (backward or has_more) else None,
+            "prev_cursor": encode(0, True) if rows and (has_more if backward else cursor) else None,
+        }
+
+    def get_total(self, query: Query) -> tuple[int | None, TotalMode]:
+        """
+        :param query: The filtered list query.
+        :return: The total number of the list items and the mode that produced it.
+        """
+        total_mode = self.get_total_mode()
+
+        if total_mode == "none":
+            return None, total_mode
+
+        if total_mode == "estimate":
+            return self.estimate_total(query)
+
+        if self.filtered_count is not None:
+            return self.filtered_count, total_mode
+
+        return query.order_by(None).count(), total_mode
+
+    @staticmethod
+    def estimate_total(query: Query) -> tuple[int, TotalMode]:
+        """
+        :param query: The filtered list query.
+        :return: The planner's estimate of the number of rows or the exact
+         number when the estimate is unavailable or small.
+        """
+        estimate = _estimate_count(query)
+
+        if estimate is None or estimate < _EXACT_TOTAL_THRESHOLD:
+            return query.order_by(None).count(), "exact"
+
+        return estimate, "estimate"
+
+    def get_total_mode(self) -> TotalMode:
+        """
+        :return: The requested total mode.
+        :raise ValueError: When the mode is unknown.
+        """
+        total_mode = request.args.get("total", self.total_mode)
+
+        if total_mode not in _TOTAL_MODES:
+            raise ValueError(f"{total_mode} total is not supported")
+
+        return total_mode  # type: ignore[return-value]
+
+    @staticmethod
+    def get_ids() -> list[int]:
+        """
+        :return: The IDs requested by the `ids` query argument (e.g. `?ids=3,1,2`).
+        :raise ValueError: When an ID is not a number or there are no IDs or too many.
+        """
+        values = [value.strip() for value in request.args.get("ids", "").split(",")]
+        values = [value for value in values if value]
+
+        if not 0 < len(values) <= _MAX_PER_PAGE:
+            raise ValueError(f"The number of ids must be from 1 to {_MAX_PER_PAGE}")
+
+        if not all(value.isdigit() for value in values):
+            raise ValueError("The ids must be positive integers")
+
+        return list(map(int, values))
+
+    @staticmethod
+    def get_per_page() -> int:
+        """
+        :return: The requested page size.
+        """
+        return min(max(request.args.get("per_page", 10, type=int), 1), _MAX_PER_PAGE)
+
+    def apply_filters(self, exclude: Collection[str] = ()) -> None:
+        """
+        Apply filters
+
+        :param exclude: The names of the filters to skip (e.g. `status`
+         for the `status_filter`).
+        """
 
         filters = self.get_filters()
-        special_filters = {**self._filters, **self.get_special_filters()}
+        special_filters = self.get_special_filters()
 
         for filter_key, filter_value in filters.items():
-            attribute = filter_key.replace("_filter", "")
+            attribute = filter_key.removesuffix("_filter")
+
+            if attribute in exclude:
+                continue
 
             if attribute in special_filters:
                 self.query = special_filters[attribute](
                     self.query,
                     filter_value,
                 )
-            elif hasattr(self.model, attribute):
-                self.query = self.query.filter(
-                    getattr(self.model, attribute).ilike(f"%{filter_value}%"),
+            elif attribute in self.registry.filters:
+                self.query = self.registry.filters[attribute].apply(
+                    self.query,
+                    filter_value,
+                    self.joins,
                 )
             else:
                 raise ValueError(f"{filter_key} filter is not supported")
@@ -136,23 +622,36 @@ class RestfulListBase(EntityResource[_Entity], ABC):
         sort, sort_direction = self.get_sort_and_direction()
 
         if sort_direction is not None and sort is not None:
-            if sort_direction not in ["asc", "desc"]:
-                raise ValueError(f"{sort_direction} sort order is not supported")
+            self._assert_sort_direction(sort_direction)
 
-            special_sorting = {**self._sorting, **self.get_special_sorting()}
+            special_sorting = self.get_special_sorting()
 
             if sort in special_sorting:
                 self.query = special_sorting[sort](
                     self.query,
                     sort_direction,
                 )
-            elif hasattr(self.model, sort):
-                sort_column = getattr(self.model, sort)
-                self.query = self.query.order_by(
-                    getattr(sort_column, sort_direction)(),
-                )
             else:
-                raise ValueError(f"{sort} sort is not supported")
+                sort_key = self.get_sort_key(sort)
+                self.query = sort_key.apply(self.query, self.joins).order_by(
+                    getattr(sort_key.expression, sort_direction)(),
+                )
+
+    def get_sort_key(self, sort: str) -> SortKey:
+        """
+        :param sort: The name of the sort.
+        :return: The sort key.
+        :raise ValueError: When the sort is unknown.
+        """
+        special_sort_keys = self.get_special_sort_keys()
+
+        if sort in special_sort_keys:
+            return special_sort_keys[sort]
+
+        if sort in self.registry.sort_keys:
+            return self.registry.sort_keys[sort]
+
+        raise ValueError(f"{sort} sort is not supported")
 
     def get_sort_and_direction(self) -> tuple[str | None, SortOrder | None]:
         """Get sort and direction strings"""
@@ -188,3 +687,140 @@ class RestfulListBase(EntityResource[_Entity], ABC):
     def get_special_sorting(self) -> Queries:
         """Get special sorting"""
         return {}
+
+    def get_special_sort_keys(self) -> dict[str, SortKey]:
+        """Get special sort keys (supported by both `page` and `cursor` pagination)"""
+        return {}
+
+    @staticmethod
+    def _assert_sort_direction(sort_direction: str) -> None:
+        if sort_direction not in ["asc", "desc"]:
+            raise ValueError(f"{sort_direction} sort order is not supported")
+
+
+def _build_registry(cls: type[RestfulListBase[Any]], model: type[Any]) -> ListRegistry:
+    # The deferred and generated columns (e.g. the search document) are for the
+    # dedicated query arguments only, their values aren't comparable to text.
+    columns = [
+        column
+        for column in inspect(model).column_attrs
+        if not column.deferred and all(item.computed is None for item in column.columns)
+    ]
+    filters: dict[str, Filter] = {
+        column.key: Filter(getattr(model, column.key), "ilike") for column in columns
+    }
+    sort_keys: dict[str, SortKey] = {
+        column.key: SortKey(getattr(model, column.key)) for column in columns
+    }
+
+    if issubclass(model, HasAuthor):
+        user_alias = aliased(User)
+        filters["author_name"] = Filter(user_alias.name, "ilike", join=user_alias)
+        sort_keys["author_name"] = SortKey(user_alias.name, join=user_alias)
+
+    if issubclass(model, HasTimestamps):
+        # The half-open ranges on the raw columns (rather than `date(column)`)
+        # let the database use the indexes.
+        for prefix, column in (("created", model.created_at), ("updated", model.updated_at)):
+            filters[f"{prefix}_from"] = Filter(column, "gte", parse=_parse_timestamp)
+            filters[f"{prefix}_to"] = Filter(
+                column,
+                "lt",
+                parse=partial(_parse_timestamp, upper=True),
+            )
+
+    column_keys = {column.key for column in columns}
+
+    for name in cls.facet_columns:
+        if name not in column_keys:
+            raise ValueError(f"{name} facet is not a column of {model.__name__}")
+
+    return ListRegistry(
+        filters={**filters, **cls.filters},
+        sort_keys={**sort_keys, **cls.sort_keys},
+        facets=cls.facet_columns,
+    )
+
+
+def _parse_timestamp(value: QueryArgs, upper: bool = False) -> datetime:
+    """
+    :param value: The ISO 8601 date (`2024-05-17`) or datetime, optionally with
+     the UTC offset (`2024-05-17T10:00:00+02:00`).
+    :param upper: Whether the value is the exclusive upper bound of a range. The
+     date-only upper bound is moved to the start of the next day to include the
+     whole day.
+    :return: The naive UTC datetime that matches the `HasTimestamps` columns.
+    :raise ValueError: When the value is not a date.
+    """
+    try:
+        timestamp = datetime.fromisoformat(str(value))
+    except ValueError as error:
+        raise ValueError(f"{value} is not a valid date") from error
+
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+    if upper and len(str(value)) <= len("YYYY-MM-DD"):
+        timestamp += timedelta(days=1)
+
+    return timestamp
+
+
+def _estimate_count(query: Query) -> int | None:
+    connection = query.session.connection()
+
+    if connection.dialect.name != "postgresql":
+        return None
+
+    # The eager loaded relationships don't change the number of rows.
+    statement = query.order_by(None).enable_eagerloads(False).statement
+    assert isinstance(statement, Select)
+    froms = statement.get_final_froms()
+
+    # The unfiltered single table lists are estimated using the statistics.
+    if statement.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        reltuples = connection.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": connection.dialect.identifier_preparer.format_table(froms[0])},
+        ).scalar()
+
+        # The `-1` means the table has never been analyzed.
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    # The `IN` lists are expanded on execution thus have to be rendered for the `EXPLAIN`.
+    compiled = statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    assert isinstance(plan, list)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _ordering(key: Any, pk: Any, ascending: bool) -> tuple[Any, Any]:
+    # The `NULL` keys are the greatest values in both directions (the
+    # PostgreSQL default), so the seek condition stays consistent.
+    if ascending:
+        return key.asc().nulls_last(), pk.asc()
+
+    return key.desc().nulls_first(), pk.desc()
+
+
+def _seek_condition(key: Any, pk: Any, cursor: Cursor, ascending: bool) -> Any:
+    if cursor.value is None:
+        if ascending:
+            return and_(key.is_(None), pk > cursor.id)
+
+        return or_(and_(key.is_(None), pk < cursor.id), key.is_not(None))
+
+    boundary = tuple_(literal(cursor.value, key.type), literal(cursor.id, pk.type))
+
+    if not ascending:
+        return tuple_(key, pk) < boundary
+
+    if getattr(key, "nullable", True):
+        return or_(tuple_(key, pk) > boundary, key.is_(None))
+
+    return tuple_(key, pk) > boundary
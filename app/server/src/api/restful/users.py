@@ -1,5 +1,6 @@
 from http import HTTPStatus
 
+from flask import request
 from flask_login import current_user
 
 from api.principal import authentication_required
@@ -7,7 +8,8 @@ from api.models.user import User, UserStatus
 
 from .restful_api import EntityResource, JsonResponse, resource
 from .restful_base import RestfulBase
-from .restful_list_base import RestfulListBase, QueryArgs, Queries
+from .list_registry import Filter
+from .restful_list_base import RestfulListBase, QueryArgs
 
 
 @resource("/users")
@@ -21,18 +23,19 @@ class UserListResource(RestfulListBase[User]):
         "direction": "asc",
     }
 
+    filters = {
+        "role": Filter(User.role),
+        "status": Filter(User.status),
+    }
+
+    facet_columns = ("role", "status")
+
     @staticmethod
     def get_default_filters() -> dict[str, QueryArgs]:
         return {
             "status_filter": UserStatus.ACTIVE.value,
         }
 
-    def get_special_filters(self) -> Queries:
-        return {
-            "role": lambda q, s: q.filter(self.model.role == s),
-            "status": lambda q, s: q.filter(self.model.status == s),
-        }
-
 
 @resource("/users", "/users/<int:entity_id>")
 class UserResource(RestfulBase[User]):
@@ -56,6 +59,19 @@ class UserResource(RestfulBase[User]):
         # it due to the use of the class-level decorators.
         return super().delete(entity_id)  # type: ignore
 
+    @authentication_required()
+    def bulk_update(self) -> JsonResponse:
+        items = request.get_json()
+
+        if isinstance(items, list) and any(
+            isinstance(item, dict) and item.get("id") == current_user.id for item in items
+        ):
+            return {"message": "Users can't edit their own profiles"}, HTTPStatus.FORBIDDEN
+
+        # Note: the type is ignored because MyPy doesn't see
+        # it due to the use of the class-level decorators.
+        return super().bulk_update()  # type: ignore
+
     def _process_upsert_request(self, data: dict, entity: User | None) -> None:
         is_active = data.get("is_active", None)
 
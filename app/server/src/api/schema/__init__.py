@@ -1,7 +1,10 @@
+from .compiled import Dump, compile_dump
 from .dict_defaults import DictDefaults
 from .schema import Schema
 
 __all__ = [
+    "Dump",
     "DictDefaults",
     "Schema",
+    "compile_dump",
 ]
@@ -0,0 +1,93 @@
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from types import ModuleType
+from typing import Any
+from uuid import UUID
+
+from flask import Response, current_app, make_response
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    # The platforms without the `orjson` wheels use the stdlib encoder.
+    _orjson = None  # type: ignore[assignment]
+
+orjson: ModuleType | None = _orjson
+"""The fast encoder or `None` when it's not installed."""
+
+
+def default(value: Any) -> Any:
+    """
+    The `default` of the stdlib `json.dumps` that encodes the values `orjson`
+    encodes natively, the same way (e.g. the `updated_at` of the entity and
+    the `ProjectStatus`).
+
+    :param value: The value the stdlib encoder doesn't support.
+    :return: The encodable value.
+    :raise TypeError: When the value isn't supported by either encoder.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, UUID):
+        return str(value)
+
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Encodes the data by `orjson`, if installed, or the stdlib `json`.
+
+    Unlike the `json.dumps` defaults, the output is compact UTF-8 (the
+    non-ASCII characters aren't escaped).
+
+    :param data: The data to encode.
+    :param indent: The state of whether to indent the output by 2 spaces.
+    :return: The JSON.
+    """
+    if orjson is None:
+        return dumps_stdlib(data, indent)
+
+    encoded: bytes = orjson.dumps(
+        data,
+        default=default,
+        option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0),
+    )
+
+    return encoded
+
+
+def dumps_stdlib(data: Any, indent: bool = False) -> bytes:
+    """
+    The stdlib fallback of the `dumps`.
+    """
+    return json.dumps(
+        data,
+        default=default,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode()
+
+
+def output_json(data: Any, code: int, headers: dict | None = None) -> Response:
+    """
+    The `application/json` representation of the RESTful resources (replaces
+    the `flask_restful.representations.json.output_json`).
+
+    The output is indented in the debug mode.
+    """
+    return make_response(dumps(data, indent=current_app.debug) + b"\n", code, headers or {})
+
+
+__all__ = [
+    "default",
+    "dumps",
+    "dumps_stdlib",
+    "output_json",
+]
@@ -0,0 +1,69 @@
+from json import dumps as json_dumps, loads as json_loads
+from math import ceil
+from pathlib import Path
+from typing import Sequence, TypeAlias
+
+
+Results: TypeAlias = dict[str, dict[str, float]]
+"""The `p50`/`p95` milliseconds by the scenario name."""
+
+
+def percentile(timings: Sequence[float], rank: int) -> float:
+    """
+    :param timings: The measured durations.
+    :param rank: The percentile (e.g. `95`).
+    :return: The nearest-rank percentile of the `timings`.
+    """
+    ordered = sorted(timings)
+
+    return ordered[max(ceil(len(ordered) * rank / 100), 1) - 1]
+
+
+def summarize(timings: Sequence[float]) -> dict[str, float]:
+    """
+    :param timings: The measured durations in seconds.
+    :return: The `p50` and `p95` in milliseconds.
+    """
+    return {
+        "p50": round(percentile(timings, 50) * 1000, 3),
+        "p95": round(percentile(timings, 95) * 1000, 3),
+    }
+
+
+def save(path: Path, results: Results) -> None:
+    """
+    Adds the results to the baseline file (the scenarios measured again
+    are replaced).
+    """
+    baseline = load(path) if path.exists() else {}
+    baseline.update(results)
+    path.write_text(json_dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> Results:
+    baseline: Results = json_loads(path.read_text())
+
+    return baseline
+
+
+def compare(baseline: Results, results: Results, threshold: float) -> list[str]:
+    """
+    :param baseline: The results to compare with.
+    :param results: The current results.
+    :param threshold: The allowed slowdown (e.g. `0.2` for 20%).
+    :return: The descriptions of the regressions (the scenarios that aren't
+     in the baseline are skipped).
+    """
+    regressions = []
+
+    for name, current in sorted(results.items()):
+        for metric, value in current.items():
+            expected = baseline.get(name, {}).get(metric)
+
+            if expected and value > expected * (1 + threshold):
+                regressions.append(
+                    f"{name} {metric}: {value:.2f} ms, the baseline is {expected:.2f} ms "
+                    f"(+{(value / expected - 1) * 100:.0f}%)"
+                )
+
+    return regressions
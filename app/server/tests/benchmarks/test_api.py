@@ -0,0 +1,160 @@
+from itertools import count
+from os import environ
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Generator
+
+from flask.testing import FlaskClient
+from pytest import fixture
+from sqlalchemy import select, text
+from _pytest.fixtures import SubRequest
+
+from api.config import Config
+from api.database import db
+from api.database.seeder import WORDS, Seeder
+from api.models.project import Project, ProjectStatus
+
+from . import baseline
+from .conftest import create_benchmark_app
+
+
+_SIZES = tuple(int(size) for size in environ.get("BENCHMARK_SIZES", "10000,100000").split(","))
+_REPEAT = int(environ.get("BENCHMARK_REPEAT", 50))
+_WARMUP = 5
+_BATCH = 10_000
+_FAKE_USER_INFO = {
+    "email": "benchmark.api@gmail.com",
+    "custom:ntid": "benchapi",
+    "name": "Benchmark",
+    "family_name": "User",
+}
+
+
+def _seed(size: int) -> None:
+    """
+    Seeds the `size` projects and a tenth as many users (the authors).
+    """
+    Seeder(seed=size, batch=_BATCH).populate(users=max(size // 10, 1), projects=size)
+    db.session.commit()
+
+    if db.engine.dialect.name == "postgresql":
+        with db.engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("VACUUM ANALYZE"),
+            )
+
+
+@fixture(name="dataset", scope="module", params=_SIZES, ids=lambda size: f"{size}")
+def dataset_fixture(request: SubRequest) -> Generator[tuple[FlaskClient, int], None, None]:
+    """
+    The size of the dataset and the client of the app seeded with it,
+    logged in as the admin by the `/auth/cognito/fake` (the Cognito is
+    disabled).
+    """
+    app = create_benchmark_app(
+        FAKE_USER_INFO=_FAKE_USER_INFO,
+        ADMIN_USERS=(_FAKE_USER_INFO["email"],),
+        AWS_COGNITO_COOKIE_AGE_SECONDS=Config.AWS_COGNITO_COOKIE_AGE_SECONDS,
+        SESSION_COOKIE_NAME_AUTH=Config.SESSION_COOKIE_NAME_AUTH,
+    )
+
+    with app.app_context():
+        _seed(request.param)
+
+    client = app.test_client()
+    assert client.get("/auth/cognito/fake").status_code == 302
+
+    yield client, request.param
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def _measure(run: Callable[[int], Any]) -> dict[str, float]:
+    iteration = count()
+    timings = []
+
+    for _ in range(_WARMUP):
+        run(next(iteration))
+
+    for _ in range(_REPEAT):
+        index = next(iteration)
+        started = perf_counter()
+        run(index)
+        timings.append(perf_counter() - started)
+
+    return baseline.summarize(timings)
+
+
+def _get(client: FlaskClient, url: str) -> Callable[[int], None]:
+    def run(_: int) -> None:
+        response = client.get(url)
+        assert response.status_code == 200, response.data
+
+    return run
+
+
+def _get_scenarios(client: FlaskClient, size: int) -> dict[str, Callable[[int], None]]:
+    with client.application.app_context():
+        drafts = db.session.scalars(
+            select(Project.id)
+            .where(Project.status == ProjectStatus.DRAFT.value)
+            .limit(_WARMUP + _REPEAT)
+        ).all()
+
+    assert len(drafts) == _WARMUP + _REPEAT, "The dataset is too small"
+
+    def get_item(index: int) -> None:
+        assert client.get(f"/projects/{drafts[index]}").status_code == 200
+
+    def put_item(index: int) -> None:
+        response = client.put(f"/projects/{drafts[index]}", json={"title": f"Changed {index}"})
+        assert response.status_code == 200, response.data
+
+    def transition(index: int) -> None:
+        response = client.put(f"/projects/{drafts[index]}/transition/complete")
+        assert response.status_code == 200, response.data
+
+    return {
+        "list page 1": _get(client, "/projects"),
+        "list page 10": _get(client, "/projects?page=10"),
+        "list page 100": _get(client, "/projects?page=100"),
+        "list middle page": _get(client, f"/projects?page={size // 20}"),
+        "list cursor": _get(client, "/projects?cursor=&total=none"),
+        "filter status": _get(client, f"/projects?status_filter={ProjectStatus.COMPLETED.value}"),
+        "filter title": _get(client, f"/projects?title_filter={WORDS[0]}"),
+        "filter author": _get(client, "/projects?author_name_filter=smith"),
+        "sort title": _get(client, "/projects?sort=title&order=asc"),
+        "sort author": _get(client, "/projects?sort=author_name&order=desc"),
+        "sort updated": _get(client, "/projects?sort=updated_at&order=desc"),
+        "users list": _get(client, "/users"),
+        "item get": get_item,
+        "item put": put_item,
+        # Every project is transitioned once, after the `put` has changed it.
+        "transition": transition,
+    }
+
+
+def test_api(dataset: tuple[FlaskClient, int]) -> None:
+    client, size = dataset
+    results = {
+        f"{size} {name}": _measure(run) for name, run in _get_scenarios(client, size).items()
+    }
+
+    print(f"\n{size} projects, {_REPEAT} requests per scenario:")
+
+    for name, metrics in results.items():
+        print(f"  {name:<32} p50 {metrics['p50']:8.2f} ms  p95 {metrics['p95']:8.2f} ms")
+
+    if environ.get("BENCHMARK_SAVE"):
+        baseline.save(Path(environ["BENCHMARK_SAVE"]), results)
+
+    if environ.get("BENCHMARK_COMPARE"):
+        regressions = baseline.compare(
+            baseline.load(Path(environ["BENCHMARK_COMPARE"])),
+            results,
+            float(environ.get("BENCHMARK_THRESHOLD", 0.2)),
+        )
+
+        assert not regressions, "\n".join(["The regressions:", *regressions])
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from . import baseline
+
+
+def test_summarize() -> None:
+    timings = [index / 1000 for index in range(1, 101)]
+
+    assert baseline.percentile(timings, 50) == 0.05
+    assert baseline.percentile(timings, 95) == 0.095
+    assert baseline.percentile([0.001], 95) == 0.001
+    assert baseline.summarize(list(reversed(timings))) == {"p50": 50.0, "p95": 95.0}
+
+
+def test_compare(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    baseline.save(path, {"list": {"p50": 10.0, "p95": 20.0}, "item": {"p50": 2.0, "p95": 4.0}})
+    baseline.save(path, {"item": {"p50": 1.0, "p95": 2.0}})
+
+    assert baseline.load(path) == {
+        "list": {"p50": 10.0, "p95": 20.0},
+        "item": {"p50": 1.0, "p95": 2.0},
+    }
+    assert not baseline.compare(
+        baseline.load(path),
+        {"list": {"p50": 11.9, "p95": 20.0}, "new": {"p50": 100.0, "p95": 100.0}},
+        0.2,
+    )
+    assert baseline.compare(
+        baseline.load(path),
+        {"list": {"p50": 12.5, "p95": 19.0}, "item": {"p50": 1.0, "p95": 3.0}},
+        0.2,
+    ) == [
+        "item p95: 3.00 ms, the baseline is 2.00 ms (+50%)",
+        "list p50: 12.50 ms, the baseline is 10.00 ms (+25%)",
+    ]
@@ -0,0 +1,85 @@
+from os import environ
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+from unittest.mock import patch
+
+from flask import Flask
+from flask_restful.representations.json import output_json as output_json_restful
+from pytest import mark
+from sqlalchemy import insert
+
+from api.database import db
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.utils import json_encoder
+
+from ..conftest import configure_app_fixture
+
+
+pytestmark = mark.skipif(not environ.get("BENCHMARK"), reason="The BENCHMARK is not set")
+
+_ITEMS = 1000
+_REPEAT = 50
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="benchmark02",
+        email="benchmark.encoder@gmail.com",
+        name="Encoder Author",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _measure(fn: Callable[[], Any]) -> float:
+    timings = []
+
+    for _ in range(_REPEAT):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+
+    return median(timings) * 1000
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_json_representation(app: Flask) -> None:
+    author = User.query.one()
+    db.session.execute(
+        insert(Project),
+        [
+            {
+                "title": f"Project {index}",
+                "description": "Description " * 20,
+                "status": "draft",
+                "author_id": author.id,
+            }
+            for index in range(_ITEMS)
+        ],
+    )
+    db.session.commit()
+
+    response = app.test_client().get(f"/projects?per_page={_ITEMS}")
+    page = response.json
+
+    assert response.status_code == 200
+    assert isinstance(page, dict) and len(page["items"]) == _ITEMS
+
+    with app.test_request_context():
+        results = {
+            "flask-restful (stdlib json)": _measure(lambda: output_json_restful(page, 200)),
+            "output_json": _measure(lambda: json_encoder.output_json(page, 200)),
+        }
+
+        with patch.object(json_encoder, "orjson", None):
+            results["output_json (stdlib fallback)"] = _measure(
+                lambda: json_encoder.output_json(page, 200),
+            )
+
+    print(f"\n/projects page of {_ITEMS} items, median of {_REPEAT} encodings:")
+
+    for name, milliseconds in results.items():
+        print(f"  {name:<32} {milliseconds:8.2f} ms")
@@ -0,0 +1,69 @@
+from os import environ
+from time import perf_counter
+
+from flask import Flask
+from pytest import mark
+
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.projects import ProjectListResource
+
+from ..conftest import configure_app_fixture
+
+
+pytestmark = mark.skipif(not environ.get("BENCHMARK"), reason="The BENCHMARK is not set")
+
+_DURATION = float(environ.get("BENCHMARK_DURATION", 2))
+_URLS = (
+    "/projects",
+    "/projects?title_filter=project&sort=title&order=asc",
+    "/projects?author_name_filter=author&created_from_filter=2024-01-01&sort=author_name",
+)
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="benchmark01",
+        email="benchmark.user@gmail.com",
+        name="Benchmark Author",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _rate(fn: object) -> float:
+    assert callable(fn)
+    count = 0
+    started = perf_counter()
+
+    while perf_counter() - started < _DURATION:
+        fn()
+        count += 1
+
+    return count / (perf_counter() - started)
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_list_requests(app: Flask) -> None:
+    for index in range(20):
+        Project(title=f"Project {index}", description="Description").save()
+
+    client = app.test_client()
+    print(f"\nRequests per second ({_DURATION}s per measurement):")
+
+    for url in _URLS:
+
+        def build_query(target: str = url) -> None:
+            # The per-request path of the resource without the database round trips.
+            with app.test_request_context(target):
+                resource = ProjectListResource()
+                resource.apply_filters()
+                resource.apply_sorting()
+
+        def request(target: str = url) -> None:
+            assert client.get(target).status_code == 200
+
+        print(f"  {url}")
+        print(f"    query building  {_rate(build_query):10.0f}")
+        print(f"    HTTP request    {_rate(request):10.0f}")
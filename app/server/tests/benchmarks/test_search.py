@@ -0,0 +1,85 @@
+from json import loads as json_loads
+from os import environ
+from random import Random
+from statistics import median
+from time import perf_counter
+
+from flask import Flask
+from flask.testing import FlaskClient
+from pytest import mark
+from sqlalchemy import insert, text
+
+from api.database import db
+from api.models.project import Project, ProjectStatus
+
+
+_PROJECTS = int(environ.get("BENCHMARK_PROJECTS", 100_000))
+_REPEAT = 20
+_SYLLABLES = ("ka", "lo", "mi", "ne", "po", "ru", "sa", "ti", "vu", "xe", "yo", "zi")
+_WORDS = tuple(f"{a}{b}{c}" for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES)
+# The word frequencies follow the Zipf's law, like in a natural language text.
+_WEIGHTS = tuple(1 / rank for rank in range(1, len(_WORDS) + 1))
+
+
+def _seed() -> None:
+    rnd = Random(0)
+    statuses = [status.value for status in ProjectStatus]
+    batch = 10_000
+
+    for start in range(0, _PROJECTS, batch):
+        db.session.execute(
+            insert(Project),
+            [
+                {
+                    "title": " ".join(rnd.choices(_WORDS, _WEIGHTS, k=3)),
+                    "description": " ".join(rnd.choices(_WORDS, _WEIGHTS, k=40)),
+                    "status": rnd.choice(statuses),
+                }
+                for _ in range(min(batch, _PROJECTS - start))
+            ],
+        )
+
+    db.session.commit()
+
+    if db.engine.dialect.name == "postgresql":
+        with db.engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("VACUUM ANALYZE project"),
+            )
+
+
+def _measure(client: FlaskClient, url: str) -> tuple[float, int]:
+    timings = []
+    total = 0
+
+    for _ in range(_REPEAT):
+        started = perf_counter()
+        response = client.get(url)
+        timings.append(perf_counter() - started)
+        assert response.status_code == 200
+        total = json_loads(response.data)["pager"]["total"]
+
+    return median(timings) * 1000, total
+
+
+# The frequent and the rare words.
+@mark.parametrize("word", (_WORDS[0], _WORDS[500]))
+def test_search_vs_ilike(benchmark_app: Flask, word: str) -> None:
+    if not Project.query.count():
+        _seed()
+
+    client = benchmark_app.test_client()
+    results = {
+        "ILIKE title": _measure(client, f"/projects?title_filter={word}&total=exact"),
+        "ILIKE description": _measure(client, f"/projects?description_filter={word}&total=exact"),
+        "FTS title+description": _measure(client, f"/projects?q={word}&total=exact"),
+        "FTS title+description (sort=title)": _measure(
+            client,
+            f"/projects?q={word}&sort=title&order=asc&total=exact",
+        ),
+    }
+
+    print(f"\n{_PROJECTS} projects, `{word}`, median of {_REPEAT} requests:")
+
+    for name, (milliseconds, total) in results.items():
+        print(f"  {name:<40} {milliseconds:8.2f} ms {total:>8} matches")
@@ -0,0 +1,135 @@
+import gzip
+import zlib
+from typing import Iterator
+
+from flask import Flask, Response, stream_with_context
+from pytest import mark
+
+from api.compression import CompressionMiddleware, get_encoders, negotiate
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import configure_app_fixture
+
+
+_ENCODINGS = {"zstd": None, "br": None, "gzip": None}
+
+
+@mark.parametrize(
+    ("accept_encoding", "expected"),
+    (
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("GZIP;q=0.1, br;q=0.1", "br"),
+        ("*", "zstd"),
+        ("*;q=0.5, zstd;q=0", "br"),
+        ("gzip;q=0", None),
+        ("gzip;q=abc", None),
+    ),
+)
+def test_negotiate(accept_encoding: str, expected: str | None) -> None:
+    assert negotiate(accept_encoding, _ENCODINGS) == expected
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="compression01",
+        email="compression.user@gmail.com",
+        name="Compression User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_compressed_responses(app: Flask) -> None:
+    for index in range(20):
+        Project(title=f"Project {index}", description="Description").save()
+
+    client = app.test_client()
+    plain = client.get("/projects")
+    response = client.get("/projects", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Cookie, Accept-Encoding"
+    assert "Content-Length" not in response.headers
+    assert response.headers["ETag"] == f"W/{plain.headers['ETag']}"
+    assert gzip.decompress(response.data) == plain.data
+    assert len(response.data) < len(plain.data)
+
+    # The weak tag of the compressed response validates the cache.
+    response = client.get(
+        "/projects",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.status_code == 304
+    assert "Content-Encoding" not in response.headers
+
+    # Smaller than the `COMPRESSION_MIN_SIZE`.
+    response = client.get("/projects?per_page=1", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+
+    # The streamed export.
+    plain = client.get("/projects/export")
+    response = client.get("/projects/export", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == plain.data
+
+
+def test_streamed_and_skipped_responses() -> None:
+    app = Flask(__name__)
+    closed = []
+
+    @app.route("/stream")
+    def stream() -> Response:
+        def generate() -> Iterator[str]:
+            try:
+                for index in range(3):
+                    yield f'{{"line": {index}}}\n'
+            finally:
+                closed.append(True)
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+    @app.route("/document.pdf")
+    def document() -> Response:
+        return Response(b"%PDF-1.4" * 1000, mimetype="application/pdf")
+
+    app.wsgi_app = CompressionMiddleware(  # type: ignore[method-assign]
+        app.wsgi_app,
+        encoders=get_encoders(),
+        minimum_size=500,
+        level=6,
+    )
+    client = app.test_client()
+
+    # Every line is decodable as soon as it's sent.
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"}, buffered=False)
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = [decoder.decompress(chunk) for chunk in response.response]
+    response.close()
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert lines[:3] == [b'{"line": 0}\n', b'{"line": 1}\n', b'{"line": 2}\n']
+    assert b"".join(lines) + decoder.flush() == b"".join(lines[:3])
+    assert closed == [True]
+
+    # The compressed files are served as is.
+    response = client.get("/document.pdf", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.data == b"%PDF-1.4" * 1000
+
+    # As well as the responses of the `HEAD` requests.
+    response = client.head("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
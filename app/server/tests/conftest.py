@@ -1,7 +1,9 @@
-from typing import Callable, Generator, Literal
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Literal
 
 from flask import g, Flask, Request
 from pytest import fixture, mark
+from sqlalchemy import event
 from _pytest.fixtures import SubRequest, MarkDecorator
 
 from api import create_app
@@ -92,3 +94,48 @@ def configure_app_fixture(
         ),
         indirect=["app"],
     )
+
+
+@contextmanager
+def capture_statements() -> Generator[list[str], None, None]:
+    """
+    Collects the SQL statements executed within the context.
+
+    Example:
+        >>> with capture_statements() as statements:
+        >>>     app.test_client().get("/projects")
+        >>>
+        >>> assert len(statements) == 2
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def query_budget(budget: int) -> Generator[list[str], None, None]:
+    """
+    Fails when more than `budget` SQL statements are executed within the
+    context (e.g. the N+1 lazy loads of the list items), listing them all.
+
+    Example:
+        >>> with query_budget(2):
+        >>>     app.test_client().get("/projects")
+
+    :param budget: The maximum number of the SQL statements.
+    """
+    with capture_statements() as statements:
+        yield statements
+
+    listing = "\n\n".join(f"{index}. {sql}" for index, sql in enumerate(statements, 1))
+    message = f"{len(statements)} SQL statements executed, the budget is {budget}"
+
+    assert len(statements) <= budget, f"{message}:\n\n{listing}"
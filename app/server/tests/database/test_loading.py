@@ -0,0 +1,66 @@
+from typing import Any
+
+from marshmallow import fields
+from sqlalchemy import select
+
+from api.database.loading import schema_loader_options
+from api.models.project import Project, ProjectListSchema, ProjectSchema
+from api.models.user import User, UserListSchema
+from api.schema import Schema
+
+
+class _UserProjectsSchema(Schema):
+    name = fields.Str()
+    projects = fields.List(fields.Nested(ProjectListSchema(only=("id", "title", "author"))))
+
+
+class _ComputedSchema(Schema):
+    title = fields.Str()
+    label = fields.Function(lambda project: project.get_label())
+
+
+def _describe(model: type[Any], schema: Schema) -> list[tuple[str, str]]:
+    return [
+        (
+            ".".join(str(item.key) for item in context.path.natural_path[1::2]),
+            dict(context.strategy)["lazy"],
+        )
+        for option in schema_loader_options(model, schema)
+        for context in option.context  # type: ignore[attr-defined]
+        # Skip the `load_only` (the columns are checked by the SQL).
+        if context.strategy and "lazy" in dict(context.strategy)
+    ]
+
+
+def _compile(model: type[Any], schema: Schema) -> str:
+    return str(select(model).options(*schema_loader_options(model, schema)).compile())
+
+
+def test_schema_loader_options() -> None:
+    # The many-to-one relationship is joined.
+    assert _describe(Project, ProjectListSchema()) == [("author", "joined")]
+    # The collection is selected separately, the nested schemas are followed.
+    assert _describe(User, _UserProjectsSchema()) == [
+        ("projects", "selectin"),
+        ("projects.author", "joined"),
+    ]
+    # The relationship that is not serialized is not loaded.
+    assert "JOIN" not in _compile(Project, ProjectListSchema(only=("id", "title")))
+
+
+def test_schema_loader_options_columns() -> None:
+    # The list item schema doesn't dump the `description`, the nested `author` dumps the `name`.
+    assert _compile(Project, ProjectListSchema()).startswith(
+        "SELECT project.title, project.id, project.created_at, project.updated_at, "
+        "project.status, project.author_id, user_1.name, user_1.id AS id_1 \nFROM project"
+    )
+    assert "project.description" in _compile(Project, ProjectSchema())
+    # The `is_active` reads the `status` and the `ntid` is not dumped.
+    assert _compile(User, UserListSchema()) == (
+        'SELECT "user".name, "user".email, "user".role, "user".status, "user".id, '
+        '"user".created_at, "user".updated_at \nFROM "user"'
+    )
+    # The columns the computed field reads are unknown.
+    assert "project.description" in _compile(Project, _ComputedSchema())
+    # The generated search document is never loaded.
+    assert "search_vector" not in _compile(Project, _ComputedSchema())
@@ -0,0 +1,78 @@
+from collections import Counter
+
+from flask import Flask
+from sqlalchemy import select
+
+from api.database import db
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import configure_app_fixture
+
+
+def _dump() -> list[tuple]:
+    users = db.session.execute(
+        select(User.name, User.email, User.role, User.status, User.created_at)
+    )
+    projects = db.session.execute(
+        select(
+            Project.title,
+            Project.description,
+            Project.status,
+            Project.author_id,
+            Project.updated_at,
+        )
+    )
+
+    return [tuple(row) for row in [*users, *projects]]
+
+
+@configure_app_fixture(with_db=True)
+def test_seed(app: Flask) -> None:
+    runner = app.test_cli_runner()
+    arguments = ["db-seeder", "seed", "--users", "300", "--projects", "1000", "--batch", "128"]
+    result = runner.invoke(args=arguments)
+
+    assert result.exit_code == 0, result.output
+    assert User.query.count() == 300
+    assert Project.query.count() == 1000
+    # Every role, status and workflow status is present.
+    assert {user.role for user in User.query} == {role.value for role in Role}
+    assert {user.status for user in User.query} == {status.value for status in UserStatus}
+    assert {project.status for project in Project.query} == {s.value for s in ProjectStatus}
+    assert all(project.created_at <= project.updated_at for project in Project.query)
+
+    # The authors are skewed.
+    authored = [total for _, total in Counter(p.author_id for p in Project.query).most_common()]
+    assert authored[0] > 10 * authored[len(authored) // 2]
+
+    # The same seed produces the same data.
+    dump = _dump()
+    db.drop_all()
+    db.create_all()
+    runner.invoke(args=arguments)
+
+    assert _dump() == dump
+
+    # While the data of the seed exists, it's not seeded again.
+    result = runner.invoke(args=arguments)
+
+    assert result.exit_code == 1
+    assert "The users of the seed 0 already exist" in result.output
+    assert User.query.count() == 300
+
+    # The projects are authored by the existing users unless the users are seeded.
+    result = runner.invoke(args=["db-seeder", "seed", "--projects", "10", "--seed", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert Project.query.count() == 1010
+
+
+@configure_app_fixture(with_db=True)
+def test_seed_nothing(app: Flask) -> None:
+    result = app.test_cli_runner().invoke(args=["db-seeder", "seed"])
+
+    assert result.exit_code == 0, result.output
+    assert User.query.count() == 0
+    assert Project.query.count() == 0
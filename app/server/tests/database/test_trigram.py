@@ -0,0 +1,75 @@
+from typing import Any
+
+from flask import Flask
+from pytest import mark
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from api.database import db
+from api.models.project import Project
+from api.models.user import User
+from api.restful.restful_list_base import RestfulListBase
+from api.restful.projects import ProjectListResource
+from api.restful.users import UserListResource
+
+from ..conftest import configure_app_fixture
+
+
+@mark.parametrize(
+    ("model", "expected"),
+    (
+        (
+            Project,
+            ["CREATE INDEX ix_project_title_trgm ON project USING gin (title gin_trgm_ops)"],
+        ),
+        (
+            User,
+            [
+                'CREATE INDEX ix_user_email_trgm ON "user" USING gin (email gin_trgm_ops)',
+                'CREATE INDEX ix_user_name_trgm ON "user" USING gin (name gin_trgm_ops)',
+            ],
+        ),
+    ),
+)
+def test_trigram_index_ddl(model: Any, expected: list[str]) -> None:
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    ddl = sorted(
+        str(CreateIndex(index).compile(dialect=dialect))
+        for index in model.__table__.indexes
+        if index.name.endswith("_trgm")
+    )
+
+    assert ddl == expected
+
+
+@configure_app_fixture(with_db=True)
+def test_trigram_index_sqlite(app: Flask) -> None:  # pylint: disable=unused-argument
+    indexes = {index["name"] for index in inspect(db.engine).get_indexes("project")}
+
+    # The index is PostgreSQL-only.
+    assert "ix_project_title_trgm" not in indexes
+    assert "ix_project_created_at" in indexes
+
+
+@mark.parametrize(
+    ("resource", "name"),
+    (
+        (ProjectListResource, "title"),
+        (UserListResource, "name"),
+        (UserListResource, "email"),
+    ),
+)
+@configure_app_fixture(with_db=True)
+def test_trigram_filters(
+    app: Flask,  # pylint: disable=unused-argument
+    resource: type[RestfulListBase],
+    name: str,
+) -> None:
+    model = resource.__orig_bases__[0].__args__[0]  # type: ignore[attr-defined]
+    query = resource.registry.filters[name].apply(model.query, "10%_")
+    sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+
+    # The plain `ILIKE` (served by the index), the `%` and `_` are the wildcards.
+    assert f".{name}) LIKE lower('%10%_%')" in sql
+    assert "ESCAPE" not in sql
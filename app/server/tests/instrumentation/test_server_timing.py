@@ -0,0 +1,86 @@
+import re
+from logging import INFO
+
+from flask import Flask
+from pytest import LogCaptureFixture
+
+from api.instrumentation import Instrumentation, ServerTiming, measure
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def test_server_timing() -> None:
+    timing = ServerTiming()
+
+    assert timing.start("ser")
+    # The nested measurement doesn't restart the running phase.
+    assert not timing.start("ser")
+    timing.stop("ser")
+    timing.stop("ser")
+    timing.add("db", 0.0015)
+    timing.queries = 3
+
+    data = timing.to_dict()
+
+    assert data["db"] == 1.5
+    assert data["ser"] >= 0
+    assert data["auth"] == 0
+    assert data["queries"] == 3
+    assert re.fullmatch(
+        r'db;dur=1\.5;desc="3 queries", ser;dur=[\d.]+, auth;dur=0\.0, total;dur=[\d.]+',
+        timing.to_header(),
+    )
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="timing01",
+        email="timing.user@gmail.com",
+        name="Timing User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_disabled(app: Flask) -> None:
+    response = app.test_client().get("/projects")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_enabled(app: Flask, caplog: LogCaptureFixture) -> None:
+    for index in range(3):
+        Project(title=f"Project {index}").save()
+
+    app.config["SERVER_TIMING_ENABLED"] = True
+    Instrumentation().init_app(app)
+    caplog.set_level(INFO)
+
+    with capture_statements() as statements:
+        response = app.test_client().get("/projects")
+
+    assert response.status_code == 200
+    metrics = dict(re.findall(r"(\w+);dur=([\d.]+)", response.headers["Server-Timing"]))
+    assert list(metrics) == ["db", "ser", "auth", "total"]
+    assert f'desc="{len(statements)} queries"' in response.headers["Server-Timing"]
+    assert float(metrics["db"]) > 0
+    assert float(metrics["ser"]) > 0
+    assert float(metrics["auth"]) > 0
+
+    records = [record for record in caplog.records if hasattr(record, "server_timing")]
+    assert len(records) == 1
+    data = records[0].server_timing  # type: ignore[attr-defined]
+    assert data["method"] == "GET"
+    assert data["path"] == "/projects"
+    assert data["status"] == 200
+    assert data["queries"] == len(statements)
+
+    # The measurements outside the measured requests are noop.
+    with measure("ser"):
+        pass
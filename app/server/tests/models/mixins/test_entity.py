@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch, Mock
 from flask import Flask
 from flask_login import current_user
+from marshmallow import fields
 from sqlalchemy.exc import SQLAlchemyError
 from pytest import raises
 
@@ -89,3 +90,22 @@ def test_safe_session_execute_or_rollback(
         with raises(SQLAlchemyError):
             entity.safe_session_execute_or_rollback(db.session.add)
             mock_session.rollback.assert_called_once()
+
+
+def test_schema_subset() -> None:
+    class _Schema(Schema):
+        title = fields.Str()
+        secret = fields.Str(load_only=True)
+
+    schema = EntitySchema(item=_Schema())
+
+    assert schema.get(only=None) is schema.item
+    # The subsets are reused.
+    assert schema.get(only=["title"]) is schema.get(only=("title",))
+    assert schema.serialize(TestEntity(property="Entity"), only=["title"]) == {}
+
+    with raises(ValueError, match="^secret field is write-only$"):
+        schema.get(only=["title", "secret"])
+
+    with raises(ValueError, match="^unknown field is not supported$"):
+        schema.get(only=["unknown"])
@@ -1,8 +1,15 @@
+from typing import Any
 from unittest import TestCase
 
+from flask import Flask
+from pytest import raises
+from transitions import MachineError
+
 from api.database import db
 from api.models.mixins.workflow import WorkflowMixin, TransitionConfig
 
+from ...conftest import capture_statements, configure_app_fixture
+
 
 class TestEntityWorkflow(WorkflowMixin):  # pylint: disable=locally-disabled, too-few-public-methods
     """DB model stub to test the Workflow mixin"""
@@ -50,14 +57,168 @@ class WorkflowMixinTestCase(TestCase):
         assert self.entity.status == "draft"
 
     def test_transitions(self) -> None:
-        self.entity.trigger("ready_for_review")  # type: ignore[attr-defined]
+        self.entity.trigger("ready_for_review")
         assert self.entity.status == "needs_review"
         assert self.entity.allowed_transitions == ["process", "reset"]
 
-        self.entity.trigger("process")  # type: ignore[attr-defined]
+        self.entity.trigger("process")
         assert self.entity.status == "processing"
         assert self.entity.allowed_transitions == ["reset"]
 
-        self.entity.trigger("reset")  # type: ignore[attr-defined]
+        self.entity.trigger("reset")
         assert self.entity.status == "draft"
         assert self.entity.allowed_transitions == ["ready_for_review"]
+
+    def test_shortcuts(self) -> None:
+        # The shortcuts are resolved dynamically.
+        assert self.entity.may_ready_for_review()  # type: ignore[attr-defined]
+        assert not self.entity.may_process()  # type: ignore[attr-defined]
+
+        assert self.entity.ready_for_review()  # type: ignore[attr-defined]
+        assert self.entity.status == "needs_review"
+
+        with self.assertRaises(AttributeError):
+            self.entity.may_publish()  # type: ignore[attr-defined]
+
+    def test_invalid_transitions(self) -> None:
+        with self.assertRaisesRegex(MachineError, "Can't trigger event process from state"):
+            self.entity.trigger("process")
+
+        with self.assertRaisesRegex(AttributeError, "Do not know event named 'publish'"):
+            self.entity.trigger("publish")
+
+        assert self.entity.status == "draft"
+
+    def test_shared_graph(self) -> None:
+        other = TestEntityWorkflow(property="Other Workflow Entity")
+
+        # The transitions are compiled once per model and nothing is bound to the entities.
+        # pylint: disable-next=locally-disabled, protected-access
+        assert other._get_workflow_graph() is self.entity._get_workflow_graph()
+        assert "trigger" not in vars(self.entity)
+        assert "may_process" not in vars(self.entity)
+
+
+class GuardedEntityWorkflow(
+    WorkflowMixin
+):  # pylint: disable=locally-disabled, too-few-public-methods
+    """DB model stub to test the callbacks of the Workflow mixin"""
+
+    id = db.Column(db.Integer, primary_key=True)
+    locked = db.Column(db.Boolean, default=False)
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    @staticmethod
+    def _get_workflow_statuses() -> list[str]:
+        return ["draft", "published", "rejected"]
+
+    @staticmethod
+    def _get_workflow_initial_status() -> str:
+        return "draft"
+
+    def _get_workflow_transitions(self) -> tuple[TransitionConfig, ...]:
+        return (
+            TransitionConfig(
+                trigger="publish",
+                source="draft",
+                dest="published",
+                conditions=["is_reviewed"],
+                unless=["locked"],
+                before=[self._record],
+                after=["_record"],
+            ),
+            # Applied when the first `publish` transition is not allowed.
+            TransitionConfig(
+                trigger="publish",
+                source="draft",
+                dest="rejected",
+                after=[self._record],
+            ),
+        )
+
+    def is_reviewed(self, reviewed: bool = False, **_: Any) -> bool:
+        return reviewed
+
+    def _record(self, **kwargs: Any) -> None:
+        self.events = [*self.events, (self.status, kwargs)]
+
+
+class WorkflowCallbacksTestCase(TestCase):
+    """Contains tests for the callbacks of the transitions."""
+
+    def test_callbacks(self) -> None:
+        entity = GuardedEntityWorkflow()
+
+        assert entity.may_trigger("publish", reviewed=True)
+        assert entity.trigger("publish", reviewed=True)
+        assert entity.status == "published"
+        assert entity.events == [
+            ("draft", {"reviewed": True}),
+            ("published", {"reviewed": True}),
+        ]
+
+    def test_fallback_transition(self) -> None:
+        entity = GuardedEntityWorkflow(locked=True)
+
+        assert entity.trigger("publish", reviewed=True)
+        assert entity.status == "rejected"
+        assert entity.events == [("rejected", {"reviewed": True})]
+
+    def test_callbacks_bound_to_entity(self) -> None:
+        first, second = GuardedEntityWorkflow(), GuardedEntityWorkflow()
+
+        first.trigger("publish")
+
+        assert first.events == [("rejected", {})]
+        assert not second.events
+
+
+class StagedWorkflow(WorkflowMixin):  # pylint: disable=locally-disabled, too-few-public-methods
+    """DB model stub with the trigger defined by several transitions"""
+
+    id = db.Column(db.Integer, primary_key=True)
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    @staticmethod
+    def _get_workflow_statuses() -> list[str]:
+        return ["draft", "review", "done"]
+
+    @staticmethod
+    def _get_workflow_initial_status() -> str:
+        return "draft"
+
+    def _get_workflow_transitions(self) -> tuple[TransitionConfig, ...]:
+        return (
+            TransitionConfig(trigger="advance", source="draft", dest="review", after=["_record"]),
+            TransitionConfig(trigger="advance", source="review", dest="done", after=["_record"]),
+            TransitionConfig(trigger="reopen", source="done", dest="draft", unless=["id"]),
+        )
+
+    def _record(self, **kwargs: Any) -> None:
+        self.events = [*self.events, (self.status, kwargs)]
+
+
+@configure_app_fixture(with_db=True)
+def test_bulk_trigger(app: Flask) -> None:  # pylint: disable=unused-argument
+    entities = [StagedWorkflow(status=status) for status in ("draft", "review", "done")]
+    db.session.add_all(entities)
+    db.session.commit()
+    draft, review, done = entities
+    ids = [done.id, review.id, draft.id]
+
+    with capture_statements() as statements:
+        transitioned = StagedWorkflow.bulk_trigger("advance", ids)
+
+    # Every entity takes the transition from its original status, once.
+    assert sorted(entity.id for entity in transitioned) == [draft.id, review.id]
+    assert [entity.status for entity in entities] == ["review", "done", "done"]
+    assert draft.events == [("review", {"original_status": "draft"})]
+    assert review.events == [("done", {"original_status": "review"})]
+    # The candidates and an `UPDATE` per transition.
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE", "UPDATE"]
+
+    with raises(ValueError, match="The reopen transition can't be applied in bulk"):
+        StagedWorkflow.bulk_trigger("reopen", [done.id])
+
+    with raises(ValueError, match="The publish transition doesn't exist"):
+        StagedWorkflow.bulk_trigger("publish", [done.id])
@@ -30,7 +30,7 @@ def test_project_transitions(app: Flask) -> None:
     )
 
     app.logger = Mock()  # type: ignore[misc]
-    project.trigger("complete", original_status=project.status)  # type: ignore[attr-defined]
+    project.trigger("complete", original_status=project.status)
     assert project.status == ProjectStatus.COMPLETED.value
     assert project.allowed_transitions == ["back_to_draft", "archive"]
     app.logger.info.assert_called_with(
@@ -38,10 +38,10 @@ def test_project_transitions(app: Flask) -> None:
         f" by {current_user.email}"
     )
 
-    project.trigger("archive", original_status=project.status)  # type: ignore[attr-defined]
+    project.trigger("archive", original_status=project.status)
     assert project.status == ProjectStatus.ARCHIVED.value
     assert project.allowed_transitions == ["restore"]
 
-    project.trigger("restore", original_status=project.status)  # type: ignore[attr-defined]
+    project.trigger("restore", original_status=project.status)
     assert project.status == ProjectStatus.DRAFT.value
     assert project.allowed_transitions == ["complete", "archive"]
@@ -0,0 +1,142 @@
+from json import loads as json_loads
+
+from flask import Flask
+
+from api.database import db
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="bulk01",
+        email="bulk.user@gmail.com",
+        name="Bulk User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _writes(statements: list[str]) -> list[str]:
+    return [statement.split()[0] for statement in statements if not statement.startswith("SELECT")]
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_bulk_create(app: Flask) -> None:
+    client = app.test_client()
+
+    with capture_statements() as statements:
+        response = client.post(
+            "/projects/bulk",
+            json=[{"title": f"Bulk {index}", "description": "Imported"} for index in range(3)],
+        )
+
+    items = json_loads(response.data)["items"]
+
+    assert response.status_code == 201, items
+    assert [item["title"] for item in items] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert {item["status"] for item in items} == {"draft"}
+    assert {item["author"]["name"] for item in items} == {"Bulk User"}
+    # The `INSERT` is multi-row on PostgreSQL (SQLite needs a row at a time to return
+    # the IDs in order) and the entities aren't refreshed one by one.
+    assert set(_writes(statements)) == {"INSERT"}, statements
+    assert len(statements) - len(_writes(statements)) == 1, statements
+
+    response = client.post("/projects/bulk", json=[{"title": "Valid"}, {"title": ""}])
+
+    assert response.status_code == 422
+    assert json_loads(response.data) == {
+        "errors": [None, {"title": ["Shorter than minimum length 1."]}],
+    }
+    assert Project.query.count() == 3
+
+    for data, message in (
+        ({"title": "Object"}, "The request must be an array of objects"),
+        ([], "The number of items must be from 1 to 500"),
+    ):
+        response = client.post("/projects/bulk", json=data)
+
+        assert response.status_code == 400
+        assert json_loads(response.data) == {"message": message}
+
+    assert client.get("/projects/bulk").status_code == 405
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_bulk_update(app: Flask) -> None:
+    first = Project(title="First", description="Kept").save()
+    second = Project(title="Second", description="Kept").save()
+    client = app.test_client()
+    data = [
+        {"id": second.id, "title": "Second updated"},
+        {"id": first.id, "title": "First updated", "description": "Changed"},
+    ]
+
+    with capture_statements() as statements:
+        response = client.patch("/projects/bulk", json=data)
+
+    items = json_loads(response.data)["items"]
+
+    assert response.status_code == 200, items
+    assert [(item["title"], item["description"]) for item in items] == [
+        ("Second updated", "Kept"),
+        ("First updated", "Changed"),
+    ]
+    # An `UPDATE` per set of the updated columns.
+    assert _writes(statements) == ["UPDATE", "UPDATE"], statements
+    # The `updated_at` is set by the database like by any other write.
+    assert all(
+        "updated_at=CURRENT_TIMESTAMP" in statement
+        for statement in statements
+        if statement.startswith("UPDATE")
+    ), statements
+
+    response = client.patch(
+        "/projects/bulk",
+        json=[{"id": first.id, "title": "Not saved"}, {"id": 999, "title": "Missing"}, {}],
+    )
+
+    assert response.status_code == 422
+    assert json_loads(response.data) == {
+        "errors": [None, {"id": ["Entity not found."]}, {"id": ["Entity not found."]}],
+    }
+    db.session.refresh(first)
+
+    assert first.title == "First updated"
+
+    for pk in (True, float(first.id), str(first.id)):
+        response = client.patch("/projects/bulk", json=[{"id": pk, "title": "Not saved"}])
+
+        assert response.status_code == 422
+        assert json_loads(response.data) == {"errors": [{"id": ["Entity not found."]}]}
+
+    db.session.refresh(first)
+
+    assert first.title == "First updated"
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_bulk_update_users(app: Flask) -> None:
+    user = User(email="bulk.other@gmail.com").save()
+    client = app.test_client()
+
+    # The `permanent` fields.
+    response = client.patch(
+        "/users/bulk",
+        json=[{"id": user.id, "role": Role.ADMIN.value, "email": "changed@gmail.com"}],
+    )
+
+    assert response.status_code == 422
+    assert list(json_loads(response.data)["errors"][0]) == ["email"]
+
+    response = client.patch("/users/bulk", json=[{"id": user.id, "is_active": False}])
+
+    assert response.status_code == 200
+    assert json_loads(response.data)["items"][0]["status"] == UserStatus.BLOCKED.value
+
+    response = client.patch("/users/bulk", json=[{"id": 1, "role": Role.ADMIN.value}])
+
+    assert response.status_code == 403
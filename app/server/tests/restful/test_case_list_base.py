@@ -83,8 +83,30 @@ class TestCaseListBase(Generic[_Entity], TestCase):
             self.logged_in_context(self.logged_in_user) as client,
             patch(f"{self.model_import_path}.query") as mock_query,
         ):
+            # The eager loading options don't affect the chain: Model.query.options().filter().
+            mock_query.options.return_value = mock_query
             yield client, mock_query
 
+    def mock_validators(self, filtered_query: MagicMock) -> MagicMock:
+        """
+        Mocks the aggregate of the list validators (see `RestfulListBase.get_validators`)
+        selected from the filtered query, the chain:
+        Model.query.filter().order_by(None).enable_eagerloads(False).with_entities().one().
+
+        The aggregated number of the entities is the `total` of the `exact` total mode.
+
+        :param filtered_query: The mock of the filtered query.
+        :return: The mock of the `one()` that selects the aggregate.
+        """
+        aggregate = filtered_query.order_by.return_value.enable_eagerloads.return_value
+        select_one: MagicMock = aggregate.with_entities.return_value.one
+        select_one.return_value = (
+            len(self.response_list_items),
+            max((item.updated_at for item in self.response_list_items), default=None),
+        )
+
+        return select_one
+
     @staticmethod
     def _are_sql_binary_expressions_equal(val1: BinaryExpression, val2: BinaryExpression) -> bool:
         """Checks whether to binary expressions are equal."""
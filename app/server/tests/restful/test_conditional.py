@@ -0,0 +1,118 @@
+from datetime import datetime
+
+from flask import Flask, g
+from sqlalchemy import update
+
+from api.database import db
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.conditional import Validators
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="conditional01",
+        email="conditional.user@gmail.com",
+        name="Conditional User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _touch(project_id: int, updated_at: datetime) -> None:
+    # Bypasses the `before_update` listener that sets the current time.
+    db.session.execute(update(Project).filter_by(id=project_id).values(updated_at=updated_at))
+    db.session.commit()
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_conditional_item(app: Flask) -> None:
+    project = Project(title="Conditional").save()
+    client = app.test_client()
+    _touch(project.id, datetime(2030, 1, 2, 3, 4, 5, 678))
+
+    response = client.get(f"/projects/{project.id}")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"] == "Wed, 02 Jan 2030 03:04:05 GMT"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    with capture_statements() as statements:
+        response = client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+
+    # Only the `updated_at` is selected.
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1, statements
+
+    response = client.get(
+        f"/projects/{project.id}",
+        headers={"If-Modified-Since": "Wed, 02 Jan 2030 03:04:05 GMT"},
+    )
+
+    assert response.status_code == 304
+
+    # The sparse fieldsets have own tags.
+    response = client.get(f"/projects/{project.id}?fields=id", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+
+    _touch(project.id, datetime(2030, 1, 2, 3, 4, 6))
+    response = client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_conditional_list(app: Flask) -> None:
+    first = Project(title="First").save()
+    second = Project(title="Second").save()
+    client = app.test_client()
+
+    response = client.get("/projects")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
+
+    with capture_statements() as statements:
+        response = client.get("/projects", headers={"If-None-Match": etag})
+
+    # The page isn't loaded.
+    assert response.status_code == 304
+    assert len(statements) == 1, statements
+
+    _touch(first.id, datetime(2030, 1, 1))
+    response = client.get("/projects", headers={"If-None-Match": etag})
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+
+    second.delete()
+    response = client.get("/projects", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # The lists that aren't counted aren't validated either.
+    response = client.get("/projects?total=none")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_validators_role(app: Flask) -> None:
+    tags = set()
+
+    for role in Role:
+        with app.test_request_context("/projects?page=1"):
+            g._login_user = User(role=role.value)  # pylint: disable=protected-access
+            tags.add(Validators.build(1, None).etag)
+
+    assert len(tags) == len(Role)
@@ -0,0 +1,111 @@
+from json import loads as json_loads
+from typing import Any
+from unittest.mock import patch
+
+from flask import Flask
+from marshmallow import fields as schema_fields
+
+from api.database import db
+from api.models.mixins.entity import EntitySchema
+from api.models.project import Project, ProjectListSchema, ProjectSchema
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="fields01",
+        email="fields.user@gmail.com",
+        name="Fields User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _get(app: Flask, url: str) -> tuple[int, Any, list[str]]:
+    db.session.expunge_all()
+
+    with capture_statements() as statements:
+        response = app.test_client().get(url)
+
+    return response.status_code, json_loads(response.data), statements
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_fields_list(app: Flask) -> None:
+    project = Project(title="Project", description="Description").save()
+
+    status, data, statements = _get(app, "/projects?fields=id,title,status&total=none")
+
+    assert status == 200
+    assert data["items"] == [{"id": project.id, "title": "Project", "status": "draft"}]
+    assert statements[0].startswith(
+        "SELECT project.title AS project_title, project.id AS project_id, "
+        "project.status AS project_status \nFROM project"
+    )
+    # The author isn't requested.
+    assert "JOIN" not in statements[0]
+
+    status, data, statements = _get(app, "/projects?fields=author&total=none")
+
+    assert status == 200
+    assert data["items"] == [{"author": {"id": project.author_id, "name": "Fields User"}}]
+    assert "JOIN" in statements[0]
+
+    for fields, message in (
+        ("title,description", "description field is not supported"),
+        ("password", "password field is not supported"),
+    ):
+        status, data, statements = _get(app, f"/projects?fields={fields}")
+
+        assert status == 400
+        assert data == {"message": message}
+        # The fields are checked before the page is loaded.
+        assert not statements
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_fields_list_write_only(app: Flask) -> None:
+    class _ListSchema(ProjectListSchema):  # pylint: disable=locally-disabled, too-many-ancestors
+        secret = schema_fields.Str(load_only=True)
+
+    schema = EntitySchema(item=ProjectSchema(), list_item=_ListSchema())
+
+    with patch.object(Project, "schema", schema):
+        status, data, statements = _get(app, "/projects?fields=title,secret")
+
+    assert status == 400
+    assert data == {"message": "secret field is write-only"}
+    assert not statements
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_fields_item(app: Flask) -> None:
+    project = Project(title="Project", description="Description").save()
+
+    status, data, statements = _get(app, f"/projects/{project.id}?fields=title,description")
+
+    assert status == 200
+    assert data == {"title": "Project", "description": "Description"}
+    assert statements[0].startswith(
+        "SELECT project.title AS project_title, project.description AS project_description, "
+        "project.id AS project_id \nFROM project"
+    )
+
+    status, data, _ = _get(app, f"/projects/{project.id}?fields=title,%20allowed_transitions")
+
+    assert status == 200
+    assert data == {"title": "Project", "allowed_transitions": ["complete", "archive"]}
+
+    status, data, _ = _get(app, f"/projects/{project.id}?fields=author_id")
+
+    assert status == 400
+    assert data == {"message": "author_id field is not supported"}
+
+    # All fields are serialized by default.
+    status, data, _ = _get(app, f"/projects/{project.id}?fields=")
+
+    assert status == 200
+    assert "description" in data
@@ -0,0 +1,63 @@
+from json import loads as json_loads
+
+from flask import Flask
+
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="batch01",
+        email="batch.user@gmail.com",
+        name="Batch User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_batch(app: Flask) -> None:
+    first = Project(title="First").save()
+    second = Project(title="Second").save()
+    client = app.test_client()
+    url = f"/projects/batch?ids={second.id},999,{first.id},{second.id}"
+
+    with capture_statements() as statements:
+        response = client.get(url)
+
+    data = json_loads(response.data)
+
+    assert response.status_code == 200, data
+    # The entity with its author by a single query.
+    assert len(statements) == 1, "\n\n".join(statements)
+    assert [item and item["title"] for item in data["items"]] == [
+        "Second",
+        None,
+        "First",
+        "Second",
+    ]
+    assert data["items"][0] == json_loads(client.get(f"/projects/{second.id}").data)
+    assert data["not_found"] == [999]
+
+    response = client.get(f"/projects/batch?ids={first.id}&fields=id,status")
+
+    assert json_loads(response.data)["items"] == [{"id": first.id, "status": first.status}]
+
+    for query, message in (
+        ("", "The number of ids must be from 1 to 100"),
+        (f"ids={','.join(map(str, range(1, 102)))}", "The number of ids must be from 1 to 100"),
+        ("ids=1,a", "The ids must be positive integers"),
+        ("ids=1&fields=unknown", "unknown field is not supported"),
+    ):
+        response = client.get(f"/projects/batch?{query}")
+
+        assert response.status_code == 400
+        assert json_loads(response.data) == {"message": message}
+
+    response = client.get("/users/batch?ids=1")
+
+    assert json_loads(response.data)["items"][0]["email"] == "batch.user@gmail.com"
@@ -0,0 +1,96 @@
+from json import loads as json_loads
+
+from flask import Flask, g
+
+from api.cache import cache
+from api.cache.list_pages import page_key, stats
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="cache01",
+        email="cache.user@gmail.com",
+        name="Cache User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _titles(app: Flask, url: str = "/projects?sort=title&order=asc") -> list[str]:
+    response = app.test_client().get(url)
+    assert response.status_code == 200, response.data
+
+    return [item["title"] for item in json_loads(response.data)["items"]]
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_list_cache(app: Flask) -> None:
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    stats.clear()
+    project = Project(title="First").save()
+
+    assert _titles(app) == ["First"]
+    assert stats == {"misses": 1}
+
+    with capture_statements() as statements:
+        # The order of the query arguments doesn't matter.
+        assert _titles(app, "/projects?order=asc&sort=title") == ["First"]
+
+    assert not statements
+    assert stats == {"misses": 1, "hits": 1}
+
+    # Every write invalidates the cached pages.
+    Project(title="Second").save()
+
+    assert _titles(app) == ["First", "Second"]
+
+    project.title = "Third"
+    project.save()
+
+    assert _titles(app) == ["Second", "Third"]
+
+    project.trigger("archive")
+    project.save(True)
+
+    assert _titles(app) == ["Second"]
+    assert _titles(app, "/projects?status_filter=archived") == ["Third"]
+
+    project.delete()
+
+    assert _titles(app, "/projects?status_filter=archived") == []
+
+    # The change of the related entity (the author) as well.
+    author = User.query.filter_by(ntid="cache01").one()
+    author.name = "Renamed User"
+    author.save()
+    response = app.test_client().get("/projects")
+
+    assert json_loads(response.data)["items"][0]["author"]["name"] == "Renamed User"
+    assert stats == {"misses": 7, "hits": 1}
+
+    # The cached page is validated as well.
+    response = app.test_client().get(
+        "/projects", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert response.status_code == 304
+    assert stats == {"misses": 7, "hits": 2}
+
+
+@configure_app_fixture(with_db=True)
+def test_page_key(app: Flask) -> None:
+    cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    keys = set()
+
+    for role in Role:
+        with app.test_request_context("/projects?page=2"):
+            g._login_user = User(role=role.value)  # pylint: disable=protected-access
+            keys.add(page_key(Project, (Project, User)))
+
+    assert len(keys) == len(Role)
+    assert all(key.startswith("list:Project:") for key in keys)
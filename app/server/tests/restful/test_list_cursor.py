@@ -0,0 +1,113 @@
+from datetime import datetime
+from json import loads as json_loads
+
+from flask import Flask
+from flask.testing import FlaskClient
+from pytest import mark
+
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.cursor import Cursor
+
+from ..conftest import configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="cursor01",
+        email="cursor.user@gmail.com",
+        name="Cursor User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _create_projects() -> None:
+    authors = [
+        User(email=f"author{index}@gmail.com", name=name).save()
+        for index, name in enumerate(("Bob", None, "Alice"))
+    ]
+
+    for index, title in enumerate(("b", "a", None, "c", "a", None, "b")):
+        Project(
+            title=title,
+            description=f"Project {index}",
+            author_id=authors[index % len(authors)].id,
+            created_at=datetime(2024, 1, 1 + index % 3),
+        ).save()
+
+
+def _walk(client: FlaskClient, query: str) -> tuple[list[int], list[dict]]:
+    ids: list[int] = []
+    pagers: list[dict] = []
+    cursor = ""
+
+    # Limit the number of pages to fail rather than hang on a broken cursor.
+    while cursor is not None and len(pagers) < 5:
+        response = client.get(f"/projects?{query}&per_page=3&cursor={cursor}")
+        assert response.status_code == 200
+        data = json_loads(response.data)
+        ids += [item["id"] for item in data["items"]]
+        pagers.append(data["pager"])
+        cursor = data["pager"]["next_cursor"]
+
+    return ids, pagers
+
+
+@mark.parametrize(
+    ("query", "expected"),
+    (
+        ("sort=title&order=asc", [2, 5, 1, 7, 4, 3, 6]),
+        ("sort=title&order=desc", [6, 3, 4, 7, 1, 5, 2]),
+        ("sort=created_at&order=desc", [6, 3, 5, 2, 7, 4, 1]),
+        ("sort=author_name&order=asc", [3, 6, 1, 4, 7, 2, 5]),
+        ("sort=author_name&order=desc", [5, 2, 7, 4, 1, 6, 3]),
+    ),
+)
+@configure_app_fixture(auth_user=_auth_user)
+def test_cursor_pagination(app: Flask, query: str, expected: list[int]) -> None:
+    _create_projects()
+    client = app.test_client()
+    ids, pagers = _walk(client, f"{query}&status_filter=draft")
+
+    assert ids == expected
+    assert [pager["total"] for pager in pagers] == [7, 7, 7]
+    assert pagers[0]["prev_cursor"] is None
+    assert pagers[-1]["next_cursor"] is None
+
+    # Walk backward from the last page.
+    response = client.get(f"/projects?{query}&per_page=3&cursor={pagers[-1]['prev_cursor']}")
+    data = json_loads(response.data)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == expected[3:6]
+    assert data["pager"]["next_cursor"] is not None
+    assert data["pager"]["prev_cursor"] is not None
+
+    response = client.get(f"/projects?{query}&per_page=3&cursor={data['pager']['prev_cursor']}")
+    data = json_loads(response.data)
+
+    assert [item["id"] for item in data["items"]] == expected[:3]
+    assert data["pager"]["prev_cursor"] is None
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_cursor_errors(app: Flask) -> None:
+    client = app.test_client()
+    mismatch = Cursor(sort="title", direction="asc", value="a", id=1).encode()
+
+    for cursor, message in (
+        ("!", "The cursor is malformed"),
+        (mismatch, "The cursor does not match the sort"),
+    ):
+        response = client.get(f"/projects?cursor={cursor}")
+
+        assert response.status_code == 400
+        assert json_loads(response.data) == {"message": message}
+
+
+def test_cursor_encoding() -> None:
+    cursor = Cursor(sort="title", direction="desc", value=None, id=3, backward=True)
+
+    assert Cursor.decode(cursor.encode()) == cursor
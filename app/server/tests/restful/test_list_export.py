@@ -0,0 +1,96 @@
+from csv import reader as csv_reader
+from json import loads as json_loads
+
+from flask import Flask
+from pytest import MonkeyPatch
+
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful import list_export
+from api.utils.json_encoder import dumps
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="export01",
+        email="export.user@gmail.com",
+        name="Export User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_export_ndjson(app: Flask, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(list_export, "EXPORT_CHUNK_SIZE", 2)
+
+    for index in range(5):
+        Project(title=f"Projekt Nr. {index} – Müller").save()
+
+    client = app.test_client()
+    listed = json_loads(client.get("/projects?sort=title&order=asc").data)["items"]
+
+    with capture_statements() as statements:
+        response = client.get("/projects/export?sort=title&order=asc")
+        lines = response.get_data(as_text=True).splitlines()
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.headers["Content-Disposition"] == 'attachment; filename="project.ndjson"'
+    # The same items as the list serializes, fetched by chunks of a single query.
+    assert [json_loads(line) for line in lines] == listed
+    # Encoded like the JSON responses (e.g. the non-ASCII characters aren't escaped).
+    assert lines == [dumps(item).decode() for item in listed]
+    assert len(statements) == 1, statements
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_export_csv(app: Flask) -> None:
+    Project(title="Exported, quoted").save()
+    Project(title="Filtered out").save()
+    client = app.test_client()
+
+    response = client.get(
+        "/projects/export?format=csv&title_filter=exported&fields=id,title,author"
+    )
+    rows = list(csv_reader(response.get_data(as_text=True).splitlines()))
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert rows[0] == ["author", "id", "title"]
+    assert len(rows) == 2
+    assert json_loads(rows[1][0])["name"] == "Export User"
+    assert rows[1][2] == "Exported, quoted"
+
+    response = client.get("/projects/export?format=csv&title_filter=missing&fields=id")
+
+    assert response.get_data(as_text=True).splitlines() == ["id"]
+
+    response = client.get("/projects/export?format=xml")
+
+    assert response.status_code == 400
+    assert json_loads(response.data) == {"message": "xml format is not supported"}
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_export_csv_formulas(app: Flask) -> None:
+    titles = ('=HYPERLINK("http://evil")', "+1+1", "-2+3", "@SUM(A1)", "\t=1", "Plain -1")
+
+    for title in titles:
+        Project(title=title).save()
+
+    response = app.test_client().get("/projects/export?format=csv&fields=title&sort=id&order=asc")
+    rows = list(csv_reader(response.get_data(as_text=True).splitlines()))
+
+    # The formulas are displayed as the text.
+    assert [row[0] for row in rows[1:]] == [
+        '\'=HYPERLINK("http://evil")',
+        "'+1+1",
+        "'-2+3",
+        "'@SUM(A1)",
+        "'\t=1",
+        "Plain -1",
+    ]
@@ -0,0 +1,100 @@
+from json import loads as json_loads
+
+from flask import Flask
+
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="facets01",
+        email="facets.user@gmail.com",
+        name="Facets User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_project_facets(app: Flask) -> None:
+    author = User(email="facets.author@gmail.com", name="Facets Author").save()
+
+    for title, status, author_id in (
+        ("Alpha", ProjectStatus.DRAFT, author.id),
+        ("Alpha two", ProjectStatus.DRAFT, None),
+        ("Alpha three", ProjectStatus.ARCHIVED, author.id),
+        ("Beta", ProjectStatus.COMPLETED, author.id),
+    ):
+        project = Project(title=title, status=status.value).save()
+        project.author_id = author_id  # type: ignore[assignment]
+        project.save()
+
+    client = app.test_client()
+
+    with capture_statements() as statements:
+        response = client.get(
+            "/projects/facets?facets=status,author_id&title_filter=alpha&status_filter=draft"
+        )
+
+    assert response.status_code == 200, response.data
+    assert len(statements) == 1, statements
+    assert json_loads(response.data)["facets"] == {
+        # The status filter doesn't apply to the status counts.
+        "status": [
+            {"value": ProjectStatus.DRAFT.value, "count": 2},
+            {"value": ProjectStatus.ARCHIVED.value, "count": 1},
+        ],
+        "author_id": [
+            {"value": author.id, "count": 1},
+            {"value": None, "count": 1},
+        ],
+    }
+
+    # The default filter (no archived projects) applies to the other facets.
+    response = client.get("/projects/facets?facets=author_id")
+
+    assert json_loads(response.data)["facets"] == {
+        "author_id": [
+            {"value": author.id, "count": 2},
+            {"value": None, "count": 1},
+        ],
+    }
+
+    for query, message in (
+        ("", "The facets are not specified"),
+        ("facets=author", "author facet is not supported"),
+        # The columns that aren't declared by the resource.
+        ("facets=status,search_vector", "search_vector facet is not supported"),
+        ("facets=id", "id facet is not supported"),
+        ("facets=description", "description facet is not supported"),
+    ):
+        response = client.get(f"/projects/facets?{query}")
+
+        assert response.status_code == 400
+        assert json_loads(response.data) == {"message": message}
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_user_facets(app: Flask) -> None:
+    User(
+        email="facets.blocked@gmail.com",
+        role=Role.ADMIN.value,
+        status=UserStatus.BLOCKED.value,
+    ).save()
+    response = app.test_client().get(
+        f"/users/facets?facets=role,status&role_filter={Role.ADMIN.value}"
+    )
+
+    assert response.status_code == 200, response.data
+    assert json_loads(response.data)["facets"] == {
+        # The default filter by the active status applies.
+        "role": [{"value": Role.ADMIN.value, "count": 1}],
+        "status": [
+            {"value": UserStatus.BLOCKED.value, "count": 1},
+            {"value": UserStatus.ACTIVE.value, "count": 1},
+        ],
+    }
@@ -0,0 +1,86 @@
+from datetime import datetime
+from json import loads as json_loads
+
+from flask import Flask
+from pytest import mark
+
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.projects import ProjectListResource
+
+from ..conftest import configure_app_fixture
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="filters01",
+        email="filters.user@gmail.com",
+        name="Filters User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@mark.parametrize(
+    ("query", "expected"),
+    (
+        (
+            "created_from_filter=2024-05-17&created_to_filter=2024-05-18",
+            (
+                "project.created_at >= '2024-05-17 00:00:00'",
+                "project.created_at < '2024-05-19 00:00:00'",
+            ),
+        ),
+        (
+            "updated_from_filter=2024-05-17T10:30:00%2B02:00&updated_to_filter=2024-05-18T06:00:00",
+            (
+                "project.updated_at >= '2024-05-17 08:30:00'",
+                "project.updated_at < '2024-05-18 06:00:00'",
+            ),
+        ),
+    ),
+)
+@configure_app_fixture(with_db=True)
+def test_timestamp_filters_sql(app: Flask, query: str, expected: tuple[str, ...]) -> None:
+    with app.test_request_context(f"/projects?{query}"):
+        resource = ProjectListResource()
+        resource.apply_filters()
+        sql = str(resource.query.statement.compile(compile_kwargs={"literal_binds": True}))
+
+    # The columns must not be wrapped with a function to be able to use the index.
+    assert "date(" not in sql.lower()
+
+    for condition in expected:
+        assert condition in sql
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_timestamp_filters(app: Flask) -> None:
+    for title, created_at in (
+        ("Before", datetime(2024, 5, 16, 23, 59, 59)),
+        ("First", datetime(2024, 5, 17)),
+        ("Last", datetime(2024, 5, 18, 23, 59, 59, 999999)),
+        ("After", datetime(2024, 5, 19)),
+    ):
+        Project(title=title, created_at=created_at).save()
+
+    def get_titles(query: str) -> list[str]:
+        response = app.test_client().get(f"/projects?sort=created_at&order=asc&{query}")
+        assert response.status_code == 200
+        return [item["title"] for item in json_loads(response.data)["items"]]
+
+    assert get_titles("created_from_filter=2024-05-17&created_to_filter=2024-05-18") == [
+        "First",
+        "Last",
+    ]
+    assert get_titles("created_from_filter=2024-05-17T02:00:00%2B02:00") == [
+        "First",
+        "Last",
+        "After",
+    ]
+    assert get_titles("created_to_filter=2024-05-17") == ["Before", "First"]
+
+    response = app.test_client().get("/projects?created_from_filter=tomorrow")
+    assert response.status_code == 400
+    assert json_loads(response.data) == {"message": "tomorrow is not a valid date"}
@@ -0,0 +1,97 @@
+from json import loads as json_loads
+from re import findall
+from flask import Flask
+from pytest import mark, raises
+
+from api.database import db
+from api.models.project import Project
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+
+from ..conftest import capture_statements, configure_app_fixture, query_budget
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="queries01",
+        email="queries.user@gmail.com",
+        name="Queries User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@mark.parametrize(
+    ("query", "expected"),
+    (
+        # The `count(*)` and the page.
+        ("", 2),
+        # The page with the extra row.
+        ("total=none", 1),
+        ("total=none&cursor=&sort=author_name&order=asc", 1),
+    ),
+)
+@configure_app_fixture(auth_user=_auth_user)
+def test_list_queries(app: Flask, query: str, expected: int) -> None:
+    for index in range(10):
+        author = User(email=f"author{index}@gmail.com", name=f"Author {index}").save()
+        Project(title=f"Project {index}", author_id=author.id).save()
+
+    # Start from the empty identity map as the fresh request does.
+    db.session.expunge_all()
+
+    with capture_statements() as statements:
+        response = app.test_client().get(f"/projects?per_page=10&{query}")
+
+    items = json_loads(response.data)["items"]
+
+    assert response.status_code == 200
+    assert len(items) == 10
+    assert all(item["author"]["name"].startswith("Author ") for item in items)
+    assert len(statements) == expected, "\n\n".join(statements)
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_list_joins(app: Flask) -> None:
+    author = User(email="joins.author@gmail.com", name="Joins Author").save()
+    Project(title="Authored", author_id=author.id).save()
+    orphan = Project(title="Orphan").save()
+    orphan.author_id = None
+    orphan.save()
+    client = app.test_client()
+
+    with capture_statements() as statements:
+        response = client.get("/projects?sort=author_name&order=asc")
+
+    assert len(statements) == 2
+    count, page = statements[0], statements[1]
+    # The orphan is ordered, not dropped, and isn't joined for the count.
+    assert [item["title"] for item in json_loads(response.data)["items"]] == ["Orphan", "Authored"]
+    assert json_loads(response.data)["pager"]["total"] == 2
+    assert "JOIN" in page
+    assert "JOIN" not in page.replace("LEFT OUTER JOIN", "")
+    assert "JOIN" not in count
+
+    for query in ("", "&cursor="):
+        with capture_statements() as statements:
+            response = client.get(
+                f"/projects?author_name_filter=joins&sort=author_name&order=asc{query}"
+            )
+
+        # The filter and the sort share the join.
+        assert response.status_code == 200, response.data
+        assert [item["title"] for item in json_loads(response.data)["items"]] == ["Authored"]
+        for statement in statements:
+            aliases = findall(r'"user" AS (\w+)', statement)
+            assert len(aliases) == len(set(aliases)), statement
+
+
+@configure_app_fixture(with_db=True)
+def test_query_budget_exceeded(app: Flask) -> None:  # pylint: disable=unused-argument
+    with raises(AssertionError) as error:
+        with query_budget(1):
+            User.query.all()
+            Project.query.all()
+
+    assert "2 SQL statements executed, the budget is 1" in str(error.value)
+    assert "2. SELECT project." in str(error.value)
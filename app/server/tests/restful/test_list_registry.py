@@ -0,0 +1,99 @@
+from flask import Flask
+from pytest import raises
+from sqlalchemy.orm import aliased
+
+from api.models.project import Project
+from api.models.user import User
+from api.restful.list_registry import Filter, ListRegistry, SortKey
+from api.restful.projects import ProjectListResource
+from api.restful.restful_list_base import Queries, RestfulListBase
+from api.restful.users import UserListResource
+
+from ..conftest import configure_app_fixture
+
+
+_AUTHOR = aliased(User)
+
+
+class _ProjectListResource(RestfulListBase[Project]):
+    filters = {
+        "author_email": Filter(_AUTHOR.email, "ilike", join=_AUTHOR),
+    }
+
+    sort_keys = {
+        "author_email": SortKey(_AUTHOR.email, join=_AUTHOR),
+    }
+
+    def get_special_filters(self) -> Queries:
+        return {
+            "title": lambda q, s: q.filter(self.model.title == s),
+        }
+
+
+def _compile(app: Flask, url: str, resource_class: type[RestfulListBase]) -> str:
+    with app.test_request_context(url):
+        resource = resource_class()
+        resource.apply_filters()
+        resource.apply_sorting()
+
+        return str(resource.query.statement.compile(compile_kwargs={"literal_binds": True}))
+
+
+def test_registry() -> None:
+    registry = ProjectListResource.registry
+
+    # Built once per class.
+    assert isinstance(registry, ListRegistry)
+    assert registry is not UserListResource.registry
+    assert not hasattr(RestfulListBase, "registry")
+    # The built-in, the mixins' and the declared ones.
+    assert {"title", "description", "author_name", "created_from", "status"} <= set(
+        registry.filters
+    )
+    assert {"title", "created_at", "author_name"} <= set(registry.sort_keys)
+    assert registry.filters["title"].operator == "ilike"
+    assert registry.filters["author_name"].operator == "ilike"
+
+    assert registry.facets == ("status", "author_id")
+
+    with raises(TypeError):
+        registry.filters["title"] = Filter(Project.title)  # type: ignore[index]
+
+    # The deferred search document isn't a facet.
+    with raises(ValueError, match="^search_vector facet is not a column of Project$"):
+
+        # pylint: disable-next=locally-disabled, unused-variable
+        class _SearchFacetResource(RestfulListBase[Project]):
+            facet_columns = ("search_vector",)
+
+    with raises(AssertionError):
+        Filter(Project.title, "like")  # type: ignore[arg-type]
+
+
+@configure_app_fixture(with_db=True)
+def test_registry_declared(app: Flask) -> None:
+    sql = _compile(
+        app,
+        "/projects?author_email_filter=gmail&title_filter=Title",
+        _ProjectListResource,
+    )
+
+    assert 'JOIN "user" AS user_1 ON user_1.id = project.author_id' in sql
+    assert "lower(user_1.email) LIKE lower('%gmail%')" in sql
+    # The `get_special_filters` take precedence.
+    assert "project.title = 'Title'" in sql
+
+    sql = _compile(app, "/projects?sort=author_email&order=asc", _ProjectListResource)
+
+    assert 'JOIN "user" AS user_1 ON user_1.id = project.author_id' in sql
+    assert sql.endswith("ORDER BY user_1.email ASC")
+
+    sql = _compile(app, "/projects?status_filter=draft,archived", ProjectListResource)
+
+    assert "project.status IN ('draft', 'archived')" in sql
+
+    with raises(ValueError, match="^unknown_filter filter is not supported$"):
+        _compile(app, "/projects?unknown_filter=1", ProjectListResource)
+
+    with raises(ValueError, match="^unknown sort is not supported$"):
+        _compile(app, "/projects?sort=unknown", ProjectListResource)
@@ -0,0 +1,117 @@
+from json import loads as json_loads
+from unittest.mock import MagicMock
+
+from flask import Flask
+from pytest import mark
+from sqlalchemy.dialects import postgresql
+
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.restful_list_base import _estimate_count
+
+from ..conftest import configure_app_fixture, query_budget
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="total01",
+        email="total.user@gmail.com",
+        name="Total User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+def _create_users(count: int) -> None:
+    for index in range(count):
+        User(email=f"user{index}@gmail.com", name=f"User {index}").save()
+
+
+@mark.parametrize(
+    ("query", "expected"),
+    (
+        ("", {"total": 5, "page": 1, "per_page": 2, "total_mode": "exact"}),
+        ("&total=estimate", {"total": 5, "page": 1, "per_page": 2, "total_mode": "exact"}),
+        (
+            "&total=none",
+            {"total": None, "page": 1, "per_page": 2, "has_next": True, "total_mode": "none"},
+        ),
+        (
+            "&total=none&page=3",
+            {"total": None, "page": 3, "per_page": 2, "has_next": False, "total_mode": "none"},
+        ),
+    ),
+)
+@configure_app_fixture(auth_user=_auth_user)
+def test_total_modes(app: Flask, query: str, expected: dict) -> None:
+    _create_users(4)
+
+    # The page and the `count(*)` (or the validators) unless the total is skipped.
+    with query_budget(1 if "total=none" in query else 2):
+        response = app.test_client().get(f"/users?per_page=2{query}")
+
+    data = json_loads(response.data)
+
+    assert response.status_code == 200
+    assert data["pager"] == expected
+    assert len(data["items"]) == (1 if "page=3" in query else 2)
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_total_modes_cursor(app: Flask) -> None:
+    _create_users(4)
+    response = app.test_client().get("/users?per_page=2&total=none&cursor=")
+    data = json_loads(response.data)
+
+    assert response.status_code == 200
+    assert data["pager"]["total"] is None
+    assert data["pager"]["total_mode"] == "none"
+    assert data["pager"]["next_cursor"] is not None
+
+
+@mark.parametrize("query", ("", "&total=estimate", "&total=none", "&cursor="))
+@configure_app_fixture(auth_user=_auth_user)
+def test_per_page_bounded(app: Flask, query: str) -> None:
+    response = app.test_client().get(f"/users?per_page=1000000{query}")
+
+    assert response.status_code == 200
+    assert json_loads(response.data)["pager"]["per_page"] == 100
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_total_mode_unknown(app: Flask) -> None:
+    response = app.test_client().get("/users?total=undefined")
+
+    assert response.status_code == 400
+    assert json_loads(response.data) == {"message": "undefined total is not supported"}
+
+
+@configure_app_fixture(with_db=True)
+def test_estimate_count(app: Flask) -> None:  # pylint: disable=unused-argument
+    connection = MagicMock(dialect=postgresql.psycopg2.dialect())  # type: ignore[no-untyped-call]
+    connection.execute.return_value.scalar.return_value = 5000
+    connection.exec_driver_sql.return_value.scalar.return_value = [{"Plan": {"Plan Rows": 42}}]
+
+    # The unfiltered list is estimated using the table statistics.
+    query = User.query
+    query.session = MagicMock(connection=MagicMock(return_value=connection))
+    assert _estimate_count(query) == 5000
+    assert connection.execute.call_args.args[1] == {"name": '"user"'}
+
+    # The filtered list is estimated by the planner.
+    query = User.query.filter(User.status == UserStatus.ACTIVE.value)
+    query.session = MagicMock(connection=MagicMock(return_value=connection))
+    assert _estimate_count(query) == 42
+    assert connection.exec_driver_sql.call_args.args[0].startswith("EXPLAIN (FORMAT JSON) SELECT")
+
+    # The `IN` lists are rendered.
+    query = User.query.filter(User.status.in_([UserStatus.ACTIVE.value, UserStatus.BLOCKED.value]))
+    query.session = MagicMock(connection=MagicMock(return_value=connection))
+    assert _estimate_count(query) == 42
+    assert "POSTCOMPILE" not in connection.exec_driver_sql.call_args.args[0]
+
+    # The statistics of the never analyzed table are unavailable.
+    connection.execute.return_value.scalar.return_value = -1
+    query = User.query
+    query.session = MagicMock(connection=MagicMock(return_value=connection))
+    assert _estimate_count(query) == 42
@@ -1,15 +1,18 @@
 from json import loads as json_loads
 from time import sleep
 from typing import Callable
+from unittest.mock import Mock
 
 from flask import Flask
 from flask_login import current_user
 from werkzeug.test import TestResponse  # type: ignore
 
+from api.database import db
+from api.models.project import Project, ProjectStatus
 from api.models.user import User, UserStatus
 from api.principal.role import Role
 
-from ..conftest import configure_app_fixture
+from ..conftest import capture_statements, configure_app_fixture, query_budget
 
 
 _PROJECT_KEYS = (
@@ -56,13 +59,17 @@ def _compare_response(
 @configure_app_fixture(auth_user=_auth_user)
 def test_crud(app: Flask) -> None:
     client = app.test_client()
-    response_create = client.post(
-        "/projects",
-        json={
-            "title": "Project 1",
-            "description": "This is a project 1.",
-        },
-    )
+
+    # The insert, the refresh after the commit and the author.
+    with query_budget(3):
+        response_create = client.post(
+            "/projects",
+            json={
+                "title": "Project 1",
+                "description": "This is a project 1.",
+            },
+        )
+
     data_create = json_loads(response_create.data)
 
     assert response_create.status_code == 201
@@ -78,11 +85,14 @@ def test_crud(app: Flask) -> None:
 
     # Wait a second to ensure the `updated_at` changes.
     sleep(1)
+
+    # The load, the update, the refresh after the commit and the author.
+    with query_budget(4):
+        response_transition = client.put(f"/projects/{data_create['id']}/transition/complete")
+
     data_transition = _compare_response(
         data_previous=data_create,
-        current=client.put(
-            f"/projects/{data_create['id']}/transition/complete",
-        ),
+        current=response_transition,
         expected_code=200,
         get_changes=lambda data: {
             "status": "completed",
@@ -101,14 +111,18 @@ def test_crud(app: Flask) -> None:
 
     # Wait a second to ensure the `updated_at` changes.
     sleep(1)
-    data_update = _compare_response(
-        data_previous=data_transition,
-        current=client.put(
+
+    with query_budget(4):
+        response_update = client.put(
             f"/projects/{data_create['id']}",
             json={
                 "description": "Changed description.",
             },
-        ),
+        )
+
+    data_update = _compare_response(
+        data_previous=data_transition,
+        current=response_update,
         expected_code=200,
         get_changes=lambda data: {
             "updated_at": data["updated_at"],
@@ -116,18 +130,62 @@ def test_crud(app: Flask) -> None:
         },
     )
 
+    with query_budget(1):
+        response_get = client.get(f"/projects/{data_create['id']}")
+
     _compare_response(
         data_previous=data_update,
-        current=client.get(
-            f"/projects/{data_create['id']}",
-        ),
+        current=response_get,
         expected_code=200,
         get_changes=lambda data: {},
     )
 
-    response_delete = client.delete(f"/projects/{data_create['id']}")
+    with query_budget(2):
+        response_delete = client.delete(f"/projects/{data_create['id']}")
+
     data_delete = json_loads(response_delete.data)
 
     assert response_delete.status_code == 200
     assert isinstance(data_delete, dict)
     assert data_delete == {"message": f'Entity has been deleted (PK: {data_create["id"]}).'}
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_bulk_transition(app: Flask) -> None:
+    draft = Project(title="Draft").save()
+    completed = Project(title="Completed", status=ProjectStatus.COMPLETED.value).save()
+    archived = Project(title="Archived", status=ProjectStatus.ARCHIVED.value).save()
+    client = app.test_client()
+    app.logger = Mock()  # type: ignore[misc]
+    ids = [completed.id, archived.id, 999, draft.id]
+
+    with capture_statements() as statements:
+        response = client.put("/projects/transition/archive", json={"ids": ids})
+
+    assert response.status_code == 200, response.data
+    assert json_loads(response.data) == {
+        "transitioned": [completed.id, draft.id],
+        "skipped": [archived.id, 999],
+    }
+    # The candidates with their original statuses and the single `UPDATE`.
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE"], statements
+    # The `after` callbacks of the transition.
+    assert sorted(call.args[0] for call in app.logger.info.call_args_list) == [
+        f'Project "Completed"[{completed.id}] status has changed from completed to archived'
+        f" by {current_user.email}",
+        f'Project "Draft"[{draft.id}] status has changed from draft to archived'
+        f" by {current_user.email}",
+    ]
+
+    for project in (draft, completed):
+        db.session.refresh(project)
+
+        assert project.status == ProjectStatus.ARCHIVED.value
+
+    for url, data in (
+        ("/projects/transition/unknown", {"ids": [draft.id]}),
+        ("/projects/transition/restore", {"ids": []}),
+        ("/projects/transition/restore", {"ids": ["1"]}),
+        ("/projects/transition/restore", [draft.id]),
+    ):
+        assert client.put(url, json=data).status_code == 400
@@ -42,7 +42,7 @@ class TestProjectsList(TestCaseListBase[Project]):
                 }
                 for item in self.response_list_items
             ],
-            "pager": {"total": 1, "page": 1, "per_page": 10},
+            "pager": {"total": 1, "page": 1, "per_page": 10, "total_mode": "exact"},
             "sort": [{"id": "created_at", "desc": True}],
             "filters": {
                 "status_filter": f"{ProjectStatus.DRAFT.value},{ProjectStatus.COMPLETED.value}",
@@ -55,10 +55,20 @@ class TestProjectsList(TestCaseListBase[Project]):
         with self.patched_context() as (http_client, mock_query):
             # Mock for the chain: Project.query.filter().order_by().paginate().
             mock_query.filter().order_by().paginate.return_value = self.mock_paginate
+            select_validators = self.mock_validators(mock_query.filter())
             response = http_client.get("/projects")
 
             self.assertEqual(response.status_code, 200)
             self.assertEqual(json.loads(response.data), self.expected_data)
+            self.assertIn("ETag", response.headers)
+            # The total is the aggregated number of the validators, so it isn't counted again.
+            select_validators.assert_called_once_with()
+            mock_query.filter().order_by().paginate.assert_called_once_with(
+                page=1,
+                per_page=10,
+                error_out=False,
+                count=False,
+            )
 
             self.assert_sql_mock_called_with(
                 mock_query.filter,
@@ -73,6 +83,8 @@ class TestProjectsList(TestCaseListBase[Project]):
         with self.patched_context() as (http_client, mock_query):
             # Mock for the chain: Project.query.filter().order_by().paginate().
             mock_query.filter().join().order_by().paginate.return_value = self.mock_paginate
+            # The author is joined for the ordering only, so the aggregate is made without it.
+            select_validators = self.mock_validators(mock_query.filter())
             response = http_client.get("/projects?sort=author_name&order=asc")
 
             self.assertEqual(response.status_code, 200)
@@ -89,10 +101,22 @@ class TestProjectsList(TestCaseListBase[Project]):
             self.assert_sql_mock_called_with(
                 mock_query.filter().join().order_by, aliased(User).name.asc()
             )
+            self.assertIn(
+                {"isouter": True},
+                [call.kwargs for call in mock_query.filter().join.call_args_list],
+            )
+            mock_query.filter().join().order_by().paginate.assert_called_once_with(
+                page=1,
+                per_page=10,
+                error_out=False,
+                count=False,
+            )
+            select_validators.assert_called_once_with()
 
     def test_projects_filters(self) -> None:
         with self.patched_context() as (http_client, mock_query):
             mock_query.filter().filter().order_by().paginate.return_value = self.mock_paginate
+            select_validators = self.mock_validators(mock_query.filter().filter())
 
             response = http_client.get("/projects?title_filter=test&status_filter=completed")
             self.assertEqual(response.status_code, 200)
@@ -114,3 +138,4 @@ class TestProjectsList(TestCaseListBase[Project]):
             self.assert_sql_mock_called_with(
                 mock_query.filter().filter, Project.title.ilike("%test%")
             )
+            select_validators.assert_called_once_with()
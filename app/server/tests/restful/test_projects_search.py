@@ -0,0 +1,103 @@
+from json import loads as json_loads
+
+from flask import Flask
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.restful.projects import ProjectListResource
+
+from ..conftest import configure_app_fixture
+
+
+_DIALECT = postgresql.psycopg2.dialect()  # type: ignore[no-untyped-call]
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="search01",
+        email="search.user@gmail.com",
+        name="Search User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_search(app: Flask) -> None:
+    for title, description, status in (
+        ("Database tuning", "Indexes", ProjectStatus.DRAFT.value),
+        ("Cooking", "Pasta with DATABASE", ProjectStatus.COMPLETED.value),
+        ("Gardening", None, ProjectStatus.DRAFT.value),
+        ("Old database", None, ProjectStatus.ARCHIVED.value),
+    ):
+        Project(title=title, description=description, status=status).save()
+
+    client = app.test_client()
+
+    def get_titles(query: str) -> tuple[list[str], dict]:
+        response = client.get(f"/projects?{query}")
+        assert response.status_code == 200
+        data = json_loads(response.data)
+        return [item["title"] for item in data["items"]], data
+
+    # Ordered by relevance (equal on SQLite) by default.
+    titles, data = get_titles("q=database")
+    assert sorted(titles) == ["Cooking", "Database tuning"]
+    assert data["sort"] == [{"id": "rank", "desc": True}]
+    assert data["pager"]["total"] == 2
+
+    # Combined with the filters and sorting.
+    assert get_titles("q=database&status_filter=draft")[0] == ["Database tuning"]
+    assert get_titles("q=database&sort=title&order=desc")[0] == ["Database tuning", "Cooking"]
+
+    # Paginated by the cursor over the rank.
+    first, data = get_titles("q=database&per_page=1&cursor=")
+    second, _ = get_titles(f"q=database&per_page=1&cursor={data['pager']['next_cursor']}")
+    assert sorted(first + second) == ["Cooking", "Database tuning"]
+
+    # The blank query doesn't filter.
+    assert len(get_titles("q=%20")[0]) == 3
+
+    # The rank sort requires the query.
+    response = client.get("/projects?sort=rank")
+    assert response.status_code == 400
+    assert json_loads(response.data) == {"message": "rank sort is not supported"}
+
+    # The document is searched by the `q` only.
+    for query, message in (
+        ("search_vector_filter=database", "search_vector_filter filter is not supported"),
+        ("sort=search_vector", "search_vector sort is not supported"),
+    ):
+        response = client.get(f"/projects?{query}")
+        assert response.status_code == 400
+        assert json_loads(response.data) == {"message": message}
+
+
+@configure_app_fixture(with_db=True)
+def test_search_sql(app: Flask) -> None:
+    with app.test_request_context("/projects?q=database"):
+        resource = ProjectListResource()
+        resource.apply_filters()
+        resource.apply_sorting()
+        sql = str(resource.query.statement.compile(dialect=_DIALECT))
+
+    # The indexed column is matched as is and the list is ordered by relevance.
+    assert "project.search_vector @@ websearch_to_tsquery('english', %(param_1)s)" in sql
+    assert (
+        "ORDER BY CAST(ts_rank(project.search_vector, websearch_to_tsquery('english', %(param_2)s))"
+        " AS DOUBLE PRECISION) DESC"
+    ) in sql
+    # The document is never loaded.
+    assert "project.search_vector AS" not in sql
+
+    table = Project.__table__  # type: ignore[attr-defined]
+    ddl = str(CreateTable(table).compile(dialect=_DIALECT))
+
+    assert (
+        "search_vector TSVECTOR GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    ) in ddl
@@ -3,11 +3,13 @@ from json import loads as json_loads
 from flask import Flask
 from flask_login import current_user
 
+from api.database import db
+from api.models.project import Project
 from api.models.user import User, UserStatus
 from api.principal.role import Role
 from api.restful.users import UserResource
 
-from ..conftest import configure_app_fixture
+from ..conftest import configure_app_fixture, query_budget
 
 
 def _get_user_scientist() -> User:
@@ -33,7 +35,10 @@ def _get_user_admin() -> User:
 @configure_app_fixture(auth_user=_get_user_admin)
 def test_add_user(app: Flask) -> None:
     scientist_data = _get_user_scientist().to_json()
-    response = app.test_client().post("/users", json=scientist_data)
+
+    with query_budget(2):
+        response = app.test_client().post("/users", json=scientist_data)
+
     actual_data = json_loads(response.data)
 
     assert response.status_code == 201
@@ -50,7 +55,9 @@ def test_add_user(app: Flask) -> None:
 @configure_app_fixture(auth_user=_get_user_admin)
 def test_get_user(app: Flask) -> None:
     scientist = _get_user_scientist().save()
-    response = app.test_client().get(f"/users/{scientist.id}")
+
+    with query_budget(1):
+        response = app.test_client().get(f"/users/{scientist.id}")
 
     assert response.status_code == 200
     assert json_loads(response.data) == scientist.to_json()
@@ -59,12 +66,15 @@ def test_get_user(app: Flask) -> None:
 @configure_app_fixture(auth_user=_get_user_admin)
 def test_edit_user(app: Flask) -> None:
     scientist = _get_user_scientist().save()
-    response = app.test_client().put(
-        f"/users/{scientist.id}",
-        json={
-            "role": Role.AUTHENTICATED.value,
-        },
-    )
+
+    with query_budget(3):
+        response = app.test_client().put(
+            f"/users/{scientist.id}",
+            json={
+                "role": Role.AUTHENTICATED.value,
+            },
+        )
+
     actual_data = json_loads(response.data)
 
     assert response.status_code == 200
@@ -80,14 +90,22 @@ def test_edit_user(app: Flask) -> None:
 @configure_app_fixture(auth_user=_get_user_admin)
 def test_delete_user(app: Flask) -> None:
     scientist = _get_user_scientist().save()
-    delete_response = app.test_client().delete(f"/users/{scientist.id}")
+    Project(title="Authored", author_id=scientist.id).save()
+    url = f"/users/{scientist.id}"
+    # Start from the empty identity map as the fresh request does.
+    db.session.expunge_all()
+
+    # The ORM nullifies the `author_id` of every authored project (a single one here).
+    with query_budget(4):
+        delete_response = app.test_client().delete(url)
 
     assert delete_response.status_code == 200
 
 
 @configure_app_fixture(auth_user=_get_user_scientist)
 def test_current_user(app: Flask) -> None:
-    response = app.test_client().get("/users/current")
+    with query_budget(0):
+        response = app.test_client().get("/users/current")
 
     assert response.status_code == 200
     assert json_loads(response.data) == current_user.to_json()
@@ -39,7 +39,7 @@ class TestUsersList(TestCaseListBase[User]):
                 }
                 for item in self.response_list_items
             ],
-            "pager": {"total": 1, "page": 1, "per_page": 10},
+            "pager": {"total": 1, "page": 1, "per_page": 10, "total_mode": "exact"},
             "sort": [{"id": "name", "desc": False}],
             "filters": {"status_filter": UserStatus.ACTIVE.value},
         }
@@ -49,10 +49,13 @@ class TestUsersList(TestCaseListBase[User]):
     def test_users_default(self) -> None:
         with self.patched_context() as (http_client, mock_query):
             mock_query.filter().order_by().paginate.return_value = self.mock_paginate
+            select_validators = self.mock_validators(mock_query.filter())
             response = http_client.get("/users")
 
             self.assertEqual(response.status_code, 200)
             self.assertEqual(json.loads(response.data), self.expected_data)
+            self.assertIn("ETag", response.headers)
+            select_validators.assert_called_once_with()
             self.assert_sql_mock_called_with(
                 mock_query.filter,
                 User.status == UserStatus.ACTIVE.value,  # type: ignore[arg-type]
@@ -65,7 +68,9 @@ class TestUsersList(TestCaseListBase[User]):
     def test_users_sorting(self) -> None:
         with self.patched_context() as (http_client, mock_query):
             mock_query.filter().order_by().paginate.return_value = self.mock_paginate
+            select_validators = self.mock_validators(mock_query.filter())
             response = http_client.get("/users?sort=email&order=desc")
+            select_validators.assert_called_once_with()
             self.assertEqual(response.status_code, 200)
             self.assertEqual(
                 json.loads(response.data),
@@ -84,8 +89,10 @@ class TestUsersList(TestCaseListBase[User]):
     def test_users_filters(self) -> None:
         with self.patched_context() as (http_client, mock_query):
             mock_query.filter().filter().order_by().paginate.return_value = self.mock_paginate
+            select_validators = self.mock_validators(mock_query.filter().filter())
 
             response = http_client.get("/users?role_filter=2")
+            select_validators.assert_called_once_with()
 
             self.assertEqual(response.status_code, 200)
 
@@ -110,18 +117,18 @@ class TestUsersList(TestCaseListBase[User]):
         with self.logged_in_context(self.logged_in_user) as http_client:
             # 1) Test unknown sort param.
             response = http_client.get("/users?sort=undefined")
-            self.assertEqual(response.status_code, 500)
+            self.assertEqual(response.status_code, 400)
             expected_response = {"message": "undefined sort is not supported"}
             self.assertEqual(json.loads(response.data), expected_response)
 
             # 2) Test unknown order param.
             response = http_client.get("/users?order=undefined")
-            self.assertEqual(response.status_code, 500)
+            self.assertEqual(response.status_code, 400)
             expected_response = {"message": "undefined sort order is not supported"}
             self.assertEqual(json.loads(response.data), expected_response)
 
             # 3) Test unknown filter param.
             response = http_client.get("/users?undefined_filter=undefined")
-            self.assertEqual(response.status_code, 500)
+            self.assertEqual(response.status_code, 400)
             expected_response = {"message": "undefined_filter filter is not supported"}
             self.assertEqual(json.loads(response.data), expected_response)
@@ -0,0 +1,191 @@
+from datetime import date, datetime
+from decimal import Decimal
+from json import dumps as json_dumps
+from types import SimpleNamespace
+from typing import Any
+
+from flask import Flask
+from marshmallow import fields, post_dump
+from pytest import mark
+
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.schema import DictDefaults, Schema, compile_dump
+
+from ..conftest import configure_app_fixture
+
+
+class _NestedSchema(Schema):
+    """
+    Noop.
+    """
+
+    id = fields.Int()
+    name = fields.Str()
+    secret = fields.Str(load_only=True)
+
+
+class _FieldsSchema(Schema):
+    """
+    Noop.
+    """
+
+    text = fields.Str()
+    email = fields.Email()
+    number = fields.Int()
+    number_string = fields.Int(as_string=True)
+    ratio = fields.Float()
+    amount = fields.Decimal(places=2)
+    flag = fields.Boolean()
+    created = fields.DateTime()
+    created_rfc = fields.DateTime(format="rfc", attribute="created", dump_only=True)
+    created_timestamp = fields.DateTime(format="timestamp", attribute="created", dump_only=True)
+    created_custom = fields.DateTime(format="%Y/%m/%d", attribute="created", dump_only=True)
+    day = fields.Date()
+    tags = fields.List(fields.Str())
+    children = fields.List(fields.Nested(_NestedSchema(only=("name",))))
+    parent = fields.Nested(_NestedSchema)
+    siblings = fields.Nested(_NestedSchema, many=True, exclude=("id",))
+    renamed = fields.Str(data_key="renamedKey")
+    aliased = fields.Str(attribute="text", dump_only=True)
+    dotted = fields.Str(attribute="parent.name", dump_only=True)
+    defaulted = fields.Str(dump_default="default")
+    defaulted_callable = fields.Int(dump_default=lambda: 7)
+    absent = fields.Str()
+    method = fields.Method("get_method")
+    function = fields.Function(lambda obj: obj.number * 2)
+    data = DictDefaults({"title": "Default"})
+    password = fields.Str(load_only=True)
+
+    @staticmethod
+    def get_method(obj: Any) -> str:
+        return f"method {obj.text}"
+
+
+def _object(**kwargs: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        text="Text",
+        email="user@gmail.com",
+        number=5,
+        number_string=6,
+        ratio=0.5,
+        amount=Decimal("1.234"),
+        flag=1,
+        created=datetime(2024, 1, 2, 3, 4, 5),
+        day=date(2024, 1, 2),
+        tags=["a", "b"],
+        children=[SimpleNamespace(id=1, name="Child")],
+        parent=SimpleNamespace(id=2, name="Parent", secret="x"),
+        siblings=[SimpleNamespace(id=3, name="Sibling")],
+        renamed="Renamed",
+        data={"other": 1},
+        password="secret",
+        **kwargs,
+    )
+
+
+def _assert_identical(dumped: Any, compiled: Any) -> None:
+    # The same keys in the same order with the values of the same types.
+    assert json_dumps(compiled, default=repr) == json_dumps(dumped, default=repr)
+    assert repr(compiled) == repr(dumped)
+
+
+@mark.parametrize(
+    ("obj",),
+    (
+        (_object(),),
+        (_object(defaulted="Set", defaulted_callable=None, absent="Present"),),
+        (
+            SimpleNamespace(
+                **{
+                    **vars(_object()),
+                    "text": None,
+                    "number": 0,
+                    "ratio": None,
+                    "created": None,
+                    "day": None,
+                    "tags": None,
+                    "parent": None,
+                    "siblings": [],
+                    "data": None,
+                },
+            ),
+        ),
+    ),
+)
+def test_fields_parity(obj: SimpleNamespace) -> None:
+    for schema in (
+        _FieldsSchema(),
+        _FieldsSchema(only=("text", "parent", "siblings")),
+        _FieldsSchema(exclude=("method", "function")),
+    ):
+        _assert_identical(schema.dump(obj), compile_dump(schema)(obj))
+
+
+def test_fallbacks() -> None:
+    class _ProcessedSchema(_NestedSchema):
+        """
+        Noop.
+        """
+
+        @post_dump
+        def upper(self, data: dict, **_: Any) -> dict:
+            data["name"] = data["name"].upper()
+            return data
+
+    schema = _ProcessedSchema()
+    obj = SimpleNamespace(id=1, name="Name")
+
+    # The schemas with processors are dumped as usual.
+    assert compile_dump(schema) == schema.dump  # pylint: disable=comparison-with-callable
+    assert compile_dump(schema)(obj) == {"id": 1, "name": "NAME"}
+
+    # As well as the dict-like objects.
+    data = {"id": 1, "name": "Name", "secret": "x"}
+
+    _assert_identical(_NestedSchema().dump(data), compile_dump(_NestedSchema())(data))
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="compiled01",
+        email="compiled.user@gmail.com",
+        name="Compiled User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_entity_parity(app: Flask) -> None:
+    projects = [
+        Project(title="First", description="Described").save(),
+        Project(title="Second", status=ProjectStatus.COMPLETED.value).save(),
+    ]
+    projects[1].author_id = None  # type: ignore[assignment]
+    projects[1].save()
+    users = User.query.all()
+
+    for model, entities, fieldsets in (
+        (Project, projects, (None, ("id", "author"), ("id", "status", "updated_at"))),
+        (User, users, (None, ("id", "email"), ("id", "role", "updated_at"))),
+    ):
+        for list_item in (False, True):
+            for only in fieldsets:
+                schema = model.schema.get(list_item=list_item, only=only)
+                dumped = schema.dump(entities, many=True)
+
+                _assert_identical(
+                    dumped,
+                    model.schema.serialize_many(entities, list_item=list_item, only=only),
+                )
+                _assert_identical(
+                    dumped[0],
+                    entities[0].to_json(list_item=list_item, only=only),
+                )
+
+    with app.test_request_context():
+        assert app.json.dumps(projects[0].to_json()) == app.json.dumps(
+            Project.schema.item.dump(projects[0]),
+        )
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+from json import loads as json_loads
+from uuid import UUID
+
+from flask import Flask
+from pytest import mark, raises
+
+from api.models.project import Project, ProjectStatus
+from api.models.user import User, UserStatus
+from api.principal.role import Role
+from api.utils.json_encoder import dumps, dumps_stdlib
+
+from ..conftest import configure_app_fixture
+
+
+_DATA = {
+    "created_at": datetime(2024, 1, 2, 3, 4, 5, 6),
+    "updated_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "day": date(2024, 1, 2),
+    "status": ProjectStatus.ARCHIVED,
+    "user_status": UserStatus.BLOCKED,
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "title": "Ünïcode",
+    "items": (1, 2.5, None, True),
+    1: "The key that isn't a string.",
+}
+
+
+@mark.parametrize("encode", (dumps, dumps_stdlib))
+def test_dumps(encode: object) -> None:
+    assert callable(encode)
+    assert json_loads(encode(_DATA)) == {
+        "created_at": "2024-01-02T03:04:05.000006",
+        "updated_at": "2024-01-02T03:04:05+00:00",
+        "day": "2024-01-02",
+        "status": "archived",
+        "user_status": UserStatus.BLOCKED.value,
+        "uuid": "12345678-1234-5678-1234-567812345678",
+        "title": "Ünïcode",
+        "items": [1, 2.5, None, True],
+        "1": "The key that isn't a string.",
+    }
+    # The compact UTF-8.
+    assert encode({"title": "Ü", "id": 1}) == '{"title":"Ü","id":1}'.encode()
+    assert encode({"id": 1}, indent=True) == b'{\n  "id": 1\n}'
+
+    with raises(TypeError):
+        encode({"value": object()})
+
+
+def _auth_user() -> User:
+    return User(
+        ntid="encoder01",
+        email="encoder.user@gmail.com",
+        name="Encoder User",
+        role=Role.ADMIN.value,
+        status=UserStatus.ACTIVE.value,
+    )
+
+
+@configure_app_fixture(auth_user=_auth_user)
+def test_output_json(app: Flask) -> None:
+    project = Project(title="Ünïcode").save()
+    response = app.test_client().get(f"/projects/{project.id}")
+
+    assert response.status_code == 200
+    assert response.content_type == "application/json"
+    assert response.headers["ETag"]
+    assert response.data.endswith(b"}\n")
+    assert "Ünïcode".encode() in response.data
+    assert json_loads(response.data)["title"] == "Ünïcode"